@@ -0,0 +1,50 @@
+"""
+Peak memory and time of expand_options() on templates with many
+expansions: the eager list, the lazy iterator, and the eager expansion it
+replaced (kept in the test suite for the equivalence test).
+
+    PYTHONPATH=. python benchmarks/bench_expand_options.py
+"""
+import tracemalloc
+from collections import deque
+from timeit import default_timer
+
+from lingua_franca.format import count_expansions, expand_options
+from test.test_format import _legacy_expand_options
+
+TEMPLATES = [
+    "(what's|what is) the (weather|forecast) (like|) (today|tomorrow|"
+    "tonight|this (morning|afternoon|evening)|) (in|at|near) "
+    "(london|paris|berlin|madrid|rome|lisbon|vienna|prague) (please|)",
+    "(set|start|create) (a|an|the|) (alarm|timer|reminder) (for|at|in) "
+    "(one|two|three|four|five|six|seven|eight|nine|ten) "
+    "(minutes|hours|seconds) (and|) (one|two|three|four|five) "
+    "(minutes|seconds|) (from now|later|) (please|)",
+]
+
+
+def measure(function):
+    tracemalloc.start()
+    start = default_timer()
+    function()
+    elapsed = default_timer() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+def main():
+    for template in TEMPLATES:
+        print("{:,} expansions".format(count_expansions(template)))
+        for label, function in (
+                ("legacy", lambda: _legacy_expand_options(template)),
+                ("eager", lambda: expand_options(template)),
+                ("lazy", lambda: deque(expand_options(template, lazy=True),
+                                       maxlen=0))):
+            elapsed, peak = measure(function)
+            print("  {:7}: {:6.2f} s, peak {:8.1f} MiB".format(
+                label, elapsed, peak))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare extract_datetimes() with the cost of calling extract_datetime() on
+the remainder of a long document once per date, which is what callers had to
+do before.
+
+    PYTHONPATH=. python benchmarks/bench_extract_datetimes.py [paragraphs]
+"""
+import sys
+from datetime import datetime
+from timeit import default_timer
+
+from lingua_franca import load_language
+from lingua_franca.parse import extract_datetime, extract_datetimes
+
+PARAGRAPH = ("Thanks for the update. The review moved to next tuesday at "
+             "3pm, and the retro is on the 5th of july. Could you send the "
+             "slides by tomorrow morning? I am out of office in 2 weeks, "
+             "back on monday the 17th. The vendor call is at 10:30 on "
+             "friday. ")
+
+
+def timed(func, *args):
+    start = default_timer()
+    result = func(*args)
+    return default_timer() - start, result
+
+
+def main(paragraphs=50):
+    load_language("en")
+    anchor = datetime(2017, 6, 27, 13, 4)
+    text = PARAGRAPH * paragraphs
+    print("document: {} words".format(len(text.split())))
+    call_time, _ = timed(extract_datetime, text, anchor)
+    spans_time, spans_found = timed(extract_datetimes, text, anchor)
+    print("extract_datetime, one call:      {:8.3f}s".format(call_time))
+    print("extract_datetime, one per date: ~{:8.3f}s".format(
+        call_time * len(spans_found)))
+    print("extract_datetimes:               {:8.3f}s  {} dates".format(
+        spans_time, len(spans_found)))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
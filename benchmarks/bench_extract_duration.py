@@ -0,0 +1,73 @@
+"""
+Per-call cost of extract_duration() in the languages built on
+DurationExtractor, on generated phrases of a few durations each. When it
+was added, on similar phrases, it took 314 us (en), 7.2 us (de), 490 us
+(ru) and 309 us (cs) per call, against 348, 35, 509 and 390 us for the
+per-unit substitution loops it replaced; en/ru/cs time is mostly the
+number-word conversion which runs first.
+
+    PYTHONPATH=. python benchmarks/bench_extract_duration.py
+"""
+import random
+from timeit import timeit
+
+from lingua_franca.lang.parse_cs import extract_duration_cs
+from lingua_franca.lang.parse_de import extract_duration_de
+from lingua_franca.lang.parse_en import extract_duration_en
+from lingua_franca.lang.parse_ru import extract_duration_ru
+
+# (lang, function, units, words, number words)
+CASES = [
+    ("en", extract_duration_en,
+     ['microseconds', 'milliseconds', 'second', 'minutes', 'hour', 'days',
+      'week'],
+     ['set', 'a', 'timer', 'for', 'and', 'second-hand', 'days'],
+     ['seven', 'twenty two', 'one hundred']),
+    ("de", extract_duration_de,
+     ['mikrosekunden', 'millisekunden', 'sekunde', 'minuten', 'stunde',
+      'Tage', 'woche'],
+     ['starte', 'timer', 'für', 'und', 'sekundenlang', 'Stunden'],
+     []),
+    ("ru", extract_duration_ru,
+     ['микросекунд', 'милисекунд', 'секунда', 'минут', 'часа', 'дней',
+      'недели'],
+     ['установи', 'таймер', 'на', 'и', 'часовой', 'минуты'],
+     ['семь', 'двадцать два', 'сто']),
+    ("cs", extract_duration_cs,
+     ['mikrosekund', 'milisekund', 'sekundy', 'minut', 'hodin', 'dní',
+      'týdny'],
+     ['nastav', 'časovač', 'na', 'a', 'hodinky', 'minuty'],
+     ['sedm', 'dvacet dva', 'sto']),
+]
+
+
+def phrases(units, words, number_words, count=3000):
+    rng = random.Random(0)
+    for _ in range(count):
+        parts = []
+        for _ in range(rng.randint(1, 6)):
+            if rng.random() < 0.4:
+                parts.append(rng.choice(words))
+                continue
+            number = rng.choice([str(rng.randint(0, 120)),
+                                 "%.1f" % rng.uniform(0, 10)] +
+                                number_words)
+            parts.append(number + rng.choice([" ", "-"]) + rng.choice(units))
+        yield rng.choice([" ", ", "]).join(parts)
+
+
+def per_call(function, texts, repeat=3):
+    def run():
+        for text in texts:
+            function(text)
+    return timeit(run, number=repeat) / (repeat * len(texts)) * 1e6
+
+
+def main():
+    for lang, function, units, words, number_words in CASES:
+        texts = list(phrases(units, words, number_words))
+        print("{}: {:6.1f} us/call".format(lang, per_call(function, texts)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Memory traced by tracemalloc, and time, for finding all the numbers of a
+text in English, Dutch, Russian, Polish and Czech.
+
+"allocated" adds up every rise of the traced memory between two Python
+calls or returns, so it counts the short lived copies the parsers make,
+which the peak does not show. Run it on an older tree to compare.
+
+    PYTHONPATH=. python benchmarks/bench_extract_numbers.py
+"""
+import sys
+import tracemalloc
+from timeit import timeit
+
+from lingua_franca.lang.parse_common import tokenize
+from lingua_franca.lang.parse_cs import _extract_numbers_with_text_cs
+from lingua_franca.lang.parse_en import _extract_numbers_with_text_en
+from lingua_franca.lang.parse_nl import _extract_numbers_with_text_nl
+from lingua_franca.lang.parse_pl import _extract_numbers_with_text_pl
+from lingua_franca.lang.parse_ru import _extract_numbers_with_text_ru
+
+CASES = [
+    ("en", _extract_numbers_with_text_en,
+     "I have twenty two apples and three hundred and five oranges, "
+     "one half of a pie and 7 bananas"),
+    ("nl", _extract_numbers_with_text_nl,
+     "ik heb tweeëntwintig appels en driehonderdvijf sinaasappels, "
+     "een half taart en 7 bananen"),
+    ("ru", _extract_numbers_with_text_ru,
+     "у меня двадцать два яблока и триста пять апельсинов, "
+     "половина пирога и 7 бананов"),
+    ("pl", _extract_numbers_with_text_pl,
+     "mam dwadzieścia dwa jabłka i trzysta pięć pomarańczy, "
+     "pół ciasta i 7 bananów"),
+    ("cs", _extract_numbers_with_text_cs,
+     "mám dvacet dva jablek a tři sta pět pomerančů, "
+     "polovina koláče a 7 banánů"),
+]
+
+
+def traced_kib(function, text):
+    """ (allocated, peak) KiB of one call """
+    tokens = tokenize(text)
+    function(list(tokens))
+    allocated = 0
+    last = 0
+
+    def profile(frame, event, arg):
+        nonlocal allocated, last
+        current = tracemalloc.get_traced_memory()[0]
+        allocated += max(0, current - last)
+        last = current
+
+    tracemalloc.start()
+    last = tracemalloc.get_traced_memory()[0]
+    sys.setprofile(profile)
+    function(tokens)
+    sys.setprofile(None)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return allocated / 1024, peak / 1024
+
+
+def per_call(function, text, repeat=3):
+    return timeit(lambda: function(tokenize(text)), number=repeat) / \
+        repeat * 1e3
+
+
+def main():
+    for lang, function, sentence in CASES:
+        for repeats in (1, 10):
+            text = " ".join([sentence] * repeats)
+            print("{} {:3} words: allocated {:8.1f} KiB, peak {:5.1f} KiB, "
+                  "{:6.2f} ms/call".format(
+                      lang, len(text.split()), *traced_kib(function, text),
+                      per_call(function, text)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Recall and latency of FuzzyIndex.match_one() against brute force
+match_one() on a synthetic catalog of skill/entity names.
+
+    PYTHONPATH=. \
+        python benchmarks/bench_fuzzy_index.py [catalog size] [queries]
+"""
+import random
+import sys
+from timeit import default_timer
+
+from lingua_franca.parse import FuzzyIndex, match_one
+
+SYLLABLES = ["ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "zen", "ber",
+             "dor", "fal", "gri", "hen", "jo", "qua", "wex", "yul"]
+
+
+def make_name(rng):
+    return " ".join("".join(rng.choice(SYLLABLES)
+                            for _ in range(rng.randint(2, 4)))
+                    for _ in range(rng.randint(1, 3)))
+
+
+def misspell(rng, name):
+    chars = list(name)
+    for _ in range(rng.randint(1, 2)):
+        position = rng.randrange(len(chars))
+        if rng.random() < 0.5:
+            del chars[position]
+        else:
+            chars.insert(position, rng.choice("aeiounrst"))
+    return "".join(chars)
+
+
+def main(size=50000, queries=50):
+    rng = random.Random(1)
+    choices = list(dict.fromkeys(make_name(rng) for _ in range(size)))
+    tests = [misspell(rng, rng.choice(choices)) for _ in range(queries)]
+
+    start = default_timer()
+    index = FuzzyIndex(choices)
+    build = default_timer() - start
+
+    hits = 0
+    brute_time = index_time = 0.0
+    for query in tests:
+        start = default_timer()
+        expected = match_one(query, choices)
+        brute_time += default_timer() - start
+        start = default_timer()
+        found = index.match_one(query)
+        index_time += default_timer() - start
+        hits += found[1] == expected[1]
+
+    print("catalog: {} choices, index built in {:.2f}s".format(
+        len(choices), build))
+    print("match_one:            {:8.2f} ms/query".format(
+        brute_time / queries * 1000))
+    print("FuzzyIndex.match_one: {:8.2f} ms/query".format(
+        index_time / queries * 1000))
+    print("recall@1: {:.1%}".format(hits / queries))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
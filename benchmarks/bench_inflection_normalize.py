@@ -0,0 +1,62 @@
+"""
+Per-token cost of the Russian and Czech inflection normalizers, over every
+word of their common_data modules and inflection tables. Run it on an
+older tree to compare with the list-based implementations they replaced.
+
+    PYTHONPATH=. python benchmarks/bench_inflection_normalize.py
+"""
+from timeit import timeit
+
+from lingua_franca.lang import common_data_cs, common_data_ru
+from lingua_franca.lang.parse_cs import _INFLECTIONS_CS, \
+    _text_cs_inflection_normalize
+from lingua_franca.lang.parse_ru import _INFLECTIONS_RU, \
+    _text_ru_inflection_normalize
+
+
+def common_data_words(module):
+    """ Every word in a common_data module's tables """
+    words = set()
+
+    def collect(value):
+        if isinstance(value, str):
+            words.add(value)
+            words.update(value.split())
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                collect(key)
+                collect(item)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            for item in value:
+                collect(item)
+
+    for name, value in vars(module).items():
+        if not name.startswith("__"):
+            collect(value)
+    return words
+
+
+def per_token(normalize, words, repeat=20):
+    def run():
+        for word in words:
+            normalize(word, 1)
+            normalize(word, 2)
+    seconds = timeit(run, number=repeat)
+    return seconds / (repeat * 2 * len(words)) * 1e9
+
+
+def main():
+    for lang, common_data, inflections, normalize in (
+            ("ru", common_data_ru, _INFLECTIONS_RU,
+             _text_ru_inflection_normalize),
+            ("cs", common_data_cs, _INFLECTIONS_CS,
+             _text_cs_inflection_normalize)):
+        words = sorted(common_data_words(common_data) |
+                       {form for _, form in inflections} |
+                       set(inflections.values()))
+        print("{}: {} words, {:7.1f} ns/token".format(
+            lang, len(words), per_token(normalize, words)))
+
+
+if __name__ == "__main__":
+    main()
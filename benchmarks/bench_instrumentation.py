@@ -0,0 +1,38 @@
+"""
+Overhead of the localized function instrumentation
+(`lingua_franca.config.instrument_functions`): the cost of a cheap
+localized call with it off, on, and on with a hook, compared with calling
+the localized function directly.
+
+    PYTHONPATH=. python benchmarks/bench_instrumentation.py
+"""
+from timeit import repeat
+
+import lingua_franca
+from lingua_franca import config
+from lingua_franca.format import nice_number
+from lingua_franca.lang.format_en import nice_number_en
+
+
+def per_call(function, number=20000):
+    return min(repeat(function, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    lingua_franca.load_language("en")
+    direct = per_call(lambda: nice_number_en(5.5))
+    print("direct nice_number_en:  {:6.2f} us/call".format(direct))
+    for label, enabled, hook in (("instrumentation off", False, None),
+                                 ("instrumentation on", True, None),
+                                 ("on, with a hook", True,
+                                  lambda *args: None)):
+        config.instrument_functions = enabled
+        config.instrumentation_hook = hook
+        print("{:22}  {:6.2f} us/call".format(
+            label + ":", per_call(lambda: nice_number(5.5))))
+    config.instrument_functions = False
+    config.instrumentation_hook = None
+
+
+if __name__ == "__main__":
+    main()
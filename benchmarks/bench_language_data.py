@@ -0,0 +1,69 @@
+"""
+Memory held by each language once its parsers and formatters are loaded,
+and by all the languages loaded together. Making the number and ordinal
+tables read-only and sharing the equal ones between languages was tried:
+it saved 16 KiB for Russian and 12 KiB for all 16 languages, with no
+change in resident set size, so it was not kept.
+
+Each figure comes from a fresh interpreter: the memory traced by
+tracemalloc since start-up, and, from another interpreter which does not
+trace (tracemalloc inflates it), the resident set size where
+/proc/self/statm can be read. Run it on an older tree to compare.
+
+    python benchmarks/bench_language_data.py
+"""
+import gc
+import os
+import subprocess
+import sys
+import tracemalloc
+
+LANGS = ("ca", "cs", "da", "de", "en", "es", "fa", "fr", "hu", "it", "nl",
+         "pl", "pt", "ru", "sl", "sv")
+
+
+def rss_kib():
+    try:
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except OSError:
+        return float("nan")
+    return pages * os.sysconf("SC_PAGE_SIZE") / 1024
+
+
+def measure(langs, trace):
+    """ KiB traced or resident after loading `langs`, in this interpreter """
+    if trace:
+        tracemalloc.start()
+    import lingua_franca
+    import lingua_franca.format
+    import lingua_franca.parse
+    lingua_franca.load_languages(langs)
+    gc.collect()
+    if trace:
+        return tracemalloc.get_traced_memory()[0] / 1024
+    return rss_kib()
+
+
+def run(langs):
+    """ (traced, rss) KiB, each from a fresh interpreter """
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__))))
+    return [float(subprocess.check_output(
+        [sys.executable, __file__, ",".join(langs), str(int(trace))],
+        env=env)) for trace in (True, False)]
+
+
+def main():
+    for name, langs in [(lang, [lang]) for lang in LANGS] + \
+            [("all", list(LANGS))]:
+        traced, rss = run(langs)
+        print("{:3}: traced {:7.1f} KiB, rss {:7.0f} KiB".format(
+            name, traced, rss))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3:
+        print(measure(sys.argv[1].split(","), sys.argv[2] == "1"))
+    else:
+        main()
@@ -0,0 +1,63 @@
+"""
+Cold start of each language: how much of load_language() goes to executing
+its common_data module, the part a precompiled (pickled or marshalled)
+pack of the tables could save.
+
+Every figure is the best of a few fresh interpreters, which import the
+modules all the languages share first, so that only the language's own
+modules are timed: its common_data module alone, and load_language() with
+the parse and format modules.
+
+The common_data modules take 0.14-0.39 ms, about a tenth of the 0.9-4.6 ms
+load_language() takes. A prototype which read them from pickle/marshal
+packs saved at most about 0.06 ms, within noise, so packs were left out:
+that is no reason to unpickle code from a cache directory.
+
+    PYTHONPATH=. python benchmarks/bench_language_packs.py
+"""
+import os
+import subprocess
+import sys
+from importlib import import_module
+from time import perf_counter
+
+LANGS = ("ca", "cs", "da", "de", "en", "es", "fa", "fr", "hu", "it", "nl",
+         "pl", "pt", "ru", "sl", "sv")
+
+
+def measure(lang):
+    """ (common_data, load_language) ms, in this interpreter """
+    import lingua_franca
+    import lingua_franca.format
+    import lingua_franca.parse
+    import lingua_franca.lang.format_common
+    import lingua_franca.lang.parse_common
+    start = perf_counter()
+    import_module(".lang.common_data_" + lang, "lingua_franca")
+    common_data = perf_counter() - start
+    lingua_franca.load_language(lang)
+    return common_data * 1e3, (perf_counter() - start) * 1e3
+
+
+def best(lang, runs=5):
+    env = dict(os.environ, PYTHONPATH=os.path.dirname(
+        os.path.dirname(os.path.abspath(__file__))))
+    times = [[float(value) for value in subprocess.check_output(
+        [sys.executable, __file__, lang], env=env).split()]
+        for _ in range(runs)]
+    return [min(column) for column in zip(*times)]
+
+
+def main():
+    for lang in LANGS:
+        common_data, load = best(lang)
+        print("{}: common_data {:5.2f} ms, load_language {:6.2f} ms "
+              "({:4.1f}%)".format(lang, common_data, load,
+                                  100 * common_data / load))
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2:
+        print(*measure(sys.argv[1]))
+    else:
+        main()
@@ -0,0 +1,37 @@
+"""
+Per-call cost of convert_to_mixed_fraction(), compared with the
+denominator loop it replaced (kept in the test suite for the equivalence
+test).
+
+    PYTHONPATH=. python benchmarks/bench_mixed_fraction.py
+"""
+import random
+from timeit import timeit
+
+from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from test.test_format_common import _legacy_cmf
+
+
+def per_call(function, numbers, denominators, repeat=5):
+    def run():
+        for number in numbers:
+            function(number, denominators)
+    return timeit(run, number=repeat) / (repeat * len(numbers)) * 1e9
+
+
+def main():
+    rng = random.Random(0)
+    numbers = [rng.uniform(0, 100) for _ in range(20000)]
+    # half of them close to a fraction nice_number() would speak
+    numbers += [rng.randint(0, 99) + rng.randint(1, 19) / 20 + 1e-4
+                for _ in range(20000)]
+    for label, denominators in (("default", range(1, 21)),
+                                ("custom", [2, 3, 4, 8, 16])):
+        print("{:8}: {:6.0f} ns/call (was {:6.0f} ns/call)".format(
+            label,
+            per_call(convert_to_mixed_fraction, numbers, denominators),
+            per_call(_legacy_cmf, numbers, denominators)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Per-call cost of nice_duration(speech=True), compared with the
+concatenating implementations it replaced (kept in the test suite for the
+equivalence tests).
+
+    PYTHONPATH=. python benchmarks/bench_nice_duration.py
+"""
+from timeit import timeit
+
+import lingua_franca
+from lingua_franca.format import nice_duration
+from lingua_franca.lang.format_pl import nice_duration_pl
+from test import test_format, test_format_pl
+
+DURATIONS = list(range(0, 400000, 397))
+
+
+def per_call(function, repeat=5):
+    def run():
+        for duration in DURATIONS:
+            function(duration)
+    seconds = timeit(run, number=repeat)
+    return seconds / (repeat * len(DURATIONS)) * 1e6
+
+
+def main():
+    lingua_franca.load_languages(["en", "de", "pl"])
+    for lang in ("en", "de"):
+        print("{}: {:7.1f} us/call (was {:7.1f} us/call)".format(
+            lang, per_call(lambda d: nice_duration(d, lang=lang)),
+            per_call(lambda d: test_format._legacy_nice_duration(d, lang))))
+    print("pl: {:7.1f} us/call (was {:7.1f} us/call)".format(
+        per_call(nice_duration_pl),
+        per_call(test_format_pl._legacy_nice_duration_pl)))
+
+
+if __name__ == "__main__":
+    main()
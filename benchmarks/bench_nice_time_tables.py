@@ -0,0 +1,43 @@
+"""
+Per-call cost of nice_time() with and without the minute-of-day tables
+(`lingua_franca.config.cache_nice_time`), and the one-off cost of building
+a table.
+
+    PYTHONPATH=. python benchmarks/bench_nice_time_tables.py
+"""
+from datetime import datetime, timezone
+from timeit import default_timer, timeit
+
+import lingua_franca
+from lingua_franca import config
+from lingua_franca.format import clear_nice_time_tables, nice_time
+
+LANGS = ["en", "de", "hu", "pl", "ca"]
+TIMES = [datetime(2020, 1, 1, minute // 60, minute % 60, tzinfo=timezone.utc)
+         for minute in range(0, 1440, 7)]
+
+
+def per_call(lang, repeat=5):
+    def run():
+        for dt in TIMES:
+            nice_time(dt, lang=lang, use_ampm=True)
+    return timeit(run, number=repeat) / (repeat * len(TIMES)) * 1e6
+
+
+def main():
+    lingua_franca.load_languages(LANGS)
+    for lang in LANGS:
+        config.cache_nice_time = False
+        live = per_call(lang)
+        config.cache_nice_time = True
+        clear_nice_time_tables()
+        start = default_timer()
+        nice_time(TIMES[0], lang=lang, use_ampm=True)
+        build = default_timer() - start
+        print("{}: {:6.1f} us/call (was {:6.1f} us/call), "
+              "table built in {:5.1f} ms".format(
+                  lang, per_call(lang), live, build * 1e3))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Per-call cost of the Persian sentence reader behind extract_numbers_fa(),
+extract_duration_fa() and extract_datetime_fa(), on random number words
+and filler. Run it on an older tree to compare: the version which replaced
+every formal spelling in turn and kept its state as strings took 18 us at
+8 words and 1.04 ms at 512.
+
+    PYTHONPATH=. python benchmarks/bench_parse_sentence_fa.py
+"""
+import random
+from timeit import timeit
+
+from lingua_franca.lang.common_data_fa import _FARSI_BIG, _FARSI_HUNDREDS, \
+    _FARSI_ONES, _FARSI_TENS, _FORMAL_VARIANT
+from lingua_franca.lang.parse_fa import _parse_sentence
+
+WORDS = (_FARSI_ONES[1:] + _FARSI_TENS[1:] + _FARSI_HUNDREDS[1:] +
+         _FARSI_BIG[1:] + list(_FORMAL_VARIANT) +
+         ["و", "و", "و", "نیم", "5", "2.5", "ساعت", "دقیقه", "روز", "فردا",
+          "بعد", "پانزدهم"])
+FILLER = ["یادم", "بنداز", "که", "به", "مادرم", "زنگ", "بزنم"]
+
+
+def per_call(function, phrases, repeat=3):
+    def run():
+        for phrase in phrases:
+            function(phrase)
+    return timeit(run, number=repeat) / (repeat * len(phrases)) * 1e6
+
+
+def main():
+    rng = random.Random(0)
+    for length in (8, 64, 512):
+        phrases = [" ".join(rng.choice(WORDS + FILLER)
+                            for _ in range(length))
+                   for _ in range(max(1, 2048 // length))]
+        print("{:4} words: {:7.1f} us/call".format(
+            length, per_call(_parse_sentence, phrases)))
+
+
+if __name__ == "__main__":
+    main()
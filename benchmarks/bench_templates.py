@@ -0,0 +1,68 @@
+"""
+Matching utterances against a thousand bracket templates: a
+TemplateSet of compiled templates, against the set of every expansion
+which it replaces. Reports build time, peak memory and time per utterance.
+
+    PYTHONPATH=. python benchmarks/bench_templates.py
+"""
+import random
+import tracemalloc
+from timeit import default_timer
+
+from lingua_franca.bracket_expansion import TemplateSet
+from lingua_franca.format import expand_options
+
+VERBS = ["play", "start", "open", "show", "find", "stop", "pause", "read"]
+NOUNS = ["music", "radio", "news", "timer", "alarm", "weather", "podcast",
+         "audiobook", "calendar", "shopping list", "forecast", "lights"]
+PLACES = ["kitchen", "bedroom", "living room", "office", "garage", "garden"]
+
+
+def make_template(rng, skill):
+    verbs = "|".join(rng.sample(VERBS, 3))
+    places = "|".join(rng.sample(PLACES, 3))
+    return "(please|can you|could you|) ({}) (the|my|) {} " \
+           "(in the ({})|) (with|using|on) {} (now|right now|)".format(
+               verbs, rng.choice(NOUNS), places, skill)
+
+
+def measure(build):
+    tracemalloc.start()
+    start = default_timer()
+    built = build()
+    elapsed = default_timer() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return built, elapsed, peak / 2 ** 20
+
+
+def main():
+    rng = random.Random(0)
+    templates = [make_template(rng, "skill{}".format(skill))
+                 for skill in range(1000)]
+    utterances = [rng.choice(list(expand_options(rng.choice(templates))))
+                  for _ in range(500)]
+    utterances += ["play my music in the attic with skill7"] * 500
+
+    compiled, compiled_time, compiled_peak = measure(
+        lambda: TemplateSet(templates))
+    expanded, expanded_time, expanded_peak = measure(
+        lambda: {expansion for template in templates
+                 for expansion in expand_options(template)})
+    print("{} templates, {:,} distinct expansions".format(len(templates),
+                                                         len(expanded)))
+    print("  build: {:6.2f} s, peak {:6.1f} MiB (expanded: {:6.2f} s, "
+          "peak {:6.1f} MiB)".format(compiled_time, compiled_peak,
+                                     expanded_time, expanded_peak))
+
+    for label in ("cold", "warm"):
+        start = default_timer()
+        for utterance in utterances:
+            compiled.matches(utterance)
+        per_utterance = (default_timer() - start) / len(utterances)
+        print("  match ({}): {:6.1f} us/utterance".format(
+            label, per_utterance * 1e6))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Per-call cost of Normalizer.tokenize(), compared with the version which
+rewrote the text with two substitutions before splitting it (kept in the
+test suite for the equivalence test), and of iter_tokens(), which also
+gives the offsets of every word, compared with searching the text for each
+word the old version returned.
+
+    PYTHONPATH=. python benchmarks/bench_tokenize.py
+"""
+from timeit import timeit
+
+from lingua_franca.lang.parse_common import Normalizer, iter_tokens
+from test.test_parse_common import _legacy_tokenize
+
+SENTENCE = "set the volume to 30% and play track #2 in twenty five minutes"
+
+
+def search_offsets(text):
+    tokens = []
+    end = 0
+    for index, word in enumerate(_legacy_tokenize(text)):
+        start = text.find(word, end)
+        end = start + len(word)
+        tokens.append((word, index, start, end))
+    return tokens
+
+
+def per_call(function, text, repeat=2000):
+    return timeit(lambda: function(text), number=repeat) / repeat * 1e6
+
+
+def main():
+    for repeats in (1, 10, 100):
+        text = " ".join([SENTENCE] * repeats)
+        print("{:5} words: tokenize {:6.1f} us/call (was {:6.1f} us/call), "
+              "iter_tokens {:6.1f} us/call (was {:6.1f} us/call)".format(
+                  len(text.split()), per_call(Normalizer.tokenize, text),
+                  per_call(_legacy_tokenize, text),
+                  per_call(lambda t: list(iter_tokens(t)), text),
+                  per_call(search_offsets, text)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Quality and latency of VectorizedMatcher against brute force match_one()
+and FuzzyIndex, on the synthetic catalog from bench_fuzzy_index.py.
+
+    PYTHONPATH=. \
+        python benchmarks/bench_vectorized_matcher.py [catalog size] [queries]
+"""
+import random
+import sys
+from timeit import default_timer
+
+from lingua_franca.parse import VectorizedMatcher, match_one
+
+from bench_fuzzy_index import make_name, misspell
+
+
+def main(size=100000, queries=20):
+    rng = random.Random(1)
+    choices = list(dict.fromkeys(make_name(rng) for _ in range(size)))
+    tests = [misspell(rng, rng.choice(choices)) for _ in range(queries)]
+    expected = []
+    start = default_timer()
+    for query in tests:
+        expected.append(match_one(query, choices))
+    brute_time = default_timer() - start
+    print("catalog: {} choices".format(len(choices)))
+    print("match_one:                     {:8.2f} ms/query".format(
+        brute_time / queries * 1000))
+
+    for rescore in (0, 10, 50):
+        start = default_timer()
+        matcher = VectorizedMatcher(choices, rescore=rescore)
+        build = default_timer() - start
+        hits = 0
+        start = default_timer()
+        for query, (best, score) in zip(tests, expected):
+            found = matcher.match_one(query)
+            hits += found[0] == best if not rescore else found[1] == score
+        elapsed = default_timer() - start
+        print("VectorizedMatcher rescore={:<3} {:8.2f} ms/query, "
+              "recall@1 {:.1%}, built in {:.2f}s".format(
+                  rescore, elapsed / queries * 1000, hits / queries, build))
+
+
+if __name__ == "__main__":
+    main(*[int(arg) for arg in sys.argv[1:]])
@@ -0,0 +1,126 @@
+"""
+Load test for python -m lingua_franca.server.
+
+Starts a server (or uses the one at --url), then has --clients processes
+each send requests over a keep-alive connection for --seconds, and reports
+throughput and latency percentiles. With --batch N every HTTP request
+carries a JSON-RPC batch of N calls.
+
+    PYTHONPATH=. python benchmarks/load_server.py --workers 4 --clients 8
+    PYTHONPATH=. \
+        python benchmarks/load_server.py --workers 4 --clients 8 --batch 16
+    PYTHONPATH=. python benchmarks/load_server.py --url http://127.0.0.1:8765/
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from http.client import HTTPConnection
+from itertools import cycle
+from statistics import median
+from urllib.parse import urlsplit
+
+REQUESTS = [
+    ("extract_number", {"text": "two hundred and twenty two"}),
+    ("extract_numbers", {"text": "one two three four"}),
+    ("extract_duration", {"text": "set a timer for 7 minutes and 30 "
+                                  "seconds"}),
+    ("extract_datetime", {"text": "remind me tomorrow at 5 pm",
+                          "anchorDate": "2017-06-27T13:04:00"}),
+    ("normalize", {"text": "this is the test of twenty two numbers"}),
+    ("pronounce_number", {"number": 1234567.89}),
+    ("nice_time", {"dt": "2017-01-31T13:22:00"}),
+    ("nice_duration", {"duration": 5000}),
+]
+
+
+def _client(url, seconds, batch, offset):
+    address = urlsplit(url)
+    connection = HTTPConnection(address.hostname, address.port)
+    requests = cycle(REQUESTS[offset % len(REQUESTS):] +
+                     REQUESTS[:offset % len(REQUESTS)])
+    latencies = []
+    calls = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        payload = [{"jsonrpc": "2.0", "id": i, "method": method,
+                    "params": params}
+                   for i, (method, params) in zip(range(batch), requests)]
+        body = json.dumps(payload if batch > 1 else payload[0])
+        start = time.perf_counter()
+        connection.request("POST", "/", body,
+                           {"Content-Type": "application/json"})
+        response = json.loads(connection.getresponse().read())
+        latencies.append(time.perf_counter() - start)
+        for r in response if batch > 1 else [response]:
+            if "error" in r:
+                raise RuntimeError(r["error"])
+        calls += batch
+    connection.close()
+    return calls, latencies
+
+
+def _wait_until_up(url, timeout=60):
+    address = urlsplit(url)
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            connection = HTTPConnection(address.hostname, address.port)
+            connection.request("GET", "/health")
+            connection.getresponse().read()
+            connection.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            time.sleep(0.1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", help="use this server instead of "
+                                      "starting one")
+    parser.add_argument("--port", type=int, default=8799)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--clients", type=int, default=os.cpu_count())
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--batch", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    server = None
+    url = args.url
+    if not url:
+        url = "http://127.0.0.1:{}/".format(args.port)
+        server = subprocess.Popen(
+            [sys.executable, "-m", "lingua_franca.server", "--langs", "en",
+             "--port", str(args.port), "--workers", str(args.workers)],
+            stderr=subprocess.DEVNULL)
+    try:
+        _wait_until_up(url)
+        with ProcessPoolExecutor(args.clients) as pool:
+            results = list(pool.map(_client, [url] * args.clients,
+                                    [args.seconds] * args.clients,
+                                    [args.batch] * args.clients,
+                                    range(args.clients)))
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    calls = sum(calls for calls, _ in results)
+    latencies = sorted(l for _, ls in results for l in ls)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print("workers {}, clients {}, batch {}".format(
+        args.workers if server else "?", args.clients, args.batch))
+    print("  {:8.0f} calls/s, {:8.0f} HTTP requests/s".format(
+        calls / args.seconds, len(latencies) / args.seconds))
+    print("  latency per HTTP request: p50 {:7.2f} ms, p99 {:7.2f} ms".format(
+        median(latencies) * 1e3, p99 * 1e3))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,333 @@
+"""
+Benchmark suite over every supported language and the main parse and
+format functions, with inputs taken from the test suite.
+
+For each language the corpus is collected from the literal arguments of
+calls in test/test_parse_<lang>.py and test/test_format_<lang>.py (for
+English, test_parse.py and test_format.py), plus generated times, dates
+and durations. Every function is timed call by call, and its memory use
+measured in a separate pass with tracemalloc.
+
+    python benchmarks/suite.py --output results.json
+    python benchmarks/suite.py --langs en de --functions extract_number
+    python benchmarks/suite.py --compare results.json
+
+It runs on every Python lingua_franca supports, from 3.6.
+
+With --compare, the new results are checked against a saved run and the
+script exits with status 1 if any function got slower than --threshold.
+"""
+import argparse
+import ast
+import json
+import platform
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from statistics import median
+from time import perf_counter
+
+# time the checkout this script is in, not an installed lingua_franca
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import lingua_franca
+from lingua_franca import format as lf_format, parse as lf_parse
+from lingua_franca.internal import FunctionNotLocalizedError, \
+    _SUPPORTED_LANGUAGES
+from lingua_franca.time import default_timezone
+
+TEST_DIR = Path(__file__).resolve().parent.parent / "test"
+ANCHOR = datetime(2017, 6, 27, 13, 4)
+MAX_INPUTS = 40
+
+# name called in the tests -> corpus it feeds
+_CORPUS_CALLS = {
+    "extract_number": "numbers_text",
+    "extract_numbers": "numbers_text",
+    "extract_duration": "durations_text",
+    "extract_datetime": "datetimes_text",
+    "normalize": "normalize_text",
+    "pronounce_number": "numbers",
+    "nice_number": "numbers",
+    "nice_duration": "durations",
+}
+# helpers wrapping extract_datetime(), e.g. testExtract_it()
+_DATETIME_HELPERS = ("testExtract", "extractWithFormat")
+
+
+def _call_name(node):
+    if isinstance(node.func, ast.Name):
+        return node.func.id
+    if isinstance(node.func, ast.Attribute):
+        return node.func.attr
+    return None
+
+
+def _literal(node):
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        value = _literal(node.operand)
+        return -value if isinstance(value, (int, float)) else None
+    if sys.version_info < (3, 8):
+        # before 3.8, ast.parse() gives Str and Num nodes
+        if isinstance(node, ast.Str):
+            return node.s
+        if isinstance(node, ast.Num) and isinstance(node.n, (int, float)):
+            return node.n
+        return None
+    if isinstance(node, ast.Constant) and \
+            isinstance(node.value, (str, int, float)) and \
+            not isinstance(node.value, bool):
+        return node.value
+    return None
+
+
+def _test_files(lang):
+    if lang == "en":
+        names = ["test_parse.py", "test_format.py"]
+    else:
+        names = ["test_parse_{}.py".format(lang),
+                 "test_format_{}.py".format(lang)]
+    return [TEST_DIR / name for name in names if (TEST_DIR / name).exists()]
+
+
+def build_corpus(lang, max_inputs=MAX_INPUTS):
+    """ Inputs for every benchmarked function, in one language
+
+    Args:
+        lang (str): primary language code
+        max_inputs (int): cap on the inputs per function
+
+    Returns:
+        dict: corpus name -> list of inputs
+    """
+    found = {name: [] for name in set(_CORPUS_CALLS.values())}
+    for path in _test_files(lang):
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.Call) or not node.args:
+                continue
+            name = _call_name(node)
+            if name in _CORPUS_CALLS:
+                corpus = _CORPUS_CALLS[name]
+            elif name and name.startswith(_DATETIME_HELPERS):
+                corpus = "datetimes_text"
+            else:
+                continue
+            value = _literal(node.args[0])
+            wants_text = corpus.endswith("_text")
+            if value is None or isinstance(value, str) != wants_text:
+                continue
+            if value not in found[corpus]:
+                found[corpus].append(value)
+
+    rng = random.Random(lang)
+    corpus = {name: (values if len(values) <= max_inputs
+                     else rng.sample(values, max_inputs))
+              for name, values in found.items()}
+    if not corpus["durations"]:
+        corpus["durations"] = [1, 3, 61, 5000, 50000, 500000]
+    corpus["times"] = [ANCHOR.replace(hour=minute // 60, minute=minute % 60,
+                                      tzinfo=default_timezone())
+                       for minute in range(0, 1440,
+                                           max(1, 1440 // max_inputs))]
+    corpus["dates"] = [ANCHOR.replace(tzinfo=default_timezone()) +
+                       timedelta(days=day * 37)
+                       for day in range(max_inputs)]
+    return corpus
+
+
+def _match_one_cases(corpus, max_inputs):
+    choices = corpus["normalize_text"] + corpus["numbers_text"] + \
+        corpus["datetimes_text"]
+    choices = list(dict.fromkeys(choices))
+    if not choices:
+        return []
+    rng = random.Random(len(choices))
+    queries = []
+    for choice in choices[:max_inputs]:
+        position = rng.randrange(len(choice)) if choice else 0
+        queries.append(choice[:position] + choice[position + 1:])
+    return [(query, choices) for query in queries]
+
+
+def benchmark_cases(lang, corpus, max_inputs=MAX_INPUTS):
+    """ (function name, list of zero-argument calls) to benchmark """
+    def calls(function, inputs, **kwargs):
+        return [lambda value=value: function(value, lang=lang, **kwargs)
+                for value in inputs]
+
+    return [
+        ("extract_number", calls(lf_parse.extract_number,
+                                 corpus["numbers_text"])),
+        ("extract_numbers", calls(lf_parse.extract_numbers,
+                                  corpus["numbers_text"])),
+        ("extract_duration", calls(lf_parse.extract_duration,
+                                   corpus["durations_text"])),
+        ("extract_datetime", calls(lf_parse.extract_datetime,
+                                   corpus["datetimes_text"],
+                                   anchorDate=ANCHOR)),
+        ("normalize", calls(lf_parse.normalize, corpus["normalize_text"])),
+        ("pronounce_number", calls(lf_format.pronounce_number,
+                                   corpus["numbers"])),
+        ("nice_number", calls(lf_format.nice_number, corpus["numbers"])),
+        ("nice_time", calls(lf_format.nice_time, corpus["times"])),
+        ("nice_date", calls(lf_format.nice_date, corpus["dates"],
+                            now=ANCHOR.replace(tzinfo=default_timezone()))),
+        ("nice_duration", calls(lf_format.nice_duration,
+                                corpus["durations"])),
+        ("match_one", [lambda case=case: lf_parse.match_one(*case)
+                       for case in _match_one_cases(corpus, max_inputs)]),
+    ]
+
+
+def _percentile(ordered, fraction):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def measure(calls, repeat):
+    """ Time each call `repeat` times, then measure its allocations once
+
+    Returns:
+        dict: the results, or the reason the function was skipped
+    """
+    working = []
+    errors = 0
+    for call in calls:
+        try:
+            call()
+        except (FunctionNotLocalizedError, NotImplementedError) as e:
+            return {"skipped": type(e).__name__}
+        except Exception:
+            errors += 1  # inputs this language can't handle
+        else:
+            working.append(call)
+    if not working:
+        return {"skipped": "no usable inputs"}
+
+    timings = []
+    for _ in range(repeat):
+        for call in working:
+            start = perf_counter()
+            call()
+            timings.append(perf_counter() - start)
+    timings.sort()
+
+    # tracing restarts for every call, so the peak is that call's alone
+    allocated = []
+    for call in working:
+        tracemalloc.start()
+        call()
+        allocated.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return {"inputs": len(working),
+            "errors": errors,
+            "ops_per_sec": len(timings) / sum(timings),
+            "p50_us": median(timings) * 1e6,
+            "p99_us": _percentile(timings, 0.99) * 1e6,
+            "alloc_peak_mean_kib": sum(allocated) / len(allocated) / 1024,
+            "alloc_peak_max_kib": max(allocated) / 1024}
+
+
+def run(langs, functions=None, repeat=5, max_inputs=MAX_INPUTS, log=None):
+    """ Benchmark the given languages
+
+    Returns:
+        dict: {"meta": {...}, "results": {lang: {function: {...}}}}
+    """
+    lingua_franca.load_languages(langs)
+    results = {}
+    for lang in langs:
+        lingua_franca.set_default_lang(lang)
+        corpus = build_corpus(lang, max_inputs)
+        results[lang] = {}
+        for name, calls in benchmark_cases(lang, corpus, max_inputs):
+            if functions and name not in functions:
+                continue
+            results[lang][name] = measure(calls, repeat)
+            if log:
+                log(lang, name, results[lang][name])
+    return {"meta": {"python": platform.python_version(),
+                     "platform": platform.platform(),
+                     "repeat": repeat,
+                     "max_inputs": max_inputs,
+                     "date": datetime.now().isoformat(timespec="seconds")},
+            "results": results}
+
+
+def compare(baseline, current, threshold):
+    """ Print how each function changed against a baseline
+
+    Args:
+        baseline (dict): results of an earlier run()
+        current (dict): results of this run()
+        threshold (float): slowdown, as a fraction, counted as a regression
+
+    Returns:
+        list((str, str)): the (lang, function) pairs which regressed
+    """
+    regressions = []
+    for lang, functions in sorted(current["results"].items()):
+        for name, result in sorted(functions.items()):
+            before = baseline["results"].get(lang, {}).get(name, {})
+            if "ops_per_sec" not in result or "ops_per_sec" not in before:
+                continue
+            ratio = result["ops_per_sec"] / before["ops_per_sec"]
+            flag = ""
+            if ratio < 1 - threshold:
+                flag = "  REGRESSION"
+                regressions.append((lang, name))
+            print("{:3} {:17} {:10.0f} -> {:10.0f} ops/s  x{:5.2f}{}".format(
+                lang, name, before["ops_per_sec"], result["ops_per_sec"],
+                ratio, flag))
+    return regressions
+
+
+def _log(lang, name, result):
+    if "skipped" in result:
+        print("{:3} {:17} skipped: {}".format(lang, name, result["skipped"]),
+              file=sys.stderr)
+    else:
+        print("{:3} {:17} {:10.0f} ops/s  p50 {:8.1f} us  p99 {:8.1f} us  "
+              "{:8.1f} KiB".format(lang, name, result["ops_per_sec"],
+                                  result["p50_us"], result["p99_us"],
+                                  result["alloc_peak_max_kib"]),
+              file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--langs", nargs="+", default=_SUPPORTED_LANGUAGES,
+                        choices=_SUPPORTED_LANGUAGES)
+    parser.add_argument("--functions", nargs="+")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-inputs", type=int, default=MAX_INPUTS)
+    parser.add_argument("--output", help="write the results to this file")
+    parser.add_argument("--compare", metavar="BASELINE",
+                        help="compare with the results saved in this file")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="slowdown reported as a regression "
+                             "(default 0.1)")
+    args = parser.parse_args(argv)
+
+    results = run(list(args.langs), args.functions, args.repeat,
+                  args.max_inputs, log=_log)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    elif not args.compare:
+        json.dump(results, sys.stdout, indent=2, sort_keys=True)
+        print()
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(baseline, results, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
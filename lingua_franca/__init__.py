@@ -1,6 +1,7 @@
 from .internal import get_default_lang, set_default_lang, get_default_loc, \
     get_active_langs, _set_active_langs, get_primary_lang_code, \
     get_full_lang_code, resolve_resource_file, load_language, \
-    load_languages, unload_language, unload_languages, get_supported_langs
+    load_languages, unload_language, unload_languages, get_supported_langs, \
+    get_function_stats as stats, reset_function_stats as reset_stats
 
 from lingua_franca import config
@@ -0,0 +1,325 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+asyncio counterparts of the parse and format functions
+
+Lingua Franca's functions are synchronous and CPU-bound. The coroutines
+here run them on an executor, so they don't stall the event loop:
+
+    from lingua_franca import aio
+
+    date, remainder = await aio.extract_datetime("tomorrow at 5pm")
+    numbers = await aio.map("extract_number", texts, lang="de")
+
+The default language and timezone are captured when a call is submitted,
+not when it runs: the language is passed on explicitly, naive datetimes are
+made timezone-aware and a missing extract_datetime() anchor is set to the
+current time. Process workers also take on the submitting process's
+default timezone and loaded languages.
+"""
+import asyncio
+import os
+import sys
+import weakref
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime
+from functools import partial, wraps
+from importlib import import_module
+from inspect import signature
+
+from lingua_franca import config
+from lingua_franca.internal import get_active_langs, get_default_lang, \
+    get_default_loc, load_languages, set_default_lang
+from lingua_franca.time import default_timezone, now_local, \
+    set_default_tz, to_local
+
+_PARSE_FUNCTIONS = ("extract_number", "extract_numbers", "extract_duration",
+                    "extract_datetime", "extract_datetimes", "normalize",
+                    "get_gender", "get_genders", "is_fractional",
+                    "is_ordinal", "fuzzy_match", "match_one")
+_FORMAT_FUNCTIONS = ("nice_number", "nice_time", "pronounce_number",
+                     "nice_date", "nice_date_time", "nice_year",
+                     "nice_duration", "join_list", "nice_response",
+                     "expand_options", "count_expansions")
+_MODULES = dict([(name, "lingua_franca.parse") for name in _PARSE_FUNCTIONS] +
+                [(name, "lingua_franca.format") for name in _FORMAT_FUNCTIONS])
+
+
+_signatures = {}
+
+
+def _function(name):
+    if name not in _MODULES:
+        raise ValueError("{} has no asyncio counterpart".format(name))
+    return getattr(import_module(_MODULES[name]), name)
+
+
+def _signature(name):
+    if name not in _signatures:
+        _signatures[name] = signature(_function(name))
+    return _signatures[name]
+
+
+def _context():
+    """ The state a call depends on, captured in the submitting thread """
+    return {"lang": get_default_lang(), "langs": get_active_langs(),
+            "tz": default_timezone()}
+
+
+def _bind_context(name, args, kwargs):
+    """ Make a call independent of the defaults at the time it runs """
+    bound = _signature(name).bind(*args, **kwargs)
+    params = bound.signature.parameters
+    if 'lang' in params and bound.arguments.get('lang', '') == '' and \
+            get_default_lang():
+        bound.arguments['lang'] = get_default_loc()
+    if 'anchorDate' in params and not bound.arguments.get('anchorDate'):
+        bound.arguments['anchorDate'] = now_local()
+    if 'lazy' in params:
+        bound.arguments['lazy'] = False  # generators can't cross processes
+    if config.inject_timezones:
+        for key, value in bound.arguments.items():
+            if isinstance(value, datetime) and value.tzinfo is None:
+                bound.arguments[key] = to_local(value)
+    return name, bound.args, bound.kwargs
+
+
+def _init_process(langs):
+    if langs:
+        load_languages(langs)
+
+
+def _apply_context(context):
+    """ Take on the submitting process's defaults, in a worker process """
+    missing = [lang for lang in context["langs"]
+               if lang not in get_active_langs()]
+    if missing:
+        load_languages(missing)
+    if context["lang"] and get_default_lang() != context["lang"]:
+        set_default_lang(context["lang"])
+    if default_timezone() != context["tz"]:
+        set_default_tz(context["tz"])
+
+
+def _run_calls(calls, context=None):
+    """ Run a batch of calls in a worker
+
+    Returns:
+        list: (True, result) or (False, exception) for each call
+    """
+    if context is not None:
+        _apply_context(context)
+    results = []
+    for name, args, kwargs in calls:
+        try:
+            results.append((True, _function(name)(*args, **kwargs)))
+        except Exception as e:
+            results.append((False, e))
+    return results
+
+
+class Executor(object):
+    """
+    Runs Lingua Franca calls on a pool of threads or processes
+
+    Threads share the caller's loaded languages and cost nothing to start,
+    but only help while other coroutines wait on I/O, since the functions
+    hold the GIL. Processes run calls in parallel, at the cost of pickling
+    arguments and results, and of loading languages in every worker.
+
+    Args:
+        kind (str): "thread" or "process"
+        max_workers (int): size of the pool, default os.cpu_count()
+        max_concurrency (int): jobs submitted to the pool at once, from any
+                               number of coroutines; default max_workers
+    """
+
+    def __init__(self, kind="thread", max_workers=None, max_concurrency=None):
+        if kind not in ("thread", "process"):
+            raise ValueError("kind must be 'thread' or 'process'")
+        self.kind = kind
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or self.max_workers
+        if kind == "thread":
+            self._pool = ThreadPoolExecutor(self.max_workers,
+                                            thread_name_prefix="lingua_franca")
+        else:
+            # initializer is 3.7+; without it, each worker loads the
+            # languages with the first call's context instead
+            preload = {"initializer": _init_process,
+                       "initargs": (get_active_langs(),)} \
+                if sys.version_info >= (3, 7) else {}
+            self._pool = ProcessPoolExecutor(self.max_workers, **preload)
+        # asyncio primitives belong to one event loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _semaphore(self):
+        # the running loop, within a coroutine (get_running_loop() is 3.7+)
+        loop = asyncio.get_event_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = \
+                asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    def _submit(self, calls):
+        # bind the context now, in the caller, rather than when the
+        # coroutine first runs
+        calls = [_bind_context(getattr(function, "__name__", function),
+                               tuple(args), dict(kwargs))
+                 for function, args, kwargs in calls]
+        context = _context() if self.kind == "process" else None
+        return self._run(calls, context)
+
+    async def _run(self, calls, context):
+        async with self._semaphore():
+            return await asyncio.get_event_loop().run_in_executor(
+                self._pool, partial(_run_calls, calls, context))
+
+    @staticmethod
+    async def _results(submitted, return_exceptions):
+        results = []
+        for ok, result in await submitted:
+            if not ok and not return_exceptions:
+                raise result
+            results.append(result)
+        return results
+
+    def call(self, function, *args, **kwargs):
+        """
+        Run one function
+
+        The language and timezone defaults are captured when this is
+        called, not when the returned coroutine is awaited.
+
+        Args:
+            function (str or callable): e.g. "extract_number" or
+                                        lingua_franca.parse.extract_number
+            *args, **kwargs: its arguments
+
+        Returns:
+            awaitable: what the function returns
+        """
+        return self._result(self._submit([(function, args, kwargs)]))
+
+    @staticmethod
+    async def _result(submitted):
+        (ok, result), = await submitted
+        if not ok:
+            raise result
+        return result
+
+    def batch(self, calls, return_exceptions=False):
+        """
+        Run several calls as a single job, to save on per-call overhead
+
+        Args:
+            calls (iter): (function, args, kwargs) tuples
+            return_exceptions (bool): return exceptions in place of results,
+                                      rather than raising the first one
+
+        Returns:
+            awaitable: list of results, in the order of the calls
+        """
+        return self._results(self._submit(calls), return_exceptions)
+
+    def map(self, function, items, *args, chunk_size=32, **kwargs):
+        """
+        Run a function over many first arguments, in chunks of chunk_size
+        calls, with chunks running concurrently
+
+        Args:
+            function (str or callable): function to run
+            items (iter): first argument of each call
+            *args, **kwargs: further arguments, the same for each call
+            chunk_size (int): calls per job
+
+        Returns:
+            awaitable: list of results, in the order of the items
+        """
+        calls = [(function, (item,) + args, kwargs) for item in items]
+        chunks = [self.batch(calls[start:start + chunk_size])
+                  for start in range(0, len(calls), chunk_size)]
+        return self._gather(chunks)
+
+    @staticmethod
+    async def _gather(chunks):
+        chunks = await asyncio.gather(*chunks)
+        return [result for chunk in chunks for result in chunk]
+
+    def shutdown(self, wait=True):
+        self._pool.shutdown(wait=wait)
+
+
+_executor = None
+
+
+def configure(kind="thread", max_workers=None, max_concurrency=None):
+    """
+    Replace the executor used by this module's functions
+
+    Args:
+        kind (str): "thread" or "process"
+        max_workers (int): size of the pool, default os.cpu_count()
+        max_concurrency (int): jobs submitted to the pool at once
+
+    Returns:
+        Executor: the new executor
+    """
+    global _executor
+    previous = _executor
+    _executor = Executor(kind, max_workers, max_concurrency)
+    if previous is not None:
+        previous.shutdown(wait=False)
+    return _executor
+
+
+def get_executor():
+    """
+    Returns:
+        Executor: the executor used by this module's functions, a thread
+                  pool unless configure() was called
+    """
+    return _executor or configure()
+
+
+def batch(calls, return_exceptions=False):
+    """ Executor.batch() on the module's executor """
+    return get_executor().batch(calls, return_exceptions)
+
+
+def map(function, items, *args, chunk_size=32, **kwargs):
+    """ Executor.map() on the module's executor """
+    return get_executor().map(function, items, *args,
+                              chunk_size=chunk_size, **kwargs)
+
+
+def _async_counterpart(name):
+    @wraps(_function(name))
+    def call(*args, **kwargs):
+        return get_executor().call(name, *args, **kwargs)
+    # the signature is the same, but the result is awaitable
+    call.__doc__ = "Awaitable counterpart of lingua_franca.{}.{}()\n\n{}" \
+        .format(_MODULES[name].split('.')[-1], name, call.__doc__ or "")
+    return call
+
+
+for _name in _MODULES:
+    globals()[_name] = _async_counterpart(_name)
+del _name
+
+__all__ = ["Executor", "configure", "get_executor", "batch", "map"] + \
+    list(_MODULES)
@@ -0,0 +1,207 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+Run the parse and format functions over a file of JSON lines
+
+    python -m lingua_franca.batch corpus.jsonl > results.jsonl
+    cat corpus.jsonl | python -m lingua_franca.batch --workers 8
+
+Every input line is an object naming the function in "op", with its
+arguments by name; "anchor" is short for extract_datetime()'s anchorDate,
+and an "id" is copied to the output:
+
+    {"id": 7, "op": "extract_datetime", "text": "tomorrow at 5pm",
+     "lang": "en", "anchor": "2017-06-27T13:04:00"}
+
+Every output line holds the "result", or the "error" and its "type", in
+the order of the input. Datetimes are ISO 8601 strings and durations are
+in seconds.
+
+Lines are read and written in chunks, spread over a process pool; at most
+a few chunks per worker are in flight, so memory use doesn't grow with the
+input. Each worker loads a language the first time it meets it.
+"""
+import argparse
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from time import perf_counter
+
+from lingua_franca.internal import get_active_langs, \
+    get_primary_lang_code, load_language, _SUPPORTED_LANGUAGES
+from lingua_franca.rpc import METHODS, SIGNATURES, RPCError, bind_params, \
+    to_json
+
+_ALIASES = {"anchor": "anchorDate"}
+
+
+def _ensure_loaded(lang):
+    lang = get_primary_lang_code(lang)
+    if lang in _SUPPORTED_LANGUAGES and lang not in get_active_langs():
+        load_language(lang)
+
+
+def run_line(line, default_lang="en"):
+    """
+    Run the call described by one input line
+
+    Args:
+        line (str): a JSON object with an "op" and its arguments
+        default_lang (str): language of lines which don't name one
+
+    Returns:
+        dict: {"result": ...} or {"error": ..., "type": ...}, with the
+              line's "id" if it has one
+    """
+    output = {}
+    try:
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("expected a JSON object")
+        if "id" in record:
+            output["id"] = record.pop("id")
+        op = record.pop("op", None)
+        if op not in METHODS:
+            raise ValueError("unknown op: {}".format(op))
+        params = {_ALIASES.get(key, key): value
+                  for key, value in record.items()}
+        # match_one() and the like take no language
+        if "lang" in SIGNATURES[op].parameters:
+            params.setdefault("lang", default_lang)
+            _ensure_loaded(params["lang"])
+        bound = bind_params(op, params)
+        output["result"] = METHODS[op](*bound.args, **bound.kwargs)
+    except RPCError as e:
+        output["error"] = e.message
+        output["type"] = "InvalidParams"
+    except Exception as e:
+        output["error"] = str(e)
+        output["type"] = type(e).__name__
+    return output
+
+
+def run_chunk(lines, default_lang="en"):
+    """
+    Run a chunk of input lines
+
+    Returns:
+        (list(str), int): the encoded output lines, and how many of them
+                          are errors
+    """
+    outputs = [run_line(line, default_lang) for line in lines]
+    errors = sum("error" in output for output in outputs)
+    return [json.dumps(output, default=to_json, ensure_ascii=False)
+            for output in outputs], errors
+
+
+def _chunks(lines, size):
+    lines = (line for line in lines if line.strip())
+    while True:
+        chunk = list(islice(lines, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process(lines, workers=None, chunk_size=256, default_lang="en"):
+    """
+    Run every input line, in a pool of processes
+
+    Args:
+        lines (iter(str)): the input lines, read lazily
+        workers (int): number of processes, default os.cpu_count();
+                       0 runs the lines in this process
+        chunk_size (int): lines sent to a worker at once
+        default_lang (str): language of lines which don't name one
+
+    Returns:
+        iter((list(str), int)): run_chunk() of each chunk, in input order
+    """
+    chunks = _chunks(lines, chunk_size)
+    if workers == 0:
+        for chunk in chunks:
+            yield run_chunk(chunk, default_lang)
+        return
+
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(workers) as pool:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(run_chunk, chunk, default_lang))
+            # enough queued to keep every worker busy, and no more
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m lingua_franca.batch",
+        description=__doc__.strip().split("\n")[0])
+    parser.add_argument("input", nargs="?", default="-",
+                        help="JSON lines file, default stdin")
+    parser.add_argument("--output", "-o", default="-",
+                        help="file for the results, default stdout")
+    parser.add_argument("--workers", type=int,
+                        help="worker processes (default: CPU count, "
+                             "0 runs in this process)")
+    parser.add_argument("--chunk-size", type=int, default=256)
+    parser.add_argument("--lang", default="en",
+                        help="language of lines which don't name one")
+    parser.add_argument("--quiet", "-q", action="store_true",
+                        help="don't report throughput")
+    args = parser.parse_args(argv)
+
+    source = sys.stdin if args.input == "-" else \
+        open(args.input, encoding="utf-8")
+    sink = sys.stdout if args.output == "-" else \
+        open(args.output, "w", encoding="utf-8")
+    progress = not args.quiet and sys.stderr.isatty()
+    start = perf_counter()
+    count = errors = 0
+    try:
+        for chunk, chunk_errors in process(source, args.workers,
+                                           args.chunk_size, args.lang):
+            for line in chunk:
+                sink.write(line)
+                sink.write("\n")
+            count += len(chunk)
+            errors += chunk_errors
+            if progress:
+                elapsed = perf_counter() - start
+                print("\r{} lines, {:.0f} lines/s".format(
+                    count, count / elapsed if elapsed else 0),
+                    end="", file=sys.stderr, flush=True)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if sink is not sys.stdout:
+            sink.close()
+    elapsed = perf_counter() - start
+    if not args.quiet:
+        print("\r" * progress + "{} lines, {} errors in {:.2f} s, "
+              "{:.0f} lines/s".format(count, errors, elapsed,
+                                      count / elapsed if elapsed else 0),
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
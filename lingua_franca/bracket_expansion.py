@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import re
 
 
 class Fragment(object):
@@ -38,6 +39,35 @@ class Fragment(object):
         """
         return [[]]
 
+    def iter_expand(self, reverse=False):
+        """
+        Lazy version of expand(), yielding one sentence at a time.
+        Args:
+            reverse (bool): yield the sentences in the opposite order
+        Returns:
+            Iterator<List<str>>: the same sentences as expand()
+        """
+        yield []
+
+    def count(self):
+        """Number of sentences expand() would return, without expanding."""
+        return 1
+
+    def build(self, automaton, state):
+        """
+        Add the fragment's words to a TokenAutomaton.
+        Args:
+            automaton (TokenAutomaton): automaton under construction
+            state (int): state the fragment starts from
+        Returns:
+            int: state the fragment ends in
+        """
+        return state
+
+    def required_words(self):
+        """Words which appear in every expanded sentence."""
+        return set()
+
     def __str__(self):
         return self._tree.__str__()
 
@@ -60,6 +90,18 @@ class Word(Fragment):
         """
         return [[self._tree]]
 
+    def iter_expand(self, reverse=False):
+        yield [self._tree]
+
+    def build(self, automaton, state):
+        # tokens may hold several words, or only whitespace
+        for word in self._tree.split():
+            state = automaton.add_word(state, word)
+        return state
+
+    def required_words(self):
+        return set(self._tree.split())
+
 
 class Sentence(Fragment):
     """
@@ -74,16 +116,41 @@ class Sentence(Fragment):
             List<List<str>>: A list with all subsentence expansions combined in
                                 every possible way
         """
-        old_expanded = [[]]
+        return list(self.iter_expand())
+
+    def iter_expand(self, reverse=False):
+        # expand() has always combined the sentences built so far in
+        # reverse order with each new sub-sentence, e.g. for "(a|b) (c|d)":
+        # ['b c', 'b d', 'a c', 'a d']. Reproduce that order lazily: the
+        # prefixes for the last sub-sentence come in the opposite order of
+        # the one requested, and so on down to the first.
+        return self._iter_expand(len(self._tree), reverse)
+
+    def _iter_expand(self, length, reverse):
+        if length == 0:
+            yield []
+            return
+        last = self._tree[length - 1]
+        for sentence in self._iter_expand(length - 1, not reverse):
+            for new in last.iter_expand(reverse):
+                yield sentence + new
+
+    def count(self):
+        total = 1
+        for sub in self._tree:
+            total *= sub.count()
+        return total
+
+    def build(self, automaton, state):
+        for sub in self._tree:
+            state = sub.build(automaton, state)
+        return state
+
+    def required_words(self):
+        words = set()
         for sub in self._tree:
-            sub_expanded = sub.expand()
-            new_expanded = []
-            while len(old_expanded) > 0:
-                sentence = old_expanded.pop()
-                for new in sub_expanded:
-                    new_expanded.append(sentence + new)
-            old_expanded = new_expanded
-        return old_expanded
+            words |= sub.required_words()
+        return words
 
 
 class Options(Fragment):
@@ -104,6 +171,28 @@ class Options(Fragment):
             options.extend(option.expand())
         return options
 
+    def iter_expand(self, reverse=False):
+        for option in (reversed(self._tree) if reverse else self._tree):
+            yield from option.iter_expand(reverse)
+
+    def count(self):
+        return sum(option.count() for option in self._tree)
+
+    def build(self, automaton, state):
+        end = automaton.add_state()
+        for option in self._tree:
+            automaton.add_epsilon(option.build(automaton, state), end)
+        return end
+
+    def required_words(self):
+        words = None
+        for option in self._tree:
+            if words is None:
+                words = option.required_words()
+            else:
+                words &= option.required_words()
+        return words or set()
+
 
 class SentenceTreeParser(object):
     """
@@ -172,4 +261,223 @@ class SentenceTreeParser(object):
 
     def expand_parentheses(self):
         tree = self._parse()
-        return self._expand_tree(tree)
\ No newline at end of file
+        return self._expand_tree(tree)
+
+    def iter_expand_parentheses(self):
+        """
+        Lazy version of expand_parentheses(), for templates with too many
+        expansions to hold in memory at once
+        """
+        return self._parse().iter_expand()
+
+    def count_expansions(self):
+        """
+        Number of sentences expand_parentheses() would return, computed
+        from the tree without expanding it
+        """
+        return self._parse().count()
+
+
+class TokenAutomaton(object):
+    """
+    Finite automaton over words, built from a sentence tree.
+
+    It is built as a nondeterministic automaton, then run as a deterministic
+    one whose states (sets of the original states) are created on first use
+    and memoized, so each word of an utterance costs one dict lookup once
+    warm, however the template is nested.
+
+    Args:
+        tree (Fragment): parsed template
+    """
+
+    def __init__(self, tree):
+        self._words = []
+        self._epsilon = []
+        start = self.add_state()
+        self._accept = tree.build(self, start)
+        self.vocabulary = frozenset(word for transitions in self._words
+                                    for word in transitions)
+        self.start = self._closure({start})
+        self._steps = {}
+
+    def add_state(self):
+        self._words.append({})
+        self._epsilon.append([])
+        return len(self._words) - 1
+
+    def add_word(self, state, word):
+        target = self.add_state()
+        self._words[state].setdefault(word, []).append(target)
+        return target
+
+    def add_epsilon(self, state, target):
+        self._epsilon[state].append(target)
+
+    def _closure(self, states):
+        closure = set(states)
+        stack = list(closure)
+        while stack:
+            for target in self._epsilon[stack.pop()]:
+                if target not in closure:
+                    closure.add(target)
+                    stack.append(target)
+        return frozenset(closure)
+
+    def step(self, states, word):
+        """
+        Args:
+            states (frozenset): current state, as returned by step() or start
+            word (str): next word
+
+        Returns:
+            frozenset: the next state, empty once no expansion can match
+        """
+        if word not in self.vocabulary or not states:
+            return frozenset()
+        key = (states, word)
+        following = self._steps.get(key)
+        if following is None:
+            following = self._closure(
+                target for state in states
+                for target in self._words[state].get(word, ()))
+            self._steps[key] = following
+        return following
+
+    def accepts(self, states):
+        return self._accept in states
+
+
+class Template(object):
+    """
+    A bracket template compiled to a TokenAutomaton, to test utterances
+    against it without expanding it. Time is linear in the length of the
+    utterance, and memory in the length of the template.
+
+    An utterance matches when it is one of the template's expansions, as
+    returned by expand_options(), up to whitespace:
+
+        Template("(what's|what is) the (weather|forecast) (today|)")
+            .matches("what is the forecast")  ->  True
+
+    Args:
+        template (str): template, such as "will it (rain|pour)"
+    """
+
+    def __init__(self, template):
+        self.template = template
+        tree = SentenceTreeParser(re.split(r'([(|)])', template))._parse()
+        self.automaton = TokenAutomaton(tree)
+        self.required_words = frozenset(tree.required_words())
+
+    def matches(self, utterance):
+        """
+        Args:
+            utterance (str): the text to test
+
+        Returns:
+            bool: whether the utterance is one of the template's expansions
+        """
+        automaton = self.automaton
+        states = automaton.start
+        for word in utterance.split():
+            states = automaton.step(states, word)
+            if not states:
+                return False
+        return automaton.accepts(states)
+
+    def match_spans(self, utterance):
+        """
+        Find the expansions of the template within a longer utterance.
+
+        Only whole words match. Spans don't overlap; the leftmost match is
+        taken first, and the longest one if several start at the same word.
+
+        Args:
+            utterance (str): the text to search
+
+        Returns:
+            list((int, int)): start and end offsets of each match
+        """
+        automaton = self.automaton
+        words = [(match.group(), match.start(), match.end())
+                 for match in re.finditer(r"\S+", utterance)]
+        spans = []
+        first = 0
+        while first < len(words):
+            states = automaton.start
+            end = None
+            for index in range(first, len(words)):
+                states = automaton.step(states, words[index][0])
+                if not states:
+                    break
+                if automaton.accepts(states):
+                    end = index
+            if end is None:
+                first += 1
+            else:
+                spans.append((words[first][1], words[end][2]))
+                first = end + 1
+        return spans
+
+    def __repr__(self):
+        return "Template({!r})".format(self.template)
+
+
+class TemplateSet(object):
+    """
+    Many compiled templates, matched against one utterance at a time.
+
+    Each template is indexed by one of the words all of its expansions
+    contain, the one shared with the fewest templates so far, and only
+    templates indexed by a word of the utterance are tried.
+
+    Args:
+        templates (iter of str): templates to add
+    """
+
+    def __init__(self, templates=()):
+        self.templates = []
+        self._by_word = {}
+        self._unindexed = []
+        for template in templates:
+            self.add(template)
+
+    def add(self, template):
+        """
+        Args:
+            template (str or Template): template to add
+
+        Returns:
+            Template: the compiled template
+        """
+        if not isinstance(template, Template):
+            template = Template(template)
+        index = len(self.templates)
+        self.templates.append(template)
+        if template.required_words:
+            # spread templates over as many words as possible
+            word = min(sorted(template.required_words),
+                       key=lambda word: len(self._by_word.get(word, ())))
+            self._by_word.setdefault(word, []).append(index)
+        else:
+            self._unindexed.append(index)
+        return template
+
+    def matches(self, utterance):
+        """
+        Args:
+            utterance (str): the text to test
+
+        Returns:
+            list(Template): the templates matching the utterance, in the
+                            order they were added
+        """
+        candidates = set(self._unindexed)
+        for word in set(utterance.split()):
+            candidates.update(self._by_word.get(word, ()))
+        return [self.templates[index] for index in sorted(candidates)
+                if self.templates[index].matches(utterance)]
+
+    def __len__(self):
+        return len(self.templates)
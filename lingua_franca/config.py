@@ -1,2 +1,9 @@
 load_langs_on_demand = False
 inject_timezones = True
+cache_extract_datetime = False
+extract_datetime_cache_size = 512
+cache_nice_time = False
+nice_time_table_dir = None
+instrument_functions = False
+instrumentation_samples = 1000
+instrumentation_hook = None
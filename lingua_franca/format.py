@@ -18,17 +18,25 @@ import json
 import os
 import re
 from collections import namedtuple
+from functools import wraps
+from importlib import import_module
+from inspect import signature
+from threading import Lock
 from warnings import warn
 from os.path import join
+from zlib import crc32
 
 
+from lingua_franca import config
 from lingua_franca.bracket_expansion import SentenceTreeParser
+from lingua_franca.lang.format_common import DurationFormatter
 from lingua_franca.internal import localized_function, \
     populate_localized_function_dict, get_active_langs, \
     get_full_lang_code, get_default_lang, get_default_loc, \
     is_supported_full_lang, _raise_unsupported_language, \
     UnsupportedLanguageError, NoneLangWarning, InvalidLangWarning, \
-    FunctionNotLocalizedError
+    FunctionNotLocalizedError, get_supported_langs
+from lingua_franca.time import to_local
 
 
 _REGISTERED_FUNCTIONS = ("nice_number",
@@ -260,6 +268,160 @@ def nice_number(number, lang='', speech=True, denominators=None):
     return str(number)
 
 
+class _NiceTimeTables:
+    """Opt-in minute-of-day tables for nice_time().
+
+    nice_time() only looks at the hour and minute of its input, so for each
+    language and combination of flags there are just 1440 possible outputs.
+    The first call with a given combination computes all of them through the
+    localized function, and later calls are a single list index.
+
+    Enabled by `lingua_franca.config.cache_nice_time`. When
+    `lingua_franca.config.nice_time_table_dir` is set, tables are saved there
+    as JSON and reused by later processes, as long as the language's format
+    module and common data are unchanged.
+    """
+    _REFERENCE = datetime.datetime(2000, 1, 1, tzinfo=datetime.timezone.utc)
+
+    def __init__(self):
+        self._tables = {}
+        self._lock = Lock()
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+
+    @staticmethod
+    def _fingerprint(lang):
+        module = import_module(".lang.format_" + lang, "lingua_franca")
+        checksum = 0
+        for path in (module.__file__,
+                     join(os.path.dirname(module.__file__),
+                          "common_data_" + lang + ".py")):
+            if os.path.isfile(path):
+                with open(path, "rb") as f:
+                    checksum = crc32(f.read(), checksum)
+        return checksum
+
+    @staticmethod
+    def _path(lang, flags):
+        return join(config.nice_time_table_dir, "nice_time_{}_{:08x}.json"
+                    .format(lang, crc32(repr(flags).encode("utf-8"))))
+
+    def _load(self, lang, flags):
+        try:
+            with open(self._path(lang, flags), encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if saved.get("flags") != repr(flags) or \
+                saved.get("source") != self._fingerprint(lang) or \
+                len(saved.get("table", ())) != 1440:
+            return None
+        return saved["table"]
+
+    def _save(self, lang, flags, table):
+        os.makedirs(config.nice_time_table_dir, exist_ok=True)
+        path = self._path(lang, flags)
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump({"flags": repr(flags),
+                       "source": self._fingerprint(lang),
+                       "table": table}, f, ensure_ascii=False)
+        os.replace(path + ".tmp", path)
+
+    def _build(self, func, lang, flags):
+        kwargs = dict(flags)
+        # the first call goes through localized_function(), which checks
+        # (or loads) the language; the rest skip straight to nice_time_<lang>
+        table = [func(self._REFERENCE, lang=lang, **kwargs)]
+        localized = getattr(import_module(".lang.format_" + lang,
+                                          "lingua_franca"),
+                            "nice_time_" + lang)
+        accepted = signature(localized).parameters
+        kwargs = {name: value for name, value in kwargs.items()
+                  if name in accepted}
+        table.extend(localized(self._REFERENCE.replace(hour=minute // 60,
+                                                       minute=minute % 60),
+                               **kwargs)
+                     for minute in range(1, 1440))
+        return table
+
+    def table(self, func, lang, flags):
+        """ The 1440 outputs of func for a language and flags
+
+        Args:
+            func: nice_time(), undecorated by this class
+            lang (str): a primary language code
+            flags (tuple): sorted (name, value) pairs of the other arguments
+
+        Returns:
+            list(str): indexed by minute of the day
+        """
+        key = (lang, flags)
+        table = self._tables.get(key)
+        if table is None:
+            persist = config.nice_time_table_dir is not None
+            table = self._load(lang, flags) if persist else None
+            if table is None:
+                table = self._build(func, lang, flags)
+                if persist:
+                    self._save(lang, flags, table)
+            with self._lock:
+                table = self._tables.setdefault(key, table)
+        return table
+
+    def tabulated(self, func):
+        """Decorator for nice_time(); a no-op unless enabled."""
+        params = tuple(signature(func).parameters)
+
+        @wraps(func)
+        def call_tabulated(*args, **kwargs):
+            if not config.cache_nice_time:
+                return func(*args, **kwargs)
+            # Signature.bind() would cost more than the lookup itself
+            arguments = dict(zip(params, args))
+            if len(args) > len(params) or "dt" not in arguments and \
+                    "dt" not in kwargs or \
+                    any(name in arguments or name not in params
+                        for name in kwargs):
+                return func(*args, **kwargs)
+            arguments.update(kwargs)
+            dt = arguments["dt"]
+            lang = arguments.get("lang", "")
+            if not isinstance(dt, datetime.datetime) or lang is None:
+                return func(*args, **kwargs)
+            # nice_time_<lang> only ever sees the primary language code
+            lang = (lang or get_default_lang()).split("-")[0].lower()
+            if lang not in get_supported_langs():
+                return func(*args, **kwargs)
+            # only the flags actually passed: defaults differ by language
+            flags = tuple(sorted((name, value) for name, value
+                                 in arguments.items()
+                                 if name not in ("dt", "lang")))
+            try:
+                hash(flags)
+            except TypeError:
+                return func(*args, **kwargs)
+            if dt.tzinfo is None and config.inject_timezones:
+                dt = to_local(dt)
+            return self.table(func, lang, flags)[dt.hour * 60 + dt.minute]
+
+        return call_tabulated
+
+
+_nice_time_tables = _NiceTimeTables()
+
+
+def clear_nice_time_tables():
+    """ Drop the in-memory nice_time() tables
+
+    Tables persisted to `lingua_franca.config.nice_time_table_dir` are left
+    in place.
+    """
+    _nice_time_tables.clear()
+
+
+@_nice_time_tables.tabulated
 @localized_function()
 def nice_time(dt, lang='', speech=True, use_24hour=False,
               use_ampm=False, variant=None):
@@ -380,6 +542,62 @@ def nice_year(dt, lang='', bc=False):
     return date_time_format.year_format(dt, full_code, bc)
 
 
+class _TranslatedDurationFormatter(DurationFormatter):
+    """
+    nice_duration() for languages without a nice_duration_<lang>, using
+    pronounce_number() and the unit words from the language's resources
+    """
+
+    def __init__(self, lang):
+        # the trailing space after days is historical, kept for
+        # compatibility: "five days  eighteen hours"
+        super().__init__(day_suffix=" ")
+        self.lang = lang
+        self._words = {unit: (_translate_word(unit, lang),
+                              _translate_word(unit + "s", lang))
+                       for unit in self.UNITS}
+
+    def pronounce(self, unit, number):
+        return pronounce_number(number, self.lang)
+
+    def unit_word(self, unit, number):
+        singular, plural = self._words[unit]
+        return singular if number == 1 else plural
+
+
+_duration_formatters = {}
+
+
+def _get_duration_formatter(lang):
+    """ Get the cached duration formatter for a language code
+
+    Args:
+        lang (str): a language code, full or primary
+
+    Returns:
+        _TranslatedDurationFormatter
+    """
+    formatter = _duration_formatters.get(lang)
+    if formatter is None:
+        full_lang = lang
+        cacheable = True
+        if not is_supported_full_lang(lang):
+            # TODO deprecated; delete when 'lang=None' and 'lang=invalid' are
+            # removed
+            try:
+                full_lang = get_full_lang_code(lang)
+            except UnsupportedLanguageError:
+                warn(InvalidLangWarning)
+                full_lang = get_default_loc()
+                cacheable = False
+        formatter = _duration_formatters.get(full_lang) or \
+            _TranslatedDurationFormatter(full_lang)
+        _duration_formatters[full_lang] = formatter
+        if cacheable:
+            _duration_formatters[lang] = formatter
+    return formatter
+
+
 @localized_function(run_own_code_on=[FunctionNotLocalizedError])
 def nice_duration(duration, lang='', speech=True):
     """ Convert duration in seconds to a nice spoken timespan
@@ -401,14 +619,6 @@ def nice_duration(duration, lang='', speech=True):
         if lang is None:
             warn(NoneLangWarning)
         lang = get_default_loc()
-    if not is_supported_full_lang(lang):
-        # TODO deprecated; delete when 'lang=None' and 'lang=invalid' are
-        # removed
-        try:
-            lang = get_full_lang_code(lang)
-        except UnsupportedLanguageError:
-            warn(InvalidLangWarning)
-            lang = get_default_loc()
 
     if isinstance(duration, datetime.timedelta):
         duration = duration.total_seconds()
@@ -424,38 +634,8 @@ def nice_duration(duration, lang='', speech=True):
     seconds = int(duration % 60)
 
     if speech:
-        out = ""
-        if days > 0:
-            out += pronounce_number(days, lang) + " "
-            if days == 1:
-                out += _translate_word("day", lang)
-            else:
-                out += _translate_word("days", lang)
-            out += " "
-        if hours > 0:
-            if out:
-                out += " "
-            out += pronounce_number(hours, lang) + " "
-            if hours == 1:
-                out += _translate_word("hour", lang)
-            else:
-                out += _translate_word("hours", lang)
-        if minutes > 0:
-            if out:
-                out += " "
-            out += pronounce_number(minutes, lang) + " "
-            if minutes == 1:
-                out += _translate_word("minute", lang)
-            else:
-                out += _translate_word("minutes", lang)
-        if seconds > 0:
-            if out:
-                out += " "
-            out += pronounce_number(seconds, lang) + " "
-            if seconds == 1:
-                out += _translate_word("second", lang)
-            else:
-                out += _translate_word("seconds", lang)
+        out = _get_duration_formatter(lang).format(days, hours, minutes,
+                                                   seconds)
     else:
         # M:SS, MM:SS, H:MM:SS, Dd H:MM:SS format
         out = ""
@@ -504,7 +684,7 @@ def join_list(items, connector, sep=None, lang=''):
             " " + items[-1])
 
 
-def expand_parentheses(sent):
+def expand_parentheses(sent, lazy=False):
     """
     ['1', '(', '2', '|', '3, ')'] -> [['1', '2'], ['1', '3']]
     For example:
@@ -519,26 +699,61 @@ def expand_parentheses(sent):
 
     Args:
         sent (list<str>): List of tokens in sentence
+        lazy (bool): return an iterator, expanding one sentence at a time
 
     Returns:
         list<list<str>>: Multiple possible sentences from original
     """
+    if lazy:
+        return SentenceTreeParser(sent).iter_expand_parentheses()
     return SentenceTreeParser(sent).expand_parentheses()
 
 
-def expand_options(parentheses_line: str) -> list:
+def expand_options(parentheses_line: str, lazy=False, unique=False):
     """
     Convert 'test (a|b)' -> ['test a', 'test b']
 
     Args:
         parentheses_line: Input line to expand
+        lazy (bool): return an iterator instead of a list, so templates
+                     with very many expansions needn't fit in memory
+        unique (bool): drop repeated expansions, keeping the first one
 
     Returns:
         List of expanded possibilities
     """
     # 'a(this|that)b' -> [['a', 'this', 'b'], ['a', 'that', 'b']]
-    options = expand_parentheses(re.split(r'([(|)])', parentheses_line))
-    return [re.sub(r'\s+', ' ', ' '.join(i)).strip() for i in options]
+    options = expand_parentheses(re.split(r'([(|)])', parentheses_line),
+                                 lazy=True)
+    # same as re.sub(r'\s+', ' ', ...).strip()
+    expanded = (' '.join(' '.join(i).split()) for i in options)
+    if unique:
+        expanded = _unique(expanded)
+    return expanded if lazy else list(expanded)
+
+
+def _unique(items):
+    seen = set()
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            yield item
+
+
+def count_expansions(parentheses_line: str) -> int:
+    """
+    Number of expansions expand_options() would return, without expanding
+
+    Repeated expansions are counted each time, as with unique=False.
+
+    Args:
+        parentheses_line: Input line to expand
+
+    Returns:
+        int: number of expanded possibilities
+    """
+    return SentenceTreeParser(re.split(r'([(|)])', parentheses_line)) \
+        .count_expansions()
 
 
 @localized_function()
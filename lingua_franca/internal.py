@@ -1,7 +1,10 @@
 import os.path
+from collections import deque
 from functools import wraps
 from importlib import import_module
 from inspect import signature
+from threading import Lock
+from time import perf_counter
 
 from warnings import warn
 from datetime import datetime
@@ -383,6 +386,113 @@ def __get_full_lang_code_deprecation_warning(lang=''):
         raise UnsupportedLanguageError(lang)
 
 
+class _FunctionStats:
+    """Call statistics for localized functions.
+
+    Enabled by `lingua_franca.config.instrument_functions`. Each call is
+    timed, including any nested localized calls and fallbacks to the
+    wrapped function's own code, and counted under (module, function, lang),
+    with lang reduced to its primary code. Percentiles are computed over
+    the last `lingua_franca.config.instrumentation_samples` calls of each.
+
+    If `lingua_franca.config.instrumentation_hook` is set, it is also called
+    after every call as hook(module, function, lang, seconds, error), where
+    error is the exception raised, or None.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._lock = Lock()
+
+    def call(self, module, function, lang, call, args, kwargs):
+        if isinstance(lang, str) and lang:
+            lang = lang.split('-')[0].lower()
+        else:
+            lang = get_default_lang()
+        error = None
+        start = perf_counter()
+        try:
+            return call(*args, **kwargs)
+        except Exception as e:
+            error = e
+            raise
+        finally:
+            elapsed = perf_counter() - start
+            self._record((module, function, lang), elapsed, error)
+            hook = config.instrumentation_hook
+            if hook is not None:
+                try:
+                    hook(module, function, lang, elapsed, error)
+                except Exception as e:
+                    warn("instrumentation hook failed: {!r}".format(e))
+
+    def _record(self, key, elapsed, error):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = {"calls": 0, "errors": 0,
+                                              "total": 0.0, "max": 0.0,
+                                              "samples": deque()}
+            samples = entry["samples"]
+            if samples.maxlen != config.instrumentation_samples:
+                samples = entry["samples"] = deque(
+                    samples, maxlen=config.instrumentation_samples)
+            entry["calls"] += 1
+            entry["errors"] += error is not None
+            entry["total"] += elapsed
+            entry["max"] = max(entry["max"], elapsed)
+            samples.append(elapsed)
+
+    def snapshot(self):
+        with self._lock:
+            entries = [(key, dict(entry, samples=sorted(entry["samples"])))
+                       for key, entry in self._entries.items()]
+        snapshot = {}
+        for key, entry in entries:
+            samples = entry.pop("samples")
+
+            def percentile(fraction):
+                if not samples:
+                    return None
+                return samples[min(len(samples) - 1,
+                                   int(len(samples) * fraction))]
+            entry["mean"] = entry["total"] / entry["calls"]
+            entry["p50"] = percentile(0.5)
+            entry["p90"] = percentile(0.9)
+            entry["p99"] = percentile(0.99)
+            snapshot[key] = entry
+        return snapshot
+
+    def reset(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_function_stats = _FunctionStats()
+
+
+def get_function_stats():
+    """ Snapshot of the statistics kept for localized functions
+
+    Statistics are only collected while
+    `lingua_franca.config.instrument_functions` is enabled. Times are in
+    seconds.
+
+    Returns:
+        dict: {(module, function, lang): {"calls", "errors", "total",
+               "mean", "max", "p50", "p90", "p99"}}
+
+    Example:
+        get_function_stats()[("parse", "extract_datetime", "cs")]["p99"]
+    """
+    return _function_stats.snapshot()
+
+
+def reset_function_stats():
+    """ Forget all statistics collected for localized functions """
+    _function_stats.reset()
+
+
 def localized_function(run_own_code_on=[type(None)]):
     """
     Decorator which finds localized functions, and calls them, from signatures
@@ -593,9 +703,7 @@ def localized_function(run_own_code_on=[type(None)]):
                 unload_language(lang_code)
             return r_val
 
-        # Actual wrapper
-        @wraps(func)
-        def call_localized_function(*args, **kwargs):
+        def call_with_fallback(*args, **kwargs):
             if run_own_code_on != [type(None)]:
                 try:
                     return _call_localized_function(func, *args, **kwargs)
@@ -606,6 +714,23 @@ def localized_function(run_own_code_on=[type(None)]):
                         raise e
             else:  # don't intercept any exceptions
                 return _call_localized_function(func, *args, **kwargs)
+
+        module_name = func.__module__.split('.')[-1]
+        lang_param_index = list(signature(func).parameters).index('lang')
+
+        # Actual wrapper
+        @wraps(func)
+        def call_localized_function(*args, **kwargs):
+            if config.instrument_functions:
+                if 'lang' in kwargs:
+                    lang = kwargs['lang']
+                elif lang_param_index < len(args):
+                    lang = args[lang_param_index]
+                else:
+                    lang = None
+                return _function_stats.call(module_name, func.__name__, lang,
+                                            call_with_fallback, args, kwargs)
+            return call_with_fallback(*args, **kwargs)
         return call_localized_function
     try:
         return localized_function_decorator
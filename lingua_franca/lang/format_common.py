@@ -15,6 +15,76 @@
 #
 
 
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+
+_FRACTION_ACCURACY = 0.01
+
+
+class _FractionTable:
+    """
+    For a tuple of denominators, which of them can match each stretch of
+    [0, 1] in convert_to_mixed_fraction()
+
+    Denominator d matches a fraction f when f * d is within 0.01 of a whole
+    number k, i.e. when f lies within 0.01 / d of k / d. Those intervals are
+    slightly widened, cut into segments at their boundaries, and each
+    segment keeps the denominators covering it in the caller's order. A
+    lookup is then a bisect and the original test on the one or two
+    denominators found there, which keeps the first-match results exact.
+
+    Args:
+        denominators (tuple of int): positive denominators, in priority order
+    """
+    _SLACK = 1e-9
+
+    def __init__(self, denominators):
+        intervals = []
+        for priority, denominator in enumerate(denominators):
+            reach = _FRACTION_ACCURACY / denominator + self._SLACK
+            for numerator in range(denominator + 1):
+                center = numerator / denominator
+                intervals.append((center - reach, center + reach, priority))
+        self.bounds = sorted({bound for interval in intervals
+                              for bound in interval[:2]})
+        covering = [[] for _ in self.bounds]
+        for low, high, priority in intervals:
+            for segment in range(bisect_left(self.bounds, low),
+                                 bisect_left(self.bounds, high)):
+                covering[segment].append(priority)
+        self.candidates = [tuple(denominators[priority]
+                                 for priority in sorted(set(priorities)))
+                           for priorities in covering]
+
+    def lookup(self, fraction):
+        """ First denominator matching 0 <= fraction < 1
+
+        Returns:
+            (numerator, denominator), numerator unrounded, or None
+        """
+        segment = bisect_right(self.bounds, fraction) - 1
+        if segment < 0:
+            return None
+        for denominator in self.candidates[segment]:
+            numerator = fraction * denominator
+            if abs(numerator - round(numerator)) < _FRACTION_ACCURACY:
+                return numerator, denominator
+        return None
+
+
+_DEFAULT_DENOMINATORS = range(1, 21)
+_DEFAULT_FRACTIONS = _FractionTable(tuple(_DEFAULT_DENOMINATORS))
+
+
+@lru_cache(maxsize=16)
+def _fraction_table(denominators):
+    """ Cached _FractionTable, or None where one would grow too big """
+    if len(denominators) > 64 or \
+            not all(isinstance(d, int) and 0 < d <= 100 for d in denominators):
+        return None
+    return _FractionTable(denominators)
+
+
 def convert_to_mixed_fraction(number, denominators=range(1, 21)):
     """
     Convert floats to components of a mixed fraction representation
@@ -35,13 +105,139 @@ def convert_to_mixed_fraction(number, denominators=range(1, 21)):
 
     frac_number = abs(number - int_number)
     if not denominators:
-        denominators = range(1, 21)
+        denominators = _DEFAULT_DENOMINATORS
 
-    for denominator in denominators:
-        numerator = abs(frac_number) * denominator
-        if abs(numerator - round(numerator)) < 0.01:  # 0.01 accuracy
-            break
+    if isinstance(denominators, range) and \
+            denominators == _DEFAULT_DENOMINATORS:
+        match = _DEFAULT_FRACTIONS.lookup(frac_number)
     else:
+        denominators = tuple(denominators)
+        try:
+            table = _fraction_table(denominators)
+        except TypeError:  # unhashable denominators
+            table = None
+        if table is not None:
+            match = table.lookup(frac_number)
+        else:
+            match = None
+            for denominator in denominators:
+                numerator = frac_number * denominator
+                if abs(numerator - round(numerator)) < _FRACTION_ACCURACY:
+                    match = numerator, denominator
+                    break
+    if match is None:
         return None
 
+    numerator, denominator = match
     return int_number, int(round(numerator)), denominator
+
+
+class DurationFormatter:
+    """
+    Speaks durations as "<number> <unit> <number> <unit>...", for one locale
+
+    Each "<number> <unit>" part is built once and cached for values below
+    60, so formatting a duration is a handful of dict lookups and a join.
+    Subclasses provide the number pronunciation and the unit word, which
+    may depend on the number (singular and plural forms).
+
+    Args:
+        day_suffix (str): appended to the days part
+    """
+    UNITS = ("day", "hour", "minute", "second")
+
+    def __init__(self, day_suffix=""):
+        self.day_suffix = day_suffix
+        self._parts = {}
+
+    def pronounce(self, unit, number):
+        """ Spoken form of a number of units """
+        raise NotImplementedError
+
+    def unit_word(self, unit, number):
+        """ The word for a unit, in the right form for the number """
+        raise NotImplementedError
+
+    def part(self, unit, number):
+        """ "<number> <unit>", e.g. "two minutes" """
+        part = self._parts.get((unit, number))
+        if part is None:
+            part = self.pronounce(unit, number) + " " + \
+                self.unit_word(unit, number)
+            if number < 60:
+                self._parts[(unit, number)] = part
+        return part
+
+    def format(self, days, hours, minutes, seconds):
+        """ Speak the non-zero units
+
+        Args:
+            days, hours, minutes, seconds (int): the duration, split up
+
+        Returns:
+            str: timespan as a string
+        """
+        parts = []
+        if days > 0:
+            parts.append(self.part("day", days) + self.day_suffix)
+        if hours > 0:
+            parts.append(self.part("hour", hours))
+        if minutes > 0:
+            parts.append(self.part("minute", minutes))
+        if seconds > 0:
+            parts.append(self.part("second", seconds))
+        return " ".join(parts)
+
+
+class ResponseSanitizer:
+    """
+    Makes a response speakable, in one pass over its words
+
+    "^" before a number is replaced with the words for "to the power of",
+    and a day number before a month with its spoken ordinal. Each word is
+    looked at once, with the word after it and the word before it, as
+    already replaced. Subclasses provide the ordinal, whose form may depend
+    on the word in front of it.
+
+    Args:
+        months (iter(str)): lowercase month names
+        power (str): the words for "to the power of"
+    """
+
+    def __init__(self, months, power):
+        self.months = frozenset(months)
+        self.power = power
+
+    def ordinal(self, word, previous):
+        """ Spoken ordinal of a day number written before a month
+
+        Args:
+            word (str): the word before the month
+            previous (str): the word before that, "" at the start
+
+        Returns:
+            str: the ordinal, or None if the word isn't a day number
+        """
+        raise NotImplementedError
+
+    def sanitize(self, text):
+        """ The speakable response, or the text itself if nothing changed """
+        words = text.split()
+        last = len(words) - 1
+        spoken = []
+        previous = ""
+        changed = False
+        for idx, word in enumerate(words):
+            if idx < last:
+                following = words[idx + 1]
+                if word == "^" and following.isnumeric():
+                    word = self.power
+                    changed = True
+                elif following.lower() in self.months:
+                    ordinal = self.ordinal(word, previous)
+                    if ordinal is not None:
+                        word = ordinal
+                        changed = True
+            spoken.append(word)
+            previous = word.rpartition(" ")[2]
+        return " ".join(spoken) if changed else text
@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    ResponseSanitizer
 from lingua_franca.lang.common_data_da import _EXTRA_SPACE_DA, \
     _FRACTION_STRING_DA, _MONTHS_DA, _NUM_POWERS_OF_TEN, _NUM_STRING_DA
 from math import floor
@@ -299,41 +300,24 @@ def nice_time_da(dt, speech=True, use_24hour=False, use_ampm=False):
         return speak
 
 
+class _ResponseSanitizerDa(ResponseSanitizer):
+    """ Ordinals before months take "n" after a preposition or "den",
+    "r" otherwise """
+    _PREPOSITIONS = frozenset(["om", "den", "fra", "til", "(fra", "(om"])
+
+    def ordinal(self, word, previous):
+        if word[-1:] != "." or not word[:-1].isdecimal():
+            return None
+        ordinal = pronounce_ordinal_da(int(word[:-1]))
+        if previous.lower() in self._PREPOSITIONS:
+            return ordinal + "n"
+        return ordinal + "r"
+
+
+_RESPONSE_SANITIZER_DA = _ResponseSanitizerDa(_MONTHS_DA, "opløftet i")
+
+
 def nice_response_da(text):
-    # check for months and call _nice_ordinal_da declension of ordinals
-    # replace "^" with "hoch" (to the power of)
-    words = text.split()
-
-    for idx, word in enumerate(words):
-        if word.lower() in _MONTHS_DA:
-            text = _nice_ordinal_da(text)
-
-        if word == '^':
-            wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-            if wordNext.isnumeric():
-                words[idx] = "opløftet i"
-                text = " ".join(words)
-    return text
-
-
-def _nice_ordinal_da(text, speech=True):
-    # check for months for declension of ordinals before months
-    # depending on articles/prepositions
-    normalized_text = text
-    words = text.split()
-
-    for idx, word in enumerate(words):
-        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-        wordPrev = words[idx - 1] if idx > 0 else ""
-        if word[-1:] == ".":
-            if word[:-1].isdecimal():
-                if wordNext.lower() in _MONTHS_DA:
-                    word = pronounce_ordinal_da(int(word[:-1]))
-                    if wordPrev.lower() in ["om", "den", "fra", "til",
-                                            "(fra", "(om", "til"]:
-                        word += "n"
-                    elif wordPrev.lower() not in ["den"]:
-                        word += "r"
-                    words[idx] = word
-            normalized_text = " ".join(words)
-    return normalized_text
+    # decline ordinals before months, depending on articles/prepositions
+    # replace "^" with "opløftet i" (to the power of)
+    return _RESPONSE_SANITIZER_DA.sanitize(text)
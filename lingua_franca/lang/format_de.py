@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    ResponseSanitizer
 from lingua_franca.lang.common_data_de import _EXTRA_SPACE_DE, \
     _FRACTION_STRING_DE, _MONTHS_DE, _NUM_POWERS_OF_TEN_DE, _NUM_STRING_DE
 from math import floor
@@ -287,41 +288,28 @@ def nice_time_de(dt, speech=True, use_24hour=False, use_ampm=False):
         return speak
 
 
+class _ResponseSanitizerDe(ResponseSanitizer):
+    """ "am 31. mai" -> "am einunddreißigsten mai", "der 31. mai" -> "der
+    einunddreißigste mai", otherwise "ein einunddreißigster mai" """
+    _PREPOSITIONS = frozenset(["am", "dem", "vom", "zum", "(vom", "(am"])
+    _ARTICLES = frozenset(["der", "die", "das"])
+
+    def ordinal(self, word, previous):
+        if word[-1:] != "." or not word[:-1].isdecimal():
+            return None
+        ordinal = pronounce_ordinal_de(int(word[:-1]))
+        previous = previous.lower()
+        if previous in self._PREPOSITIONS:
+            return ordinal + "n"
+        if previous not in self._ARTICLES:
+            return ordinal + "r"
+        return ordinal
+
+
+_RESPONSE_SANITIZER_DE = _ResponseSanitizerDe(_MONTHS_DE, "hoch")
+
+
 def nice_response_de(text):
-    # check for months and call _nice_ordinal_de declension of ordinals
+    # decline ordinals before months, depending on articles/prepositions
     # replace "^" with "hoch" (to the power of)
-    words = text.split()
-
-    for idx, word in enumerate(words):
-        if word.lower() in _MONTHS_DE:
-            text = _nice_ordinal_de(text)
-
-        if word == '^':
-            wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-            if wordNext.isnumeric():
-                words[idx] = "hoch"
-                text = " ".join(words)
-    return text
-
-
-def _nice_ordinal_de(text, speech=True):
-    # check for months for declension of ordinals before months
-    # depending on articles/prepositions
-    normalized_text = text
-    words = text.split()
-
-    for idx, word in enumerate(words):
-        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-        wordPrev = words[idx - 1] if idx > 0 else ""
-        if word[-1:] == ".":
-            if word[:-1].isdecimal():
-                if wordNext.lower() in _MONTHS_DE:
-                    word = pronounce_ordinal_de(int(word[:-1]))
-                    if wordPrev.lower() in ["am", "dem", "vom", "zum",
-                                            "(vom", "(am", "zum"]:
-                        word += "n"
-                    elif wordPrev.lower() not in ["der", "die", "das"]:
-                        word += "r"
-                    words[idx] = word
-            normalized_text = " ".join(words)
-    return normalized_text
+    return _RESPONSE_SANITIZER_DE.sanitize(text)
@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from .format_common import convert_to_mixed_fraction
+from .format_common import convert_to_mixed_fraction, \
+    ResponseSanitizer
 from lingua_franca.lang.common_data_nl import _NUM_POWERS_OF_TEN, \
     _NUM_STRING_NL, _FRACTION_STRING_NL, _EXTRA_SPACE_NL, _MONTHS_NL
 from math import floor
@@ -301,37 +302,22 @@ def nice_part_of_day_nl(dt, speech=True):
     raise ValueError('dt.hour is bigger than 24')
 
 
+class _ResponseSanitizerNl(ResponseSanitizer):
+    """ "de 31 mei" -> "de éénendertigste mei", "op 31 mei" -> "op
+    éénendertig mei" """
+
+    def ordinal(self, word, previous):
+        if not word.isdecimal():
+            return None
+        if previous == 'de':
+            return pronounce_ordinal_nl(int(word))
+        return pronounce_number_nl(int(word))
+
+
+_RESPONSE_SANITIZER_NL = _ResponseSanitizerNl(_MONTHS_NL, "tot de macht")
+
+
 def nice_response_nl(text):
-    # check for months and call _nice_ordinal_nl declension of ordinals
+    # read numbers before months as dates
     # replace "^" with "tot de macht" (to the power of)
-    words = text.split()
-
-    for idx, word in enumerate(words):
-        if word.lower() in _MONTHS_NL:
-            text = _nice_ordinal_nl(text)
-
-        if word == '^':
-            wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-            if wordNext.isnumeric():
-                words[idx] = "tot de macht"
-                text = " ".join(words)
-    return text
-
-
-def _nice_ordinal_nl(text, speech=True):
-    # check for months for declension of ordinals before months
-    # depending on articles/prepositions
-    normalized_text = text
-    words = text.split()
-    for idx, word in enumerate(words):
-        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-        wordPrev = words[idx - 1] if idx > 0 else ""
-        if word[:-1].isdecimal():
-            if wordNext.lower() in _MONTHS_NL:
-                if wordPrev == 'de':
-                    word = pronounce_ordinal_nl(int(word))
-                else:
-                    word = pronounce_number_nl(int(word))
-                words[idx] = word
-    normalized_text = " ".join(words)
-    return normalized_text
+    return _RESPONSE_SANITIZER_NL.sanitize(text)
@@ -15,7 +15,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    DurationFormatter
 from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
     _FRACTION_STRING_PL, _SHORT_SCALE_PL, _SHORT_ORDINAL_PL, _ALT_ORDINALS_PL
 from lingua_franca.internal import FunctionNotLocalizedError
@@ -298,51 +299,39 @@ def nice_duration_pl(duration, speech=True):
     minutes = int(duration // 60 % 60)
     seconds = int(duration % 60)
 
-    out = ''
-    sec_main, sec_div = divmod(seconds, 10)
-    min_main, min_div = divmod(minutes, 10)
-    hour_main, hour_div = divmod(hours, 10)
-
-    if days > 0:
-        out += pronounce_number_pl(days) + " "
-        if days == 1:
-            out += 'dzień'
-        else:
-            out += 'dni'
-    if hours > 0:
-        if out:
-            out += " "
-        out += get_pronounce_number_for_duration(hours) + " "
-        if hours == 1:
-            out += 'godzina'
-        elif hour_main == 1 or hour_div > 4:
-            out += 'godzin'
-        else:
-            out += 'godziny'
-    if minutes > 0:
-        if out:
-            out += " "
-        out += get_pronounce_number_for_duration(minutes) + " "
-        if minutes == 1:
-            out += 'minuta'
-        elif min_main == 1 or min_div > 4:
-            out += 'minut'
-        else:
-            out += 'minuty'
-    if seconds > 0:
-        if out:
-            out += " "
-        out += get_pronounce_number_for_duration(seconds) + " "
-        if sec_div == 0:
-            out += 'sekund'
-        elif seconds == 1:
-            out += 'sekunda'
-        elif sec_main == 1 or sec_div > 4:
-            out += 'sekund'
-        else:
-            out += 'sekundy'
-
-    return out
+    return _DURATION_FORMATTER_PL.format(days, hours, minutes, seconds)
+
+
+class _DurationFormatterPl(DurationFormatter):
+    """ Polish duration units; hours, minutes and seconds are feminine """
+    _FORMS = {
+        # unit: (one, few, many)
+        "day": ('dzień', 'dni', 'dni'),
+        "hour": ('godzina', 'godziny', 'godzin'),
+        "minute": ('minuta', 'minuty', 'minut'),
+        "second": ('sekunda', 'sekundy', 'sekund'),
+    }
+
+    def pronounce(self, unit, number):
+        if unit == "day":
+            return pronounce_number_pl(number)
+        return get_pronounce_number_for_duration(number)
+
+    def unit_word(self, unit, number):
+        one, few, many = self._FORMS[unit]
+        tens, ones = divmod(number, 10)
+        if unit == "second" and ones == 0:
+            return many
+        if number == 1:
+            return one
+        if unit == "day":
+            return few
+        if tens == 1 or ones > 4:
+            return many
+        return few
+
+
+_DURATION_FORMATTER_PL = _DurationFormatterPl()
 
 
 def get_pronounce_number_for_duration(num):
@@ -15,7 +15,8 @@
 # limitations under the License.
 #
 
-from lingua_franca.lang.format_common import convert_to_mixed_fraction
+from lingua_franca.lang.format_common import convert_to_mixed_fraction, \
+    DurationFormatter
 from lingua_franca.lang.common_data_ru import _NUM_STRING_RU, \
     _FRACTION_STRING_RU, _LONG_SCALE_RU, _SHORT_SCALE_RU, _SHORT_ORDINAL_RU, _LONG_ORDINAL_RU
 from lingua_franca.internal import FunctionNotLocalizedError
@@ -421,28 +422,29 @@ def nice_duration_ru(duration, speech=True):
     minutes = int(duration // 60 % 60)
     seconds = int(duration % 60)
 
-    out = ''
-
-    if days > 0:
-        out += pronounce_number_ru(days)
-        out += " " + plural_ru(days, "день", "дня", "дней")
-    if hours > 0:
-        if out:
-            out += " "
-        out += pronounce_number_ru(hours)
-        out += " " + plural_ru(hours, "час", "часа", "часов")
-    if minutes > 0:
-        if out:
-            out += " "
-        out += pronounce_number_feminine_ru(minutes)
-        out += " " + plural_ru(minutes, "минута", "минуты", "минут")
-    if seconds > 0:
-        if out:
-            out += " "
-        out += pronounce_number_feminine_ru(seconds)
-        out += " " + plural_ru(seconds, "секунда", "секунды", "секунд")
-
-    return out
+    return _DURATION_FORMATTER_RU.format(days, hours, minutes, seconds)
+
+
+class _DurationFormatterRu(DurationFormatter):
+    """ Russian duration units; minutes and seconds are feminine """
+    _FORMS = {
+        # unit: (one, few, many)
+        "day": ("день", "дня", "дней"),
+        "hour": ("час", "часа", "часов"),
+        "minute": ("минута", "минуты", "минут"),
+        "second": ("секунда", "секунды", "секунд"),
+    }
+
+    def pronounce(self, unit, number):
+        if unit in ("minute", "second"):
+            return pronounce_number_feminine_ru(number)
+        return pronounce_number_ru(number)
+
+    def unit_word(self, unit, number):
+        return plural_ru(number, *self._FORMS[unit])
+
+
+_DURATION_FORMATTER_RU = _DurationFormatterRu()
 
 
 def pronounce_hour_ru(num):
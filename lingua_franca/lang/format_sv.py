@@ -14,7 +14,8 @@
 # limitations under the License.
 #
 
-from .format_common import convert_to_mixed_fraction
+from .format_common import convert_to_mixed_fraction, \
+    ResponseSanitizer
 from lingua_franca.lang.common_data_sv import _EXTRA_SPACE_SV, \
     _FRACTION_STRING_SV, _MONTHS_SV, _NUM_POWERS_OF_TEN_SV, _NUM_STRING_SV
 from math import floor
@@ -336,41 +337,24 @@ def nice_time_sv(dt, speech=True, use_24hour=False, use_ampm=False):
         return speak
 
 
+class _ResponseSanitizerSv(ResponseSanitizer):
+    """ Ordinals before months take "n" after a preposition or "den",
+    "r" otherwise """
+    _PREPOSITIONS = frozenset(["om", "den", "från", "till", "(från", "(om"])
+
+    def ordinal(self, word, previous):
+        if word[-1:] != "." or not word[:-1].isdecimal():
+            return None
+        ordinal = pronounce_ordinal_sv(int(word[:-1]))
+        if previous.lower() in self._PREPOSITIONS:
+            return ordinal + "n"
+        return ordinal + "r"
+
+
+_RESPONSE_SANITIZER_SV = _ResponseSanitizerSv(_MONTHS_SV, "upphöjt till")
+
+
 def nice_response_sv(text):
-    # check for months and call _nice_ordinal_sv declension of ordinals
-    # replace "^" with "hoch" (to the power of)
-    words = text.split()
-
-    for idx, word in enumerate(words):
-        if word.lower() in _MONTHS_SV:
-            text = _nice_ordinal_sv(text)
-
-        if word == '^':
-            wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-            if wordNext.isnumeric():
-                words[idx] = "upphöjt till"
-                text = " ".join(words)
-    return text
-
-
-def _nice_ordinal_sv(text, speech=True):
-    # check for months for declension of ordinals before months
-    # depending on articles/prepositions
-    normalized_text = text
-    words = text.split()
-
-    for idx, word in enumerate(words):
-        wordNext = words[idx + 1] if idx + 1 < len(words) else ""
-        wordPrev = words[idx - 1] if idx > 0 else ""
-        if word[-1:] == ".":
-            if word[:-1].isdecimal():
-                if wordNext.lower() in _MONTHS_SV:
-                    word = pronounce_ordinal_sv(int(word[:-1]))
-                    if wordPrev.lower() in ["om", "den", "från", "till",
-                                            "(från", "(om", "till"]:
-                        word += "n"
-                    elif wordPrev.lower() not in ["den"]:
-                        word += "r"
-                    words[idx] = word
-            normalized_text = " ".join(words)
-    return normalized_text
+    # decline ordinals before months, depending on articles/prepositions
+    # replace "^" with "upphöjt till" (to the power of)
+    return _RESPONSE_SANITIZER_SV.sanitize(text)
@@ -28,7 +28,7 @@ from lingua_franca.lang.common_data_ca import _NUMBERS_CA, \
     _MALE_DETERMINANTS_CA, _MALE_ENDINGS_CA, _GENDERS_CA, \
     _TENS_CA, _AFTER_TENS_CA, _HUNDREDS_CA, _BEFORE_HUNDREDS_CA
 from lingua_franca.internal import resolve_resource_file
-from lingua_franca.lang.parse_common import Normalizer
+from lingua_franca.lang.parse_common import Normalizer, GenderResolver
 import json
 import re
 
@@ -1087,6 +1087,15 @@ def _ca_pruning(text, symbols=True, accents=False, agressive=True):
     return text
 
 
+# in Catalan usually the previous word (a determinant) assigns gender to
+# the next word; the last vowel usually doesn't define it
+_GENDER_RESOLVER_CA = GenderResolver(
+    [("f", _FEMALE_ENDINGS_CA), ("m", _MALE_ENDINGS_CA)], _GENDERS_CA,
+    {**dict.fromkeys(_FEMALE_DETERMINANTS_CA, "f"),
+     **dict.fromkeys(_MALE_DETERMINANTS_CA, "m")},
+    lowercase=True)
+
+
 def get_gender_ca(word, context=""):
     """ Guess the gender of a word
 
@@ -1101,32 +1110,17 @@ def get_gender_ca(word, context=""):
         str: The code "m" (male), "f" (female) or "n" (neutral) for the gender,
              or None if unknown/or unused in the given language.
     """
-    # parse gender taking context into account
-    word = word.lower()
-    words = context.lower().split(" ")
-    for idx, w in enumerate(words):
-        if w == word and idx != 0:
-            # in Catalan usually the previous word (a determinant)
-            # assigns gender to the next word
-            previous = words[idx - 1].lower()
-            if previous in _MALE_DETERMINANTS_CA:
-                return "m"
-            elif previous in _FEMALE_DETERMINANTS_CA:
-                return "f"
-
-    # get gender using only the individual word
-    # see if this word has the gender defined
-    if word in _GENDERS_CA:
-        return _GENDERS_CA[word]
-    singular = word.rstrip("s")
-    if singular in _GENDERS_CA:
-        return _GENDERS_CA[singular]
-    # in Catalan the last vowel usually dosn't defines the gender of a word
-    # the gender of the determinant takes precedence over this rule
-    for end_str in _FEMALE_ENDINGS_CA:
-        if word.endswith(end_str):
-            return "f"
-    for end_str in _MALE_ENDINGS_CA:
-        if word.endswith(end_str):
-            return "m"
-    return None
+    return _GENDER_RESOLVER_CA.get_gender(word, context)
+
+
+def get_genders_ca(words, context=""):
+    """ Guess the gender of several words from the same context
+
+    Args:
+        words (list(str)): The words to look up
+        context (str, optional): String containing the words, for context
+
+    Returns:
+        list(str): get_gender_ca() of each word
+    """
+    return _GENDER_RESOLVER_CA.get_genders(words, context)
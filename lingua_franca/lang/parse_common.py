@@ -14,8 +14,22 @@
 # limitations under the License.
 #
 from collections import namedtuple
+from datetime import timedelta
+from functools import lru_cache
 import re
 
+from lingua_franca.time import now_local
+
+
+# Normalizer.tokenize splits words on whitespace, and further splits "12%"
+# into "12 %" and "#1" into "# 1". Words without "#" or "%" are read in one
+# go. Others are read as runs of letters, of digits not followed by "%",
+# and of "#" not followed by a number, and may end with the digits or "#"
+# such a split happens after.
+_TOKEN_REGEX = re.compile(r"[^\s#%]+(?!\S)|(?=\S)"
+                          r"(?:[^\s#0-9]+|\#(?![0-9]+\b)|[0-9]+(?![0-9%]))*"
+                          r"(?:\#(?=[0-9]+\b)|[0-9]+(?=%))?")
+
 
 class Normalizer:
     """
@@ -30,11 +44,8 @@ class Normalizer:
 
     @staticmethod
     def tokenize(utterance):
-        # Split things like 12%
-        utterance = re.sub(r"([0-9]+)([\%])", r"\1 \2", utterance)
-        # Split thins like #1
-        utterance = re.sub(r"(\#)([0-9]+\b)", r"\1 \2", utterance)
-        return utterance.split()
+        # Split on whitespace, and split things like 12% and #1
+        return _TOKEN_REGEX.findall(utterance)
 
     @property
     def should_lowercase(self):
@@ -206,9 +217,12 @@ class ReplaceableNumber:
     the string.
     """
 
+    __slots__ = ("value", "tokens", "_text")
+
     def __init__(self, value, tokens: [Token]):
-        self.value = value
-        self.tokens = tokens
+        object.__setattr__(self, "value", value)
+        object.__setattr__(self, "tokens", tokens)
+        object.__setattr__(self, "_text", None)
 
     def __bool__(self):
         return bool(self.value is not None and self.value is not False)
@@ -223,15 +237,13 @@ class ReplaceableNumber:
 
     @property
     def text(self):
-        return ' '.join([t.word for t in self.tokens])
+        if self._text is None:
+            object.__setattr__(self, "_text",
+                               ' '.join([t.word for t in self.tokens]))
+        return self._text
 
     def __setattr__(self, key, value):
-        try:
-            getattr(self, key)
-        except AttributeError:
-            super().__setattr__(key, value)
-        else:
-            raise Exception("Immutable!")
+        raise Exception("Immutable!")
 
     def __str__(self):
         return "({v}, {t})".format(v=self.value, t=self.tokens)
@@ -252,7 +264,204 @@ def tokenize(text):
 
     """
     return [Token(word, index)
-            for index, word in enumerate(Normalizer.tokenize(text))]
+            for index, word in enumerate(_TOKEN_REGEX.findall(text))]
+
+
+def iter_tokens(text):
+    """
+    Split a string as tokenize does, keeping where each word was read from.
+
+    The string is read once, by a single regex, without rewriting it first.
+
+    Args:
+        text str: Text to tokenize.
+
+    Yields:
+        (str, int, int, int): the word, its index, and the offsets of its
+            first character and just past its last one in text
+    """
+    for index, match in enumerate(_TOKEN_REGEX.finditer(text)):
+        yield match.group(), index, match.start(), match.end()
+
+
+class Span:
+    """
+    A range of words in a TokenStream, from first to last inclusive.
+
+    Only the indices are kept; the words and the characters they cover
+    are read from the stream when asked for.
+    """
+    __slots__ = ("stream", "first", "last")
+
+    def __init__(self, stream, first, last):
+        self.stream = stream
+        self.first = first
+        self.last = last
+
+    @property
+    def start(self):
+        """ offset of the first character of the span in the text """
+        return self.stream.starts[self.first]
+
+    @property
+    def end(self):
+        """ offset just past the last character of the span in the text """
+        return self.stream.ends[self.last]
+
+    @property
+    def words(self):
+        return self.stream.words[self.first:self.last + 1]
+
+    @property
+    def text(self):
+        """ the span as written in the original text """
+        return self.stream.text[self.start:self.end]
+
+    def __len__(self):
+        return self.last - self.first + 1
+
+    def __repr__(self):
+        return "{n}({f}, {l}, {t!r})".format(n=self.__class__.__name__,
+                                             f=self.first, l=self.last,
+                                             t=self.text)
+
+
+class TokenStream:
+    """
+    The words of a text, with where each was read from.
+
+    Words and their character offsets are kept in parallel lists, rather
+    than as one object per word, and parts of the stream are referred to
+    by Span, without copying the words.
+
+    Args:
+        text str: the text to split, as tokenize does
+    """
+    __slots__ = ("text", "words", "starts", "ends")
+
+    def __init__(self, text):
+        self.text = text
+        self.words = []
+        self.starts = []
+        self.ends = []
+        for match in _TOKEN_REGEX.finditer(text):
+            self.words.append(match.group())
+            self.starts.append(match.start())
+            self.ends.append(match.end())
+
+    def __len__(self):
+        return len(self.words)
+
+    def tokens(self):
+        """
+        The words of the stream as Tokens, for the number parsers.
+
+        Returns:
+            [Token]
+        """
+        return [Token(word, index) for index, word in enumerate(self.words)]
+
+    def span(self, first, last=None):
+        """
+        Refer to the words first to last, inclusive.
+
+        Args:
+            first int: index of the first word
+            last int: index of the last word, first if None
+
+        Returns:
+            Span
+        """
+        return Span(self, first, first if last is None else last)
+
+
+def extract_numbers_with_text(tokens, extract_number,
+                              placeholder="<placeholder>"):
+    """
+    Extract all numbers from a list of Tokens, with the words that
+    represent them.
+
+    extract_number is called until it finds no more numbers. The tokens of
+    each number found are then replaced by a placeholder, keeping their
+    index, so the next call does not see them again. This is done in place
+    on one copy of the list, taken after the first number is found.
+
+    Args:
+        tokens [Token]: The tokens to parse.
+        extract_number callable: finds the first number in a list of
+            tokens, as a ReplaceableNumber
+
+    Returns:
+        [ReplaceableNumber]: the numbers found, sorted by start index
+    """
+    results = []
+    to_replace = extract_number(tokens)
+    if to_replace:
+        tokens = list(tokens)
+    while to_replace:
+        results.append(to_replace)
+        start, end = to_replace.start_index, to_replace.end_index
+        for position, token in enumerate(tokens):
+            if start <= token.index <= end:
+                tokens[position] = Token(placeholder, token.index)
+        to_replace = extract_number(tokens)
+    results.sort(key=lambda n: n.start_index)
+    return results
+
+
+def extract_number_values(text, extract_numbers, spans=False):
+    """
+    Extract the values of all the numbers in a text, and optionally where
+    each was read from.
+
+    Args:
+        text str: the text to extract numbers from
+        extract_numbers callable: finds all the numbers in a list of
+            tokens, as extract_numbers_with_text does
+        spans bool: return the offsets of each number in text too
+
+    Returns:
+        [float]: the values of the numbers, or with spans
+        [(float, int, int)]: each value, with the offsets of its first
+            character and just past its last one in text
+    """
+    stream = TokenStream(text)
+    numbers = extract_numbers(stream.tokens())
+    if not spans:
+        return [float(number.value) for number in numbers]
+    return [(float(number.value), stream.starts[number.start_index],
+             stream.ends[number.end_index]) for number in numbers]
+
+
+def convert_words_to_numbers(text, extract_numbers):
+    """
+    Convert words in a string into their equivalent numbers.
+
+    Args:
+        text str: the text to convert
+        extract_numbers callable: finds all the numbers in a list of
+            tokens, as extract_numbers_with_text does
+
+    Returns:
+        str
+        The original text, with numbers subbed in where appropriate.
+    """
+    tokens = TokenStream(text).tokens()
+    numbers = extract_numbers(tokens)
+    numbers.sort(key=lambda number: number.start_index)
+    results = []
+    position = 0
+    for token in tokens:
+        if position == len(numbers) or \
+                token.index < numbers[position].start_index:
+            results.append(token.word)
+        else:
+            number = numbers[position]
+            if token.index == number.start_index:
+                results.append(str(number.value))
+            if token.index == number.end_index:
+                position += 1
+    return ' '.join(results)
 
 
 def partition_list(items, split_on):
@@ -285,6 +494,40 @@ def partition_list(items, split_on):
     return list(filter(lambda x: len(x) != 0, splits))
 
 
+def partition_tokens(tokens, word):
+    """
+    Partition a list of Tokens on the ones reading word, as
+    partition_list(tokens, lambda t: t.word == word) does, where that
+    gives three partitions.
+
+    The number parsers only use partitions around a single marker, so the
+    partitions are located as slices first, and the tokens only copied
+    into them when there are three.
+
+    Args:
+        tokens [Token]: the tokens to partition
+        word str: the word to split on
+
+    Returns:
+        [[Token]]: the three partitions, or [] if there are more or fewer
+    """
+    slices = []
+    start = 0
+    for position, token in enumerate(tokens):
+        if token.word == word:
+            if start < position:
+                slices.append(slice(start, position))
+            slices.append(slice(position, position + 1))
+            start = position + 1
+            if len(slices) > 3:
+                return []
+    if start < len(tokens):
+        slices.append(slice(start, len(tokens)))
+    if len(slices) != 3:
+        return []
+    return [tokens[part] for part in slices]
+
+
 def invert_dict(original):
     """
     Produce a dictionary with the keys and values
@@ -300,6 +543,377 @@ def invert_dict(original):
     return {value: key for key, value in original.items()}
 
 
+def compile_inflections(tables, shared=()):
+    """
+    Compile inflection tables into a single lookup dict.
+
+    Inflection normalizers take a word and the context ("arg") they are
+    called from, and map known inflected forms onto one lemma. Compiling
+    the tables up front turns each normalization into one dict lookup.
+
+    Args:
+        tables dict: {arg: [(lemma, [inflected forms])]}. Where a form
+            appears more than once for an arg, the first entry wins.
+        shared list: [(lemma, [inflected forms])] applying to every arg,
+            taking precedence over that arg's own table
+
+    Returns:
+        dict: {(arg, inflected form): lemma}
+
+    """
+    lemmas = {}
+    for arg, entries in tables.items():
+        for lemma, forms in list(shared) + list(entries):
+            for form in forms:
+                lemmas.setdefault((arg, form), lemma)
+    return lemmas
+
+
+class CompoundNumeralParser:
+    """
+    Reads numerals written as one word, such as the Italian
+    "centottomiladuecentotredici" or the German "dreiundzwanzigtausend".
+
+    The word is split into morphemes using a radix trie, taking the
+    longest morpheme at each position that still lets the rest of the word
+    split. Longest first makes "diciotto" one morpheme rather than "dici"
+    plus "otto"; falling back to shorter ones lets "centottanta" split into
+    "cent" plus "ottanta" even though "cento" matches first.
+
+    Each morpheme either adds its value, multiplies everything since the
+    last larger multiplier (so "cento" in "duecentomila" multiplies "due",
+    and "mila" then multiplies "duecento"), or is a filler worth nothing,
+    like the German "und".
+
+    Args:
+        values dict: {morpheme: value} for the additive morphemes
+        multipliers dict: {morpheme: value} for the multiplying ones,
+            e.g. {"cento": 100, "mila": 1000}
+        fillers list: morphemes which only join the others
+    """
+    _END = ""  # trie key marking the end of a morpheme
+
+    def __init__(self, values, multipliers, fillers=()):
+        trie = {}
+        for morpheme, value in values.items():
+            self._add(trie, morpheme, (morpheme, value, False))
+        for morpheme, value in multipliers.items():
+            self._add(trie, morpheme, (morpheme, value, True))
+        for morpheme in fillers:
+            self._add(trie, morpheme, (morpheme, None, False))
+        self._trie = self._compress(trie)
+
+    @classmethod
+    def _add(cls, trie, morpheme, entry):
+        node = trie
+        for char in morpheme:
+            node = node.setdefault(char, {})
+        node[cls._END] = entry
+
+    @classmethod
+    def _compress(cls, node):
+        """ Merge chains of single children into one edge, so that
+            {first char: (edge label, child)} is matched with one
+            str.startswith() rather than one lookup per character """
+        compressed = {}
+        for char, child in node.items():
+            if char == cls._END:
+                compressed[char] = child
+                continue
+            label = char
+            while cls._END not in child and len(child) == 1:
+                (next_char, child), = child.items()
+                label += next_char
+            compressed[char] = (label, cls._compress(child))
+        return compressed
+
+    def segment(self, word):
+        """
+        Split a word into morphemes.
+
+        Args:
+            word str: the word, in lower case
+
+        Returns:
+            [(str, int, bool)]: (morpheme, value, is multiplier) for each
+                morpheme, with None as the value of fillers; None if the
+                word doesn't split into morphemes
+        """
+        trie = self._trie
+        end_key = self._END
+        length = len(word)
+        if not length:
+            return None
+
+        # the longest morpheme at each position almost always works out
+        segments = []
+        start = 0
+        while start < length:
+            node = trie
+            position = start
+            longest = None
+            while position < length:
+                edge = node.get(word[position])
+                if edge is None or not word.startswith(edge[0], position):
+                    break
+                position += len(edge[0])
+                node = edge[1]
+                if end_key in node:
+                    longest = position, node[end_key]
+            if longest is None:
+                break
+            start, entry = longest
+            segments.append(entry)
+        else:
+            return segments
+        return self._search(word)
+
+    def _search(self, word):
+        """ segment(), trying shorter morphemes where the longest one leads
+            to a dead end """
+        trie = self._trie
+        end_key = self._END
+        length = len(word)
+        dead_ends = set()
+
+        def split(start):
+            # the morphemes starting here, then the longest one which
+            # leaves a word that splits too
+            node = trie
+            ends = []
+            position = start
+            while position < length:
+                edge = node.get(word[position])
+                if edge is None or not word.startswith(edge[0], position):
+                    break
+                position += len(edge[0])
+                node = edge[1]
+                if end_key in node:
+                    ends.append((position, node[end_key]))
+            for end, entry in reversed(ends):
+                if end == length:
+                    return [entry]
+                if end in dead_ends:
+                    continue
+                rest = split(end)
+                if rest is not None:
+                    rest.append(entry)
+                    return rest
+            dead_ends.add(start)
+            return None
+
+        segments = split(0)
+        if segments is not None:
+            segments.reverse()
+        return segments
+
+    def value(self, word):
+        """
+        Read a compound numeral.
+
+        Args:
+            word str: the word, in lower case
+
+        Returns:
+            int: its value, or None if it isn't a numeral
+        """
+        segments = self.segment(word)
+        if segments is None or all(value is None for _, value, _ in segments):
+            return None
+        groups = []  # (multiplier, value) of each complete group
+        current = 0
+        for _, value, is_multiplier in segments:
+            if value is None:
+                continue
+            if not is_multiplier:
+                current += value
+                continue
+            amount = current
+            while groups and groups[-1][0] < value:
+                amount += groups.pop()[1]
+            groups.append((value, (amount or 1) * value))
+            current = 0
+        return sum(amount for _, amount in groups) + current
+
+
+class DurationExtractor:
+    """
+    Finds "<number> <unit>" phrases, such as "10 minutes" or "3 дня", and
+    adds them up into a timedelta.
+
+    Every unit form of a language goes into one precompiled regex, so a
+    text is scanned once whatever the number of units. Where forms overlap,
+    the one listed first wins, as each used to be substituted in turn.
+
+    Args:
+        units list: [(form, timedelta keyword)], e.g.
+            [("minute", "minutes"), ("hour", "hours")]
+        suffix str: regex for the endings allowed after a form, e.g. "s?"
+        separator str: regex between the number and the unit
+    """
+
+    def __init__(self, units, suffix="", separator=r"(?:\s+|\-)"):
+        self._keywords = {}
+        for form, keyword in units:
+            self._keywords.setdefault(form, keyword)
+        self._regex = re.compile(
+            r"(?P<value>\d+(?:\.?\d+)?){}(?P<unit>{}){}".format(
+                separator, "|".join(map(re.escape, self._keywords)), suffix))
+
+    def extract(self, text):
+        """
+        Add up the durations in a text, and remove them from it.
+
+        Args:
+            text str: text with numbers written as digits
+
+        Returns:
+            (timedelta, str): the total duration, None if there is none,
+                and the rest of the text, stripped
+        """
+        values = {}
+
+        def consume(match):
+            keyword = self._keywords[match.group("unit")]
+            values[keyword] = values.get(keyword, 0) + \
+                float(match.group("value"))
+            return ''
+
+        text = self._regex.sub(consume, text).strip()
+        duration = timedelta(**values) if any(values.values()) else None
+        return duration, text
+
+
+class GenderResolver:
+    """
+    Guesses the grammatical gender of words, from the word in front of them
+    in a context sentence and from their endings.
+
+    The endings go into a trie of reversed suffixes, so a word is matched
+    against all of them in one walk over its last letters. Results are
+    cached per word and the one context word that decides it, so a noun met
+    again in the same kind of phrase costs a lookup.
+
+    Args:
+        endings list: [(gender, [ending])], groups listed first win, e.g.
+            [("f", ["a", "as"]), ("m", ["o", "os"])]
+        genders dict: word -> gender, for words the endings get wrong; a
+            plural ending in "s" is also looked up without it
+        determinants dict: word -> gender it gives the word after it; None
+            to take the gender of the word in front, from its endings
+        lowercase bool: compare the word and the context in lowercase
+        singular bool: strip a plural "s" off the word before anything else
+        unknown: returned when the gender can't be guessed
+        cache_size int: results kept
+    """
+
+    def __init__(self, endings, genders=None, determinants=None,
+                 lowercase=False, singular=False, unknown=None,
+                 cache_size=1024):
+        self.genders = genders or {}
+        self.determinants = determinants
+        self.lowercase = lowercase
+        self.singular = singular
+        self.unknown = unknown
+        self._trie = {}
+        for rank, (gender, suffixes) in enumerate(endings):
+            for suffix in suffixes:
+                node = self._trie
+                for char in reversed(suffix):
+                    node = node.setdefault(char, {})
+                node.setdefault(None, (rank, gender))
+        self._resolve = lru_cache(maxsize=cache_size)(self._resolve)
+
+    def _normalize(self, word):
+        if self.lowercase:
+            word = word.lower()
+        if self.singular:
+            word = word.rstrip("s")
+        return word
+
+    def _split(self, context):
+        if self.lowercase:
+            context = context.lower()
+        return context.split(" ")
+
+    def _decides(self, previous):
+        return self.determinants is None or previous in self.determinants
+
+    def ending_gender(self, word):
+        """ The gender of the earliest group with an ending of the word """
+        node = self._trie
+        best = None
+        for char in reversed(word):
+            node = node.get(char)
+            if node is None:
+                break
+            match = node.get(None)
+            if match is not None and (best is None or match < best):
+                best = match
+        return best[1] if best else self.unknown
+
+    def word_gender(self, word):
+        """ The gender of a word on its own """
+        if word in self.genders:
+            return self.genders[word]
+        singular = word.rstrip("s")
+        if singular in self.genders:
+            return self.genders[singular]
+        return self.ending_gender(word)
+
+    def _resolve(self, word, previous):
+        gender = self.unknown
+        if previous is not None:
+            if self.determinants is None:
+                gender = self.word_gender(self._normalize(previous))
+            else:
+                gender = self.determinants[previous]
+        return gender or self.word_gender(word)
+
+    def get_gender(self, word, context=""):
+        """
+        Guess the gender of a word
+
+        Args:
+            word str: the word to look up
+            context str: sentence containing the word
+
+        Returns:
+            str: "m", "f" or "n", or the unknown value
+        """
+        word = self._normalize(word)
+        words = self._split(context)
+        previous = None
+        if word in words:
+            determinants = self.determinants
+            for idx in range(1, len(words)):
+                if words[idx] == word and (determinants is None or
+                                           words[idx - 1] in determinants):
+                    previous = words[idx - 1]
+                    break
+        return self._resolve(word, previous)
+
+    def get_genders(self, words, context=""):
+        """
+        Guess the gender of several words from the same context, which is
+        split once for all of them
+
+        Args:
+            words list: the words to look up
+            context str: sentence containing the words
+
+        Returns:
+            list: get_gender() of each word
+        """
+        tokens = self._split(context)
+        decided = {}
+        for idx in range(1, len(tokens)):
+            if tokens[idx] not in decided and self._decides(tokens[idx - 1]):
+                decided[tokens[idx]] = tokens[idx - 1]
+        return [self._resolve(word, decided.get(word))
+                for word in map(self._normalize, words)]
+
+
 def is_numeric(input_str):
     """
     Takes in a string and tests to see if it is a number.
@@ -336,7 +950,7 @@ def look_for_fractions(split_list):
 
 
 def extract_numbers_generic(text, pronounce_handler, extract_handler,
-                            short_scale=True, ordinals=False):
+                            short_scale=True, ordinals=False, spans=False):
     """
         Takes in a string and extracts a list of numbers.
         Language agnostic, per language parsers need to be provided
@@ -351,9 +965,14 @@ def extract_numbers_generic(text, pronounce_handler, extract_handler,
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): numbers are found by substituting the text back and
+            forth, so where they were cannot be told; raises ValueError
     Returns:
         list: list of extracted numbers as floats
     """
+    if spans:
+        raise ValueError("spans are only supported by the languages which "
+                         "parse numbers word by word")
     numbers = []
     normalized = text
     extract = extract_handler(normalized, short_scale, ordinals)
@@ -385,3 +1004,196 @@ def extract_numbers_generic(text, pronounce_handler, extract_handler,
             extract = extract_handler(to_parse, short_scale, ordinals)
     numbers.reverse()
     return numbers
+
+
+class DatetimeSpanFinder:
+    """
+    Locates every date/time expression in a text, with character spans.
+
+    Used by the extract_datetimes_<lang> functions. The text is scanned once,
+    classifying each word against a per-language vocabulary:
+
+        date words  -- "tomorrow", "monday", "minutes", "7pm"...
+        weak words  -- date words which are also common words, like "may"
+                       or "march", only counted next to a number or
+                       another date word
+        unit words  -- weak words which only count after a number or date
+                       word, like "seconds" or "pm", so that "the second
+                       one" is not a date
+        links       -- words which may appear inside an expression, like
+                       "at", "in", "the" or "next"
+        conjunctions -- "and", "or"; split two expressions when a date word
+                        follows them, as in "monday and tuesday", or a
+                        number after a complete expression, as in "march
+                        5th and on the 7th of april"
+        ranges      -- "to", "until"; split like conjunctions, but only
+                       after a complete expression, as in "from monday to
+                       friday"; otherwise links ("quarter to five")
+        numbers     -- digits and number words
+
+    Runs of such words which contain a date word become candidate
+    expressions. Each candidate is handed to the language's
+    extract_datetime_<lang>, so only short snippets of the text are ever
+    parsed, instead of the whole remainder once per date found.
+    """
+    _TIME_PATTERN = re.compile(r"^\d{1,2}([:h]\d{2}){1,2}(am|pm)?$|"
+                               r"^\d{1,2}(am|pm|h|a\.m\.?|p\.m\.?)$")
+    _DIGITS_PATTERN = re.compile(r"^\d+([.,:/]\d+)*(st|nd|rd|th|er|e|º|ª)?$")
+    _WORD_PATTERN = re.compile(r"\S+")
+    _LEADING_PUNCTUATION = "\"'([{¿¡«"
+    _TRAILING_PUNCTUATION = "\"')]}.,;:!?»"
+    _SENTENCE_END = ".;!?"
+
+    DATE, WEAK, UNIT, NUMBER, LINK, CONJUNCTION, COMMA, RANGE, OTHER = \
+        range(9)
+
+    def __init__(self, date_words, weak_words=(), links=(),
+                 conjunctions=(), number_words=(), unit_words=(), ranges=()):
+        self.vocabulary = {}
+        for words, category in ((number_words, self.NUMBER),
+                                (conjunctions, self.CONJUNCTION),
+                                (links, self.LINK),
+                                (ranges, self.RANGE),
+                                (weak_words, self.WEAK),
+                                (unit_words, self.UNIT),
+                                (date_words, self.DATE)):
+            for word in words:
+                self.vocabulary[word.lower()] = category
+
+    def _classify(self, word):
+        word = word.lower()
+        category = self.vocabulary.get(word)
+        if category is not None:
+            return category
+        stripped = word.lstrip(self._LEADING_PUNCTUATION) \
+            .rstrip(self._TRAILING_PUNCTUATION)
+        for candidate in (stripped, stripped + ".", stripped[:-2]
+                          if stripped.endswith("'s") else None,
+                          stripped.rsplit("'", 1)[-1]
+                          if "'" in stripped else None):
+            if candidate:
+                category = self.vocabulary.get(candidate)
+                if category is not None:
+                    return category
+        if self._TIME_PATTERN.match(stripped):
+            return self.DATE
+        if self._DIGITS_PATTERN.match(stripped):
+            return self.NUMBER
+        return self.OTHER
+
+    def _resolve_weak(self, run):
+        """ The run with its unit and weak words turned into date words
+            where their neighbours make them count, and into links where
+            they don't; units first, so that "second" in "the second of
+            may" does not make "may" count """
+        resolved = list(run)
+        for kind in (self.UNIT, self.WEAK):
+            content = [idx for idx, token in enumerate(resolved)
+                       if token[2] != self.LINK]
+            for position, idx in enumerate(content):
+                start, end, category = resolved[idx]
+                if category != kind:
+                    continue
+                before = resolved[content[position - 1]][2] \
+                    if position else None
+                after = resolved[content[position + 1]][2] \
+                    if position + 1 < len(content) else None
+                if kind == self.UNIT:
+                    counts = before in (self.NUMBER, self.DATE)
+                else:
+                    counts = bool({before, after} &
+                                  {self.NUMBER, self.DATE, self.WEAK})
+                resolved[idx] = (start, end,
+                                 self.DATE if counts else self.LINK)
+        return resolved
+
+    def _candidates(self, text):
+        """ Yield (start_char, end_char) of each candidate expression """
+        run = []
+        separators = (self.CONJUNCTION, self.COMMA, self.RANGE)
+
+        def flush():
+            # split the run between expressions, then trim each part down
+            # to its date words, numbers and any leading links
+            tokens = self._resolve_weak(run)
+            part = []
+            for idx, token in enumerate(tokens):
+                if token[2] in separators and part:
+                    following = next((t[2] for t in tokens[idx + 1:]
+                                      if t[2] != self.LINK), None)
+                    linked = idx + 1 < len(tokens) and \
+                        tokens[idx + 1][2] == self.LINK
+                    complete = any(t[2] == self.DATE for t in part)
+                    if following == self.DATE:
+                        split = token[2] != self.RANGE or complete
+                    elif following == self.NUMBER:
+                        # "2 hours and 30 minutes" is a single duration
+                        split = token[2] != self.COMMA and complete and \
+                            (linked or part[-1][2] == self.NUMBER)
+                    else:
+                        split = False
+                    if split:
+                        yield from trim(part)
+                        part = []
+                        continue
+                part.append(token)
+            yield from trim(part)
+
+        def trim(part):
+            while part and part[-1][2] in (self.LINK,) + separators:
+                part = part[:-1]
+            while part and part[0][2] in separators:
+                part = part[1:]
+            if any(t[2] == self.DATE for t in part):
+                start = part[0][0]
+                end = part[-1][1]
+                while end > start and \
+                        text[end - 1] in self._TRAILING_PUNCTUATION:
+                    end -= 1
+                while start < end and \
+                        text[start] in self._LEADING_PUNCTUATION:
+                    start += 1
+                yield start, end
+
+        for match in self._WORD_PATTERN.finditer(text):
+            word = match.group()
+            category = self._classify(word)
+            if category == self.OTHER:
+                yield from flush()
+                run = []
+                continue
+            run.append((match.start(), match.end(), category))
+            if word[-1] == ",":
+                run.append((match.end(), match.end(), self.COMMA))
+            elif word[-1] in self._SENTENCE_END and \
+                    not word[:-1].isdigit():
+                yield from flush()
+                run = []
+        yield from flush()
+
+    def extract(self, text, extract_handler, anchorDate=None,
+                default_time=None):
+        """
+        Args:
+            text (str): the text to search
+            extract_handler (function): the language's extract_datetime
+            anchorDate (datetime): passed on to extract_handler
+            default_time (time): passed on to extract_handler
+
+        Returns:
+            [(datetime, int, int)]: each date found, with the start and end
+                                    offset of the words it came from
+        """
+        anchorDate = anchorDate or now_local()
+        matches = []
+        for start, end in self._candidates(text):
+            try:
+                extracted = extract_handler(text[start:end], anchorDate,
+                                            default_time)
+            except ValueError:
+                # some words extract_datetime can't read on their own,
+                # e.g. a bare month in English
+                continue
+            if extracted:
+                matches.append((extracted[0], start, end))
+        return matches
@@ -18,7 +18,10 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_tokens, tokenize, Token, \
+    Normalizer, compile_inflections, DurationExtractor, \
+    extract_numbers_with_text, convert_words_to_numbers, \
+    extract_number_values
 from lingua_franca.lang.common_data_cs import _NUM_STRING_CS, \
     _LONG_ORDINAL_CS, _LONG_SCALE_CS, _SHORT_SCALE_CS, _SHORT_ORDINAL_CS, \
     _FRACTION_STRING_CS, _MONTHS_CONVERSION, _MONTHS_CZECH, _TIME_UNITS_CONVERSION, \
@@ -96,26 +99,9 @@ def _convert_words_to_numbers_cs(text, short_scale=True, ordinals=False):
         The original text, with numbers subbed in where appropriate.
 
     """
-    text = text.lower()
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_cs(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-
-    return ' '.join(results)
+    return convert_words_to_numbers(
+        text.lower(), lambda tokens: _extract_numbers_with_text_cs(
+            tokens, short_scale, ordinals))
 
 
 def _extract_numbers_with_text_cs(tokens, short_scale=True,
@@ -138,26 +124,9 @@ def _extract_numbers_with_text_cs(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_cs(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens, lambda tokens: _extract_number_with_text_cs(
+            tokens, short_scale, ordinals, fractional_numbers))
 
 
 def _extract_number_with_text_cs(tokens, short_scale=True,
@@ -236,7 +205,7 @@ def _extract_fraction_with_text_cs(tokens, short_scale, ordinals):
 
     """
     for c in _FRACTION_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
+        partitions = partition_tokens(tokens, c)
 
         if len(partitions) == 3:
             numbers1 = \
@@ -284,7 +253,7 @@ def _extract_decimal_with_text_cs(tokens, short_scale, ordinals):
 
     """
     for c in _DECIMAL_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
+        partitions = partition_tokens(tokens, c)
 
         if len(partitions) == 3:
             numbers1 = \
@@ -599,6 +568,12 @@ def extract_number_cs(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+# Czech inflection for time: minuta, minuty, minut - safe to use minut as
+# pattern. For day: den, dny, dnů - short pattern not applicable, list all
+_DURATION_EXTRACTOR_CS = DurationExtractor(
+    list(_TIME_UNITS_CONVERSION.items()), suffix="[ay]?")
+
+
 def extract_duration_cs(text):
     """
     Convert an english phrase into a number of seconds
@@ -628,34 +603,8 @@ def extract_duration_cs(text):
     if not text:
         return None
 
-    # Czech inflection for time: minuta,minuty,minut - safe to use minut as pattern
-    # For day: den, dny, dnů - short patern not applicable, list all
-
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ay]?"
-    text = _convert_words_to_numbers_cs(text)
-
-    for (unit_cs, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_cs)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    return _DURATION_EXTRACTOR_CS.extract(
+        _convert_words_to_numbers_cs(text))
 
 
 def extract_datetime_cs(text, anchorDate=None, default_time=None):
@@ -1560,7 +1509,8 @@ def isFractional_cs(input_str, short_scale=True):
     return False
 
 
-def extract_numbers_cs(text, short_scale=True, ordinals=False):
+def extract_numbers_cs(text, short_scale=True, ordinals=False,
+                       spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -1571,12 +1521,15 @@ def extract_numbers_cs(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): also return where each number is in text
     Returns:
-        list: list of extracted numbers as floats
+        list: list of extracted numbers as floats, or with spans, of
+            (float, start, end) tuples, where text[start:end] are the
+            words the number was read from
     """
-    results = _extract_numbers_with_text_cs(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return extract_number_values(
+        text, lambda tokens: _extract_numbers_with_text_cs(
+            tokens, short_scale, ordinals), spans)
 
 
 class CzechNormalizer(Normalizer):
@@ -1589,6 +1542,53 @@ def normalize_cs(text, remove_articles=True):
     return CzechNormalizer().normalize(text, remove_articles)
 
 
+def _month_inflections_cs():
+    """
+    Reverse index of the month suffix rule: "dubnu", "dubna" -> "duben"
+    """
+    entries = []
+    for name in _MONTHS_CZECH:
+        if name.endswith("en"):
+            entries.append((name, [name[:-2] + "nu", name[:-2] + "na"]))
+    return entries
+
+
+_INFLECTIONS_CS = compile_inflections({
+    # _extract_whole_number_with_text_cs
+    1: [
+        # Number one (jedna)
+        ("jedna", ["jeden", "jedno", "jedny"]),
+        # Number two (dva)
+        ("dva", ["dvě"]),
+    ],
+    # extract_datetime_cs
+    2: [
+        ("hodin", ["hodina", "hodiny", "hodinu"]),
+        ("minut", ["minuta", "minuty", "minutu"]),
+        ("sekund", ["sekunda", "sekundy", "sekundu"]),
+        ("den", ["dní", "dnů", "dny"]),
+        ("týden", ["týdny", "týdnů"]),
+        ("měsíc", ["měsíců", "měsíce", "měsíci"]),
+        ("rok", ["roky", "roků", "let"]),
+        ("včera", ["včerejšku"]),
+        ("zítra", ["zítřku", "zítřejší"]),
+        ("ráno", ["ranní"]),
+        ("dopoledne", ["dopolední"]),
+        ("poledne", ["polední"]),
+        ("odpoledne", ["odpolední"]),
+        ("večer", ["večerní"]),
+        ("noc", ["noční"]),
+        ("víkend", ["víkendech", "víkendu"]),
+        ("všední", ["všedních", "všedním"]),
+        # Months
+        ("únor", ["únoru"]),
+        ("červenec", ["červenci", "července"]),
+        ("listopad", ["listopadu"]),
+        ("prosinec", ["prosinci"]),
+    ] + _month_inflections_cs(),
+})
+
+
 def _text_cs_inflection_normalize(word, arg):
     """
     Czech Inflection normalizer.
@@ -1604,104 +1604,4 @@ def _text_cs_inflection_normalize(word, arg):
         word [Word]
 
     """
-    if arg == 1:  # _extract_whole_number_with_text_cs
-        # Number one (jedna)
-        if len(word) == 5 and word.startswith("jed"):
-            suffix = 'en', 'no', 'ny'
-            if word.endswith(suffix, 3):
-                word = "jedna"
-
-        # Number two (dva)
-        elif word == "dvě":
-            word = "dva"
-
-    elif arg == 2:  # extract_datetime_cs  TODO: This is ugly
-        if word == "hodina":
-            word = "hodin"
-        if word == "hodiny":
-            word = "hodin"
-        if word == "hodinu":
-            word = "hodin"
-        if word == "minuta":
-            word = "minut"
-        if word == "minuty":
-            word = "minut"
-        if word == "minutu":
-            word = "minut"
-        if word == "minutu":
-            word = "minut"
-        if word == "sekunda":
-            word = "sekund"
-        if word == "sekundy":
-            word = "sekund"
-        if word == "sekundu":
-            word = "sekund"
-        if word == "dní":
-            word = "den"
-        if word == "dnů":
-            word = "den"
-        if word == "dny":
-            word = "den"
-        if word == "týdny":
-            word = "týden"
-        if word == "týdnů":
-            word = "týden"
-        if word == "měsíců":
-            word = "měsíc"
-        if word == "měsíce":
-            word = "měsíc"
-        if word == "měsíci":
-            word = "měsíc"
-        if word == "roky":
-            word = "rok"
-        if word == "roků":
-            word = "rok"
-        if word == "let":
-            word = "rok"
-        if word == "včerejšku":
-            word = "včera"
-        if word == "zítřku":
-            word = "zítra"
-        if word == "zítřejší":
-            word = "zítra"
-        if word == "ranní":
-            word = "ráno"
-        if word == "dopolední":
-            word = "dopoledne"
-        if word == "polední":
-            word = "poledne"
-        if word == "odpolední":
-            word = "odpoledne"
-        if word == "večerní":
-            word = "večer"
-        if word == "noční":
-            word = "noc"
-        if word == "víkendech":
-            word = "víkend"
-        if word == "víkendu":
-            word = "víkend"
-        if word == "všedních":
-            word = "všední"
-        if word == "všedním":
-            word = "všední"
-
-        # Months
-        if word == "únoru":
-            word = "únor"
-        elif word == "červenci":
-            word = "červenec"
-        elif word == "července":
-            word = "červenec"
-        elif word == "listopadu":
-            word = "listopad"
-        elif word == "prosinci":
-            word = "prosinec"
-
-        elif word.endswith("nu") or word.endswith("na"):
-            tmp = word[:-2]
-            tmp += ("en")
-            for name in _MONTHS_CZECH:
-                if name == tmp:
-                    word = name
-
-    return word
+    return _INFLECTIONS_CS.get((arg, word), word)
@@ -869,7 +869,8 @@ def normalize_da(text, remove_articles=True):
     return normalized[1:]  # strip the initial space
 
 
-def extract_numbers_da(text, short_scale=True, ordinals=False):
+def extract_numbers_da(text, short_scale=True, ordinals=False,
+                       spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -880,11 +881,13 @@ def extract_numbers_da(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): not supported, see extract_numbers_generic
     Returns:
         list: list of extracted numbers as floats
     """
     return extract_numbers_generic(text, pronounce_number_da, extract_number_da,
-                                   short_scale=short_scale, ordinals=ordinals)
+                                   short_scale=short_scale, ordinals=ordinals,
+                                   spans=spans)
 
 
 class DanishNormalizer(Normalizer):
@@ -17,7 +17,7 @@ import re
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_generic, Normalizer, DatetimeSpanFinder, DurationExtractor
 from lingua_franca.lang.common_data_de import _DE_NUMBERS
 from lingua_franca.lang.format_de import pronounce_number_de
 from lingua_franca.time import now_local
@@ -86,6 +86,14 @@ de_numbers = {
 # reasons.
 
 
+# Einzahl und Mehrzahl: minute, minuten
+_DURATION_EXTRACTOR_DE = DurationExtractor(
+    [('mikrosekunde', 'microseconds'), ('millisekunde', 'milliseconds'),
+     ('sekunde', 'seconds'), ('minute', 'minutes'), ('stunde', 'hours'),
+     ('tag', 'days'), ('woche', 'weeks')],
+    suffix="[ne]?")
+
+
 def extract_duration_de(text):
     """
     Convert an german phrase into a number of seconds
@@ -109,38 +117,10 @@ def extract_duration_de(text):
     if not text:
         return None
 
-    text = text.lower()
-    # die time_unit values werden für timedelta() mit dem jeweiligen Wert überschrieben
-    time_units = {
-        'microseconds': 'mikrosekunden',
-        'milliseconds': 'millisekunden',
-        'seconds': 'sekunden',
-        'minutes': 'minuten',
-        'hours': 'stunden',
-        'days': 'tage',
-        'weeks': 'wochen'
-    }
-
-    # Einzahl und Mehrzahl
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}[ne]?"
-
     # TODO Einstiegspunkt für Text-zu-Zahlen Konversion
     #text = _convert_words_to_numbers_de(text)
 
-    for (unit_en, unit_de) in time_units.items():
-        unit_pattern = pattern.format(
-            unit=unit_de[:-1])  # remove 'n'/'e' from unit
-        time_units[unit_en] = 0
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    return _DURATION_EXTRACTOR_DE.extract(text.lower())
 
 
 def extract_number_de(text, short_scale=True, ordinals=False):
@@ -900,6 +880,52 @@ def extract_datetime_de(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+_DATETIME_SPANS_DE = DatetimeSpanFinder(
+    date_words=['montag', 'dienstag', 'mittwoch', 'donnerstag', 'freitag',
+                'samstag', 'sonntag', 'montags', 'dienstags', 'mittwochs',
+                'donnerstags', 'freitags', 'samstags', 'sonntags',
+                'januar', 'februar', 'märz', 'april', 'mai', 'juni', 'juli',
+                'august', 'september', 'oktober', 'october', 'november',
+                'dezember', 'jan', 'feb', 'mär', 'apr', 'aug', 'sept',
+                'okt', 'oct', 'nov', 'dez',
+                'heute', 'morgen', 'übermorgen', 'gestern', 'vorgestern',
+                'jetzt', 'früh', 'morgens', 'vormittag', 'vormittags',
+                'mittag', 'mittags', 'nachmittag', 'nachmittags', 'abend',
+                'abends', 'nacht', 'nachts', 'mitternacht',
+                'tag', 'tage', 'tagen', 'woche', 'wochen', 'wochenende',
+                'monat', 'monate', 'monaten', 'jahr', 'jahre', 'jahren',
+                'stunde', 'stunden', 'minute', 'minuten', 'uhr'],
+    unit_words=['sekunde', 'sekunden'],
+    links=['in', 'im', 'am', 'an', 'um', 'gegen', 'für', 'ab',
+           'nach', 'vor', 'seit', 'zum', 'auf', 'der', 'die', 'das', 'den',
+           'dem', 'des', 'diese', 'dieser', 'dieses', 'diesen', 'diesem',
+           'nächste', 'nächster', 'nächstes', 'nächsten', 'nächstem',
+           'letzte', 'letzter', 'letztes', 'letzten', 'letztem',
+           'kommende', 'kommender', 'kommendes', 'kommenden', 'halb',
+           'viertel'],
+    conjunctions=['und', 'oder', 'dann'],
+    ranges=['bis'],
+    number_words=_DE_NUMBERS)
+
+
+def extract_datetimes_de(text, anchorDate=None, default_time=None):
+    """ Find every date/time expression in a text
+
+    See extract_datetimes_en for details.
+
+    Args:
+        text (str): string containing date words
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        [(datetime, int, int)]: the date, and the start and end character
+                                offsets of the words it was read from
+    """
+    return _DATETIME_SPANS_DE.extract(text, extract_datetime_de,
+                                      anchorDate, default_time)
+
+
 def is_fractional_de(input_str, short_scale=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -1003,7 +1029,8 @@ def normalize_de(text, remove_articles=True):
     return normalized[1:]  # strip the initial space
 
 
-def extract_numbers_de(text, short_scale=True, ordinals=False):
+def extract_numbers_de(text, short_scale=True, ordinals=False,
+                       spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -1014,11 +1041,13 @@ def extract_numbers_de(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): not supported, see extract_numbers_generic
     Returns:
         list: list of extracted numbers as floats
     """
     return extract_numbers_generic(text, pronounce_number_de, extract_number_de,
-                                   short_scale=short_scale, ordinals=ordinals)
+                                   short_scale=short_scale, ordinals=ordinals,
+                                   spans=spans)
 
 
 class GermanNormalizer(Normalizer):
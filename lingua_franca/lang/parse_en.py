@@ -19,7 +19,10 @@ from dateutil.relativedelta import relativedelta
 
 from lingua_franca.time import now_local
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_tokens, tokenize, Token, \
+    Normalizer, DatetimeSpanFinder, DurationExtractor, \
+    extract_numbers_with_text, convert_words_to_numbers, \
+    extract_number_values
 from lingua_franca.lang.common_data_en import _ARTICLES_EN, _NUM_STRING_EN, \
     _LONG_ORDINAL_EN, _LONG_SCALE_EN, _SHORT_SCALE_EN, _SHORT_ORDINAL_EN, \
     _NEGATIVES_EN, _SUMS_EN, _MULTIPLIES_LONG_SCALE_EN, \
@@ -46,25 +49,9 @@ def _convert_words_to_numbers_en(text, short_scale=True, ordinals=False):
         The original text, with numbers subbed in where appropriate.
 
     """
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_en(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-
-    return ' '.join(results)
+    return convert_words_to_numbers(
+        text, lambda tokens: _extract_numbers_with_text_en(
+            tokens, short_scale, ordinals))
 
 
 def _extract_numbers_with_text_en(tokens, short_scale=True,
@@ -87,26 +74,9 @@ def _extract_numbers_with_text_en(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_en(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens, lambda tokens: _extract_number_with_text_en(
+            tokens, short_scale, ordinals, fractional_numbers))
 
 
 def _extract_number_with_text_en(tokens, short_scale=True,
@@ -185,7 +155,7 @@ def _extract_fraction_with_text_en(tokens, short_scale, ordinals):
 
     """
     for c in _FRACTION_MARKER_EN:
-        partitions = partition_list(tokens, lambda t: t.word == c)
+        partitions = partition_tokens(tokens, c)
 
         if len(partitions) == 3:
             numbers1 = \
@@ -233,7 +203,7 @@ def _extract_decimal_with_text_en(tokens, short_scale, ordinals):
 
     """
     for c in _DECIMAL_MARKER_EN:
-        partitions = partition_list(tokens, lambda t: t.word == c)
+        partitions = partition_tokens(tokens, c)
 
         if len(partitions) == 3:
             numbers1 = \
@@ -550,6 +520,12 @@ def extract_number_en(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+_DURATION_EXTRACTOR_EN = DurationExtractor(
+    [(unit[:-1], unit) for unit in ('microseconds', 'milliseconds', 'seconds',
+                                    'minutes', 'hours', 'days', 'weeks')],
+    suffix="s?")
+
+
 def extract_duration_en(text):
     """
     Convert an english phrase into a number of seconds
@@ -579,31 +555,7 @@ def extract_duration_en(text):
     if not text:
         return None
 
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}s?"
-    text = _convert_words_to_numbers_en(text)
-
-    for unit_en in time_units:
-        unit_pattern = pattern.format(unit=unit_en[:-1])   # remove 's' from unit
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return (duration, text)
+    return _DURATION_EXTRACTOR_EN.extract(_convert_words_to_numbers_en(text))
 
 
 def extract_datetime_en(text, anchorDate=None, default_time=None):
@@ -1428,6 +1380,54 @@ def extract_datetime_en(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+_DATETIME_SPANS_EN = DatetimeSpanFinder(
+    date_words=['monday', 'tuesday', 'wednesday', 'thursday', 'friday',
+                'saturday', 'sunday', 'mondays', 'tuesdays', 'wednesdays',
+                'thursdays', 'fridays', 'saturdays', 'sundays',
+                'january', 'february', 'april', 'june', 'july', 'august',
+                'september', 'october', 'november', 'december',
+                'jan', 'feb', 'apr', 'aug', 'sept', 'oct', 'nov', 'dec',
+                'today', 'tomorrow', 'yesterday', 'tonight', 'now',
+                'morning', 'afternoon', 'evening', 'night', 'noon',
+                'midnight', 'weekend', 'weekends', 'weekday', 'weekdays',
+                'day', 'days', 'week', 'weeks', 'fortnight', 'month',
+                'months', 'year', 'years', 'hour', 'hours', 'minute',
+                'minutes', 'decade', 'decades', 'century', 'centuries',
+                'millennium', 'millenniums', "o'clock", 'oclock', 'ago'],
+    weak_words=['may', 'march', 'mar'],
+    unit_words=['second', 'seconds', 'am', 'pm', 'a.m.', 'p.m.'],
+    links=['at', 'by', 'in', 'on', 'of', 'this', 'next', 'last', 'around',
+           'for', 'within', 'from', 'after', 'before', 'the', 'a', 'an',
+           'past', 'o', 'oh', 'early', 'late', 'couple', 'half', 'quarter'],
+    conjunctions=['and', 'or', 'then'],
+    ranges=['to', 'until', 'till'],
+    number_words=list(_STRING_NUM_EN) + list(_STRING_SHORT_ORDINAL_EN) +
+    list(_STRING_LONG_ORDINAL_EN))
+
+
+def extract_datetimes_en(text, anchorDate=None, default_time=None):
+    """ Find every date/time expression in a text
+
+    Unlike extract_datetime_en, which returns a single date and the text
+    left over, this reports each expression along with its position in the
+    original text, e.g.
+
+        "lunch on monday at 1pm, dinner on friday"
+        -> [(<monday 13:00>, 6, 22), (<friday 00:00>, 31, 40)]
+
+    Args:
+        text (str): string containing date words
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        [(datetime, int, int)]: the date, and the start and end character
+                                offsets of the words it was read from
+    """
+    return _DATETIME_SPANS_EN.extract(text, extract_datetime_en,
+                                      anchorDate, default_time)
+
+
 def is_fractional_en(input_str, short_scale=True, spoken=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -1458,7 +1458,8 @@ def is_fractional_en(input_str, short_scale=True, spoken=True):
     return False
 
 
-def extract_numbers_en(text, short_scale=True, ordinals=False):
+def extract_numbers_en(text, short_scale=True, ordinals=False,
+                       spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -1469,12 +1470,15 @@ def extract_numbers_en(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): also return where each number is in text
     Returns:
-        list: list of extracted numbers as floats
+        list: list of extracted numbers as floats, or with spans, of
+            (float, start, end) tuples, where text[start:end] are the
+            words the number was read from
     """
-    results = _extract_numbers_with_text_en(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return extract_number_values(
+        text, lambda tokens: _extract_numbers_with_text_en(
+            tokens, short_scale, ordinals), spans)
 
 
 class EnglishNormalizer(Normalizer):
@@ -268,7 +268,8 @@ def _es_number_parse(words, i):
     return es_number(i)
 
 
-def extract_numbers_es(text, short_scale=True, ordinals=False):
+def extract_numbers_es(text, short_scale=True, ordinals=False,
+                       spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -279,12 +280,13 @@ def extract_numbers_es(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): not supported, see extract_numbers_generic
     Returns:
         list: list of extracted numbers as floats
     """
     return extract_numbers_generic(text, pronounce_number_es,
                                    extract_number_es, short_scale=short_scale,
-                                   ordinals=ordinals)
+                                   ordinals=ordinals, spans=spans)
 
 
 def normalize_es(text, remove_articles=True):
@@ -1073,6 +1075,58 @@ def extract_datetime_es(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+_DATETIME_SPANS_ES = DatetimeSpanFinder(
+    date_words=['lunes', 'martes', 'miércoles', 'miercoles', 'jueves',
+                'viernes', 'sábado', 'sabado', 'domingo', 'sábados',
+                'sabados', 'domingos',
+                'enero', 'febrero', 'marzo', 'abril', 'mayo', 'junio',
+                'julio', 'agosto', 'septiembre', 'octubre', 'noviembre',
+                'diciembre', 'ene', 'feb', 'abr', 'ago', 'sep', 'oct',
+                'nov', 'dic',
+                'hoy', 'mañana', 'ayer', 'anteayer', 'ahora', 'tarde',
+                'tardes', 'noche', 'noches', 'mediodía', 'medianoche',
+                'madrugada', 'día', 'días', 'semana', 'semanas', 'mes',
+                'meses', 'año', 'años', 'hora', 'horas', 'minuto',
+                'minutos', 'década', 'décadas', 'siglo', 'siglos',
+                'milenio', 'milenios'],
+    weak_words=['mar', 'may'],
+    unit_words=['segundo', 'segundos'],
+    links=['en', 'el', 'la', 'los', 'las', 'de', 'del', 'al', 'a', 'por',
+           'para', 'próximo', 'próxima', 'siguiente', 'siguientes',
+           'pasado', 'pasada', 'último', 'última', 'anterior', 'este',
+           'esta', 'dentro', 'después', 'antes', 'hace', 'desde', 'media',
+           'cuarto', 'menos'],
+    conjunctions=['y', 'o', 'luego'],
+    ranges=['hasta'],
+    number_words=_STRING_NUM_ES)
+
+
+def extract_datetimes_es(text, anchorDate=None, default_time=None):
+    """ Find every date/time expression in a text
+
+    See extract_datetimes_en for details.
+
+    Args:
+        text (str): string containing date words
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        [(datetime, int, int)]: the date, and the start and end character
+                                offsets of the words it was read from
+    """
+    return _DATETIME_SPANS_ES.extract(text, extract_datetime_es,
+                                      anchorDate, default_time)
+
+
+# Next rules are imprecise and incompleted, but is a good starting point.
+# For more detailed explanation, see
+# http://www.wikilengua.org/index.php/Género_gramatical
+# The word in front, usually an article, gives its gender to the next one.
+_GENDER_RESOLVER_ES = GenderResolver([("f", ["a"]), ("m", ["o", "e"])],
+                                     singular=True, unknown=False)
+
+
 def get_gender_es(word, context=""):
     """ Guess the gender of a word
 
@@ -1087,23 +1141,20 @@ def get_gender_es(word, context=""):
         str: The code "m" (male), "f" (female) or "n" (neutral) for the gender,
              or None if unknown/or unused in the given language.
     """
-    # Next rules are imprecise and incompleted, but is a good starting point.
-    # For more detailed explanation, see
-    # http://www.wikilengua.org/index.php/Género_gramatical
-    word = word.rstrip("s")
-    gender = False
-    words = context.split(" ")
-    for idx, w in enumerate(words):
-        if w == word and idx != 0:
-            previous = words[idx - 1]
-            gender = get_gender_es(previous)
-            break
-    if not gender:
-        if word[-1] == "a":
-            gender = "f"
-        if word[-1] == "o" or word[-1] == "e":
-            gender = "m"
-    return gender
+    return _GENDER_RESOLVER_ES.get_gender(word, context)
+
+
+def get_genders_es(words, context=""):
+    """ Guess the gender of several words from the same context
+
+    Args:
+        words (list(str)): The words to look up
+        context (str, optional): String containing the words, for context
+
+    Returns:
+        list(str): get_gender_es() of each word
+    """
+    return _GENDER_RESOLVER_ES.get_genders(words, context)
 
 
 class SpanishNormalizer(Normalizer):
@@ -14,6 +14,7 @@
 # limitations under the License.
 #
 import json
+import re
 from datetime import timedelta
 
 from lingua_franca.internal import resolve_resource_file
@@ -31,81 +32,110 @@ def _is_number(s):
     except ValueError:
         return False
 
+
+# The formal spellings of 15-18 are rewritten to the colloquial ones the
+# number tables use, anywhere they appear, in one pass.
+_FORMAL_VARIANT_REGEX = re.compile("|".join(map(re.escape, _FORMAL_VARIANT)))
+
+# Word classes, and what each word of a number is worth
+_VA, _HALF, _UNIT, _TEEN, _TEN, _HUNDRED, _BIG = range(7)
+
+
+def _number_words_fa():
+    words = {}
+    for cls, table, scale in ((_UNIT, _FARSI_ONES[:10], 1),
+                              (_TEEN, _FARSI_ONES[10:], 1),
+                              (_TEN, _FARSI_TENS, 10),
+                              (_HUNDRED, _FARSI_HUNDREDS, 100)):
+        offset = 10 if cls == _TEEN else 0
+        for value, word in enumerate(table):
+            if word:
+                words.setdefault(word, (cls, (value + offset) * scale))
+    for power, word in enumerate(_FARSI_BIG):
+        if word:
+            words.setdefault(word, (_BIG, 10 ** (3 * power)))
+    words["و"] = (_VA, None)
+    words["نیم"] = (_HALF, 0.5)
+    return words
+
+
+_NUMBER_WORDS_FA = _number_words_fa()
+
+# States of the number being read: nothing yet, a multiple of a thousand
+# or more, then the last word of its remainder, on its own or followed
+# by "و" (and)
+_START, _THOUSANDS, _AFTER_ONE, _AFTER_TEN, _AFTER_HUNDRED, _AFTER_ONE_VA, \
+    _AFTER_TEN_VA, _AFTER_HUNDRED_VA = range(8)
+# the states a word of each class carries a number on from; from any other
+# state it starts a new one
+_CONTINUES = {
+    _UNIT: frozenset((_START, _THOUSANDS, _AFTER_HUNDRED_VA, _AFTER_TEN_VA)),
+    _TEEN: frozenset((_START, _THOUSANDS, _AFTER_HUNDRED_VA)),
+    _TEN: frozenset((_START, _THOUSANDS, _AFTER_HUNDRED_VA)),
+    _HUNDRED: frozenset((_START, _THOUSANDS)),
+}
+_NEXT_STATE = {_UNIT: _AFTER_ONE, _TEEN: _AFTER_ONE, _TEN: _AFTER_TEN,
+               _HUNDRED: _AFTER_HUNDRED}
+_VA_STATES = {_AFTER_ONE: _AFTER_ONE_VA, _AFTER_TEN: _AFTER_TEN_VA,
+              _AFTER_HUNDRED: _AFTER_HUNDRED_VA}
+
+
 def _parse_sentence(text):
-    for key, value in _FORMAL_VARIANT.items():
-        text = text.replace(key, value)
-    ar = text.split()
+    """
+    Split a sentence into its words, with the numbers written out in it
+    read into (value, [words]) tuples.
+    """
+    text = _FORMAL_VARIANT_REGEX.sub(
+        lambda match: _FORMAL_VARIANT[match.group()], text)
     result = []
     current_number = 0
     current_words = []
     s = 0
-    step = 10
-    mode = 'init'
-    def finish_num():
-        nonlocal current_number
-        nonlocal s
-        nonlocal result
-        nonlocal mode
-        nonlocal current_words
-        current_number += s
-        if current_number != 0:
-            result.append((current_number, current_words))
-        s = 0
-        current_number = 0
-        current_words = []
-        mode = 'init'
-    for x in ar:
-        if x == "و":
-            if mode == 'num_ten' or mode == 'num_hundred' or mode == 'num_one':
-                mode += '_va'
-                current_words.append(x)
-            elif mode == 'num':
-                current_words.append(x)    
-            else:
-                finish_num()
-                result.append(x)
-        elif x == "نیم":
-            current_words.append(x)
-            current_number += 0.5
-            finish_num()
-        elif x in _FARSI_ONES:
-            t = _FARSI_ONES.index(x)
-            if mode != 'init' and mode != 'num_hundred_va' and mode != 'num':
-                if not(t < 10 and mode == 'num_ten_va'):
-                    finish_num()
-            current_words.append(x)
-            s += t
-            mode = 'num_one'
-        elif x in _FARSI_TENS:
-            if mode != 'init' and mode != 'num_hundred_va' and mode != 'num':
-                finish_num()
+    state = _START
+    for x in text.split():
+        cls, value = _NUMBER_WORDS_FA.get(x, (None, None))
+        if cls in _NEXT_STATE:
+            if state not in _CONTINUES[cls]:
+                current_number += s
+                if current_number != 0:
+                    result.append((current_number, current_words))
+                current_number, current_words, s = 0, [], 0
             current_words.append(x)
-            s += _FARSI_TENS.index(x)*10
-            mode = 'num_ten'
-        elif x in _FARSI_HUNDREDS:
-            if mode != 'init' and mode != 'num':
-                finish_num()
-            current_words.append(x)
-            s += _FARSI_HUNDREDS.index(x)*100
-            mode = 'num_hundred'
-        elif x in _FARSI_BIG:
+            s += value
+            state = _NEXT_STATE[cls]
+            continue
+        if cls == _BIG:
             current_words.append(x)
-            d = _FARSI_BIG.index(x)
-            if mode == 'init' and d == 1:
+            if state == _START and value == 1000:
                 s = 1
-            s *= 10**(3*d)
-            current_number += s
+            current_number += s * value
             s = 0
-            mode = 'num'
-        elif _is_number(x):
+            state = _THOUSANDS
+            continue
+        if cls == _VA and (state in _VA_STATES or state == _THOUSANDS):
+            current_words.append(x)
+            state = _VA_STATES.get(state, _THOUSANDS)
+            continue
+        # anything else ends the current number
+        word = None
+        if cls == _HALF:
+            current_words.append(x)
+            current_number += 0.5
+        elif cls is None and _is_number(x):
             current_words.append(x)
             current_number = float(x)
-            finish_num()
         else:
-            finish_num()
-            result.append(x)
-    if mode[:3] == 'num':
-        finish_num()
+            word = x
+        current_number += s
+        if current_number != 0:
+            result.append((current_number, current_words))
+        if word is not None:
+            result.append(word)
+        current_number, current_words, s = 0, [], 0
+        state = _START
+    current_number += s
+    if current_number != 0:
+        result.append((current_number, current_words))
     return result
 
 
@@ -336,7 +366,8 @@ def is_fractional_fa(input_str, short_scale=True):
     return False
 
 
-def extract_numbers_fa(text, short_scale=True, ordinals=False):
+def extract_numbers_fa(text, short_scale=True, ordinals=False,
+                       spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -347,10 +378,12 @@ def extract_numbers_fa(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): not supported, raises ValueError
     Returns:
         list: list of extracted numbers as floats
     """
-
+    if spans:
+        raise ValueError("spans are not supported in Persian")
     ar = _parse_sentence(text)
     result = []
     for x in ar:
@@ -18,7 +18,7 @@ from dateutil.tz import gettz
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_generic, Normalizer, DatetimeSpanFinder
 from lingua_franca.lang.format_fr import pronounce_number_fr
 from lingua_franca.lang.common_data_fr import _ARTICLES_FR, _NUMBERS_FR, \
     _ORDINAL_ENDINGS_FR
@@ -998,6 +998,48 @@ def extract_datetime_fr(text, anchorDate=None, default_time=None):
     return [extractedDate, resultStr]
 
 
+_DATETIME_SPANS_FR = DatetimeSpanFinder(
+    date_words=['lundi', 'mardi', 'mercredi', 'jeudi', 'vendredi', 'samedi',
+                'dimanche', 'janvier', 'février', 'mars', 'avril', 'mai',
+                'juin', 'juillet', 'août', 'septembre', 'octobre',
+                'novembre', 'décembre', 'jan', 'fév', 'avr', 'juil', 'aoû',
+                'sept', 'oct', 'nov', 'déc',
+                "aujourd'hui", 'demain', 'après-demain', 'hier',
+                'avant-hier', 'maintenant', 'matin', 'matinée',
+                'après-midi', 'soir', 'soirée', 'nuit', 'midi', 'minuit',
+                'jour', 'jours', 'journée', 'semaine', 'semaines',
+                'week-end', 'mois', 'an', 'ans', 'année', 'années', 'heure',
+                'heures', 'minute', 'minutes', 'décennie', 'décennies',
+                'siècle', 'siècles', 'millénaire', 'millénaires'],
+    weak_words=['mar'],
+    unit_words=['seconde', 'secondes', 'h'],
+    links=['à', 'au', 'aux', 'dès', 'autour', 'vers', 'environ', 'environs',
+           'ce', 'cet', 'cette', 'dans', 'après', 'avant', 'le', 'la',
+           'les', "l'", 'de', 'du', 'des', 'prochain', 'prochaine',
+           'dernier', 'dernière', 'il', 'y', 'a', 'depuis', 'en', 'quart',
+           'demie', 'moins'],
+    conjunctions=['et', 'ou', 'puis'],
+    number_words=_NUMBERS_FR)
+
+
+def extract_datetimes_fr(text, anchorDate=None, default_time=None):
+    """ Find every date/time expression in a text
+
+    See extract_datetimes_en for details.
+
+    Args:
+        text (str): string containing date words
+        anchorDate (datetime): A reference date/time for "tommorrow", etc
+        default_time (time): Time to set if no time was found in the string
+
+    Returns:
+        [(datetime, int, int)]: the date, and the start and end character
+                                offsets of the words it was read from
+    """
+    return _DATETIME_SPANS_FR.extract(text, extract_datetime_fr,
+                                      anchorDate, default_time)
+
+
 def is_fractional_fr(input_str, short_scale=True):
     """
     This function takes the given text and checks if it is a fraction.
@@ -1068,7 +1110,8 @@ def normalize_fr(text, remove_articles=True):
     return normalized[1:]  # strip the initial space
 
 
-def extract_numbers_fr(text, short_scale=True, ordinals=False):
+def extract_numbers_fr(text, short_scale=True, ordinals=False,
+                       spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -1079,11 +1122,13 @@ def extract_numbers_fr(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): not supported, see extract_numbers_generic
     Returns:
         list: list of extracted numbers as floats
     """
     return extract_numbers_generic(text, pronounce_number_fr, extract_number_fr,
-                                   short_scale=short_scale, ordinals=ordinals)
+                                   short_scale=short_scale, ordinals=ordinals,
+                                   spans=spans)
 
 
 class FrenchNormalizer(Normalizer):
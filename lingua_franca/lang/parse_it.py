@@ -18,16 +18,16 @@
 
 """
 
-import collections
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 from lingua_franca.time import now_local
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    extract_numbers_generic, Normalizer
+    extract_numbers_generic, Normalizer, CompoundNumeralParser, \
+    GenderResolver
 from lingua_franca.lang.format_it import _LONG_SCALE_IT, _SHORT_SCALE_IT, \
     pronounce_number_it
 from lingua_franca.lang.common_data_it import _SHORT_ORDINAL_STRING_IT, \
-    _ARTICLES_IT, _LONG_ORDINAL_STRING_IT, _STRING_NUM_IT
+    _ARTICLES_IT, _LONG_ORDINAL_STRING_IT, _STRING_NUM_IT, _NUM_STRING_IT
 
 
 def is_fractional_it(input_str, short_scale=False):
@@ -62,6 +62,24 @@ def is_fractional_it(input_str, short_scale=False):
     return False
 
 
+# multipliers from milioni to triliardi, as _extract_number_long_it has
+# always read them, with their singulars: unmilione, unmiliardo
+_MULTIPLIERS_IT = {'cento': 100, 'cent': 100, 'mille': 1000, 'mila': 1000}
+for _num, _name in _SHORT_SCALE_IT.items():
+    if 1000 < _num <= 1e21:
+        _MULTIPLIERS_IT[_name] = int(_num)
+        _MULTIPLIERS_IT[_name[:-1] + ('o' if _name.endswith('iardi')
+                                      else 'e')] = int(_num)
+
+_COMPOUND_NUMERALS_IT = CompoundNumeralParser(
+    dict([(name, num) for num, name in _NUM_STRING_IT.items()] +
+         # elided tens, ventuno, trentotto
+         [(name, num) for name, num in _STRING_NUM_IT.items()
+          if 20 <= num < 100 and name != _NUM_STRING_IT[num]] +
+         [('un', 1)]),
+    _MULTIPLIERS_IT)
+
+
 def _extract_number_long_it(word):
     """
      This function converts a long textual number like
@@ -78,59 +96,6 @@ def _extract_number_long_it(word):
          (bool) or (int): The extracted number or False if no number
                                    was found
     """
-
-    units = {'zero': 0, 'uno': 1, 'due': 2, 'tre': 3, 'quattro': 4,
-             'cinque': 5, 'sei': 6, 'sette': 7, 'otto': 8, 'nove': 9}
-
-    tens = {'dieci': 10, 'venti': 20, 'trenta': 30, 'quaranta': 40,
-            'cinquanta': 50, 'sessanta': 60, 'settanta': 70, 'ottanta': 80,
-            'novanta': 90}
-
-    tens_short = {'vent': 20, 'trent': 30, 'quarant': 40, 'cinquant': 50,
-                  'sessant': 60, 'settant': 70, 'ottant': 80, 'novant': 90}
-
-    nums_long = {'undici': 11, 'dodici': 12, 'tredici': 13, 'quattordici': 14,
-                 'quindici': 15, 'sedici': 16, 'diciassette': 17,
-                 'diciotto': 18, 'diciannove': 19}
-
-    multipli_it = collections.OrderedDict([
-        # (1e63, 'deciliardi'),
-        # (1e60, 'decilioni'),
-        # (1e57, 'noviliardi'),
-        # (1e54, 'novilioni'),
-        # (1e51, 'ottiliardi'),
-        # (1e48, 'ottilioni'),
-        # (1e45, 'settiliardi'),
-        # (1e42, 'settilioni'),
-        # (1e39, 'sestiliardi'),
-        # (1e36, 'sestilioni'),
-        # (1e33, 'quintiliardi'),
-        # (1e30, 'quintilioni'),
-        # (1e27, 'quadriliardi'),
-        # (1e24, 'quadrilioni'),    # yotta
-        (1e21, 'triliardi'),  # zetta
-        (1e18, 'trilioni'),  # exa
-        (1e15, 'biliardi'),  # peta
-        (1e12, 'bilioni'),  # tera
-        (1e9, 'miliardi'),  # giga
-        (1e6, 'milioni')  # mega
-    ])
-
-    multiplier = {}
-    un_multiplier = {}
-
-    for num in multipli_it:
-        if num > 1000 and num <= 1e21:
-            # plurali
-            multiplier[multipli_it[num]] = int(num)
-            # singolari - modificare per eccezioni *liardo
-            if multipli_it[num][-5:-1] == 'iard':
-                un_multiplier['un' + multipli_it[num][:-1] + 'o'] = int(num)
-            else:
-                un_multiplier['un' + multipli_it[num][:-1] + 'e'] = int(num)
-
-    value = False
-
     # normalizza ordinali singoli o plurali -esimo -esimi
     if word[-5:-1] == 'esim':
         base = word[:-5]
@@ -145,83 +110,10 @@ def _extract_number_long_it(word):
 
         word = base
 
-    for item in un_multiplier:
-        components = word.split(item, 1)
-        if len(components) == 2:
-            if not components[0]:  # inizia con un1^x
-                if not components[1]:  # unmilione
-                    word = str(int(un_multiplier[item]))
-                else:  # unmilione + x
-                    word = str(int(un_multiplier[item]) +
-                               _extract_number_long_it(components[1]))
-
-    for item in multiplier:
-        components = word.split(item, 1)
-        if len(components) == 2:
-            if not components[0]:  # inizia con un1^x
-                word = str(int(multiplier[item]) +
-                           _extract_number_long_it(components[1]))
-            else:
-                if not components[1]:
-                    word = str(_extract_number_long_it(components[0])) + '*' \
-                        + str(int(multiplier[item]))
-                else:
-                    word = str(_extract_number_long_it(components[0])) + '*' \
-                        + str(int(multiplier[item])) + '+' \
-                        + str(_extract_number_long_it(components[1]))
-
-    for item in tens:
-        word = word.replace(item, '+' + str(tens[item]))
-
-    for item in tens_short:
-        word = word.replace(item, '+' + str(tens_short[item]))
-
-    for item in nums_long:
-        word = word.replace(item, '+' + str(nums_long[item]))
-
-    word = word.replace('cento', '+1xx')
-    word = word.replace('cent', '+1xx')
-    word = word.replace('mille', '+1000')  # unmilionemille
-    word = word.replace('mila', '*1000')  # unmilioneduemila
-
-    for item in units:
-        word = word.replace(item, '+' + str(units[item]))
-
-    # normalizzo i cento
-    occorrenze = word.count('+1xx')
-    for _ in range(0, occorrenze):
-        components = word.rsplit('+1xx', 1)
-        if len(components[0]) > 1 and components[0].endswith('0'):
-            word = components[0] + '+100' + components[1]
-        else:
-            word = components[0] + '*100' + components[1]
-
-    components = word.rsplit('*1000', 1)
-    if len(components) == 2:
-        if components[0].startswith('*'):  # centomila
-            components[0] = components[0][1:]
-        word = str(_extract_number_long_it(components[0])) + \
-            '*1000' + str(components[1])
-
-    # gestione eccezioni
-    if word.startswith('*') or word.startswith('+'):
-        word = word[1:]
-
-    addends = word.split('+')
-    for c, _ in enumerate(addends):
-        if '*' in addends[c]:
-            factors = addends[c].split('*')
-            result = int(factors[0]) * int(factors[1])
-            if len(factors) == 3:
-                result *= int(factors[2])
-            addends[c] = str(result)
-
-    # check if all token are numbers
-    if all([s.isdecimal() for s in addends]):
-        value = sum([int(s) for s in addends])
-    else:
-        value = False
-    return value
+    if word.isdecimal():
+        return int(word)
+    value = _COMPOUND_NUMERALS_IT.value(word)
+    return False if value is None else value
 
 
 def extract_number_it(text, short_scale=False, ordinals=False):
@@ -1123,32 +1015,34 @@ def extract_datetime_it(text, anchorDate=None, default_time=None):
     return [extracted_date, result_str]
 
 
+_GENDER_RESOLVER_IT = GenderResolver(
+    [("f", ["a", "e"]), ("m", ["o", "n", "l", "i"])])
+
+
 def get_gender_it(word, context=""):
     """
     In Italian to define the grammatical gender of a word is necessary
     analyze the article that precedes the word and not only the last
     letter of the word.
     """
+    return _GENDER_RESOLVER_IT.get_gender(word, context)
+
 
-    gender = None
-    words = context.split(' ')
-    for idx, w in enumerate(words):
-        if w == word and idx != 0:
-            previous = words[idx - 1]
-            gender = get_gender_it(previous)
-            break
+def get_genders_it(words, context=""):
+    """ Guess the gender of several words from the same context
 
-    if not gender:
-        if word[-1] == 'a' or word[-1] == 'e':
-            gender = 'f'
-        if word[-1] == 'o' or word[-1] == 'n' \
-                or word[-1] == 'l' or word[-1] == 'i':
-            gender = 'm'
+    Args:
+        words (list(str)): The words to look up
+        context (str, optional): String containing the words, for context
 
-    return gender
+    Returns:
+        list(str): get_gender_it() of each word
+    """
+    return _GENDER_RESOLVER_IT.get_genders(words, context)
 
 
-def extract_numbers_it(text, short_scale=False, ordinals=False):
+def extract_numbers_it(text, short_scale=False, ordinals=False,
+                       spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -1159,12 +1053,14 @@ def extract_numbers_it(text, short_scale=False, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): not supported, see extract_numbers_generic
     Returns:
         list: list of extracted numbers as floats
     """
     return extract_numbers_generic(text, pronounce_number_it,
                                    extract_number_it,
-                                   short_scale=short_scale, ordinals=ordinals)
+                                   short_scale=short_scale, ordinals=ordinals,
+                                   spans=spans)
 
 
 class ItalianNormalizer(Normalizer):
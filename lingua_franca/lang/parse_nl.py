@@ -18,7 +18,9 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from .parse_common import is_numeric, look_for_fractions, Token, \
-    ReplaceableNumber, tokenize, partition_list, Normalizer, invert_dict
+    ReplaceableNumber, tokenize, partition_tokens, Normalizer, invert_dict, \
+    extract_numbers_with_text, convert_words_to_numbers, \
+    extract_number_values
 from .common_data_nl import _SHORT_ORDINAL_STRING_NL, _ARTICLES_NL, \
     _DECIMAL_MARKER_NL, _FRACTION_MARKER_NL, _LONG_ORDINAL_STRING_NL,\
     _LONG_SCALE_NL, _MULTIPLIES_LONG_SCALE_NL, _MULTIPLIES_SHORT_SCALE_NL,\
@@ -40,26 +42,9 @@ def _convert_words_to_numbers_nl(text, short_scale=True, ordinals=False):
         str
         The original text, with numbers subbed in where appropriate.
     """
-    text = text.lower()
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_nl(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-
-    return ' '.join(results)
+    return convert_words_to_numbers(
+        text.lower(), lambda tokens: _extract_numbers_with_text_nl(
+            tokens, short_scale, ordinals))
 
 
 def _extract_numbers_with_text_nl(tokens, short_scale=True,
@@ -79,26 +64,9 @@ def _extract_numbers_with_text_nl(tokens, short_scale=True,
         [_ReplaceableNumber]: A list of tuples, each containing a number and a
                          string.
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_nl(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens, lambda tokens: _extract_number_with_text_nl(
+            tokens, short_scale, ordinals, fractional_numbers))
 
 
 def _extract_number_with_text_nl(tokens, short_scale=True,
@@ -171,7 +139,7 @@ def _extract_fraction_with_text_nl(tokens, short_scale, ordinals):
         (None, None) if no fraction value is found.
     """
     for c in _FRACTION_MARKER_NL:
-        partitions = partition_list(tokens, lambda t: t.word == c)
+        partitions = partition_tokens(tokens, c)
 
         if len(partitions) == 3:
             numbers1 = \
@@ -217,7 +185,7 @@ def _extract_decimal_with_text_nl(tokens, short_scale, ordinals):
         (None, None) if no decimal value is found.
     """
     for c in _DECIMAL_MARKER_NL:
-        partitions = partition_list(tokens, lambda t: t.word == c)
+        partitions = partition_tokens(tokens, c)
 
         if len(partitions) == 3:
             numbers1 = \
@@ -1294,7 +1262,8 @@ def is_fractional_nl(input_str, short_scale=True):
     return False
 
 
-def extract_numbers_nl(text, short_scale=True, ordinals=False):
+def extract_numbers_nl(text, short_scale=True, ordinals=False,
+                       spans=False):
     """Takes in a string and extracts a list of numbers.
 
     Args:
@@ -1304,12 +1273,15 @@ def extract_numbers_nl(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): also return where each number is in text
     Returns:
-        list: list of extracted numbers as floats
+        list: list of extracted numbers as floats, or with spans, of
+            (float, start, end) tuples, where text[start:end] are the
+            words the number was read from
     """
-    results = _extract_numbers_with_text_nl(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return extract_number_values(
+        text, lambda tokens: _extract_numbers_with_text_nl(
+            tokens, short_scale, ordinals), spans)
 
 
 def normalize_nl(text, remove_articles=True):
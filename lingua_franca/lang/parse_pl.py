@@ -18,7 +18,9 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token
+    invert_dict, ReplaceableNumber, partition_tokens, tokenize, Token, \
+    extract_numbers_with_text, convert_words_to_numbers, \
+    extract_number_values
 from lingua_franca.lang.common_data_pl import _NUM_STRING_PL, \
     _SHORT_SCALE_PL, _SHORT_ORDINAL_PL, _FRACTION_STRING_PL, _TIME_UNITS_CONVERSION, \
     _TIME_UNITS_NORMALIZATION, _MONTHS_TO_EN, _DAYS_TO_EN, _ORDINAL_BASE_PL, \
@@ -123,26 +125,9 @@ def _convert_words_to_numbers_pl(text, short_scale=True, ordinals=False):
         The original text, with numbers subbed in where appropriate.
 
     """
-    text = text.lower()
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_pl(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-
-    return ' '.join(results)
+    return convert_words_to_numbers(
+        text.lower(), lambda tokens: _extract_numbers_with_text_pl(
+            tokens, short_scale, ordinals))
 
 
 def _extract_numbers_with_text_pl(tokens, short_scale=True,
@@ -165,26 +150,9 @@ def _extract_numbers_with_text_pl(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_pl(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens, lambda tokens: _extract_number_with_text_pl(
+            tokens, short_scale, ordinals, fractional_numbers))
 
 
 def _extract_number_with_text_pl(tokens, short_scale=True,
@@ -261,7 +229,7 @@ def _extract_fraction_with_text_pl(tokens, short_scale, ordinals):
 
     """
     for c in _FRACTION_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
+        partitions = partition_tokens(tokens, c)
 
         if len(partitions) == 3:
             numbers1 = \
@@ -309,7 +277,7 @@ def _extract_decimal_with_text_pl(tokens, short_scale, ordinals):
 
     """
     for c in _DECIMAL_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
+        partitions = partition_tokens(tokens, c)
 
         if len(partitions) == 3:
             numbers1 = \
@@ -1333,7 +1301,8 @@ def isFractional_pl(input_str, short_scale=True):
     return False
 
 
-def extract_numbers_pl(text, short_scale=True, ordinals=False):
+def extract_numbers_pl(text, short_scale=True, ordinals=False,
+                       spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -1344,12 +1313,15 @@ def extract_numbers_pl(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): also return where each number is in text
     Returns:
-        list: list of extracted numbers as floats
+        list: list of extracted numbers as floats, or with spans, of
+            (float, start, end) tuples, where text[start:end] are the
+            words the number was read from
     """
-    results = _extract_numbers_with_text_pl(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return extract_number_values(
+        text, lambda tokens: _extract_numbers_with_text_pl(
+            tokens, short_scale, ordinals), spans)
 
 
 def normalize_word_pl(word):
@@ -27,7 +27,7 @@ from lingua_franca.lang.common_data_pt import _NUMBERS_PT, \
     _FEMALE_DETERMINANTS_PT, _FEMALE_ENDINGS_PT, \
     _MALE_DETERMINANTS_PT, _MALE_ENDINGS_PT, _GENDERS_PT
 from lingua_franca.internal import resolve_resource_file
-from lingua_franca.lang.parse_common import Normalizer
+from lingua_franca.lang.parse_common import Normalizer, GenderResolver
 from lingua_franca.time import now_local
 import json
 import re
@@ -1044,6 +1044,15 @@ def _pt_pruning(text, symbols=True, accents=True, agressive=True):
     return text
 
 
+# in portuguese usually the previous word (a determinant) assigns gender
+# to the next word; failing that, the last vowel usually defines it
+_GENDER_RESOLVER_PT = GenderResolver(
+    [("f", _FEMALE_ENDINGS_PT), ("m", _MALE_ENDINGS_PT)], _GENDERS_PT,
+    {**dict.fromkeys(_FEMALE_DETERMINANTS_PT, "f"),
+     **dict.fromkeys(_MALE_DETERMINANTS_PT, "m")},
+    lowercase=True)
+
+
 def get_gender_pt(word, context=""):
     """ Guess the gender of a word
 
@@ -1058,32 +1067,17 @@ def get_gender_pt(word, context=""):
         str: The code "m" (male), "f" (female) or "n" (neutral) for the gender,
              or None if unknown/or unused in the given language.
     """
-    # parse gender taking context into account
-    word = word.lower()
-    words = context.lower().split(" ")
-    for idx, w in enumerate(words):
-        if w == word and idx != 0:
-            # in portuguese usually the previous word (a determinant)
-            # assigns gender to the next word
-            previous = words[idx - 1].lower()
-            if previous in _MALE_DETERMINANTS_PT:
-                return "m"
-            elif previous in _FEMALE_DETERMINANTS_PT:
-                return "f"
-
-    # get gender using only the individual word
-    # see if this word has the gender defined
-    if word in _GENDERS_PT:
-        return _GENDERS_PT[word]
-    singular = word.rstrip("s")
-    if singular in _GENDERS_PT:
-        return _GENDERS_PT[singular]
-    # in portuguese the last vowel usually defines the gender of a word
-    # the gender of the determinant takes precedence over this rule
-    for end_str in _FEMALE_ENDINGS_PT:
-        if word.endswith(end_str):
-            return "f"
-    for end_str in _MALE_ENDINGS_PT:
-        if word.endswith(end_str):
-            return "m"
-    return None
+    return _GENDER_RESOLVER_PT.get_gender(word, context)
+
+
+def get_genders_pt(words, context=""):
+    """ Guess the gender of several words from the same context
+
+    Args:
+        words (list(str)): The words to look up
+        context (str, optional): String containing the words, for context
+
+    Returns:
+        list(str): get_gender_pt() of each word
+    """
+    return _GENDER_RESOLVER_PT.get_genders(words, context)
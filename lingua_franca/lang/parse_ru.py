@@ -18,7 +18,10 @@ from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
 from lingua_franca.lang.parse_common import is_numeric, look_for_fractions, \
-    invert_dict, ReplaceableNumber, partition_list, tokenize, Token, Normalizer
+    invert_dict, ReplaceableNumber, partition_tokens, tokenize, Token, \
+    Normalizer, compile_inflections, DurationExtractor, \
+    extract_numbers_with_text, convert_words_to_numbers, \
+    extract_number_values
 from lingua_franca.lang.common_data_ru import _NUM_STRING_RU, \
     _LONG_ORDINAL_RU, _LONG_SCALE_RU, _SHORT_SCALE_RU, _SHORT_ORDINAL_RU, \
     _FRACTION_STRING_RU, _MONTHS_CONVERSION, _MONTHS_RU, _TIME_UNITS_CONVERSION, \
@@ -142,26 +145,9 @@ def _convert_words_to_numbers_ru(text, short_scale=True, ordinals=False):
         The original text, with numbers subbed in where appropriate.
 
     """
-    text = text.lower()
-    tokens = tokenize(text)
-    numbers_to_replace = \
-        _extract_numbers_with_text_ru(tokens, short_scale, ordinals)
-    numbers_to_replace.sort(key=lambda number: number.start_index)
-
-    results = []
-    for token in tokens:
-        if not numbers_to_replace or \
-                token.index < numbers_to_replace[0].start_index:
-            results.append(token.word)
-        else:
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].start_index:
-                results.append(str(numbers_to_replace[0].value))
-            if numbers_to_replace and \
-                    token.index == numbers_to_replace[0].end_index:
-                numbers_to_replace.pop(0)
-
-    return ' '.join(results)
+    return convert_words_to_numbers(
+        text.lower(), lambda tokens: _extract_numbers_with_text_ru(
+            tokens, short_scale, ordinals))
 
 
 def _extract_numbers_with_text_ru(tokens, short_scale=True,
@@ -184,26 +170,9 @@ def _extract_numbers_with_text_ru(tokens, short_scale=True,
                          string.
 
     """
-    placeholder = "<placeholder>"  # inserted to maintain correct indices
-    results = []
-    while True:
-        to_replace = \
-            _extract_number_with_text_ru(tokens, short_scale,
-                                         ordinals, fractional_numbers)
-
-        if not to_replace:
-            break
-
-        results.append(to_replace)
-
-        tokens = [
-            t if not
-            to_replace.start_index <= t.index <= to_replace.end_index
-            else
-            Token(placeholder, t.index) for t in tokens
-        ]
-    results.sort(key=lambda n: n.start_index)
-    return results
+    return extract_numbers_with_text(
+        tokens, lambda tokens: _extract_number_with_text_ru(
+            tokens, short_scale, ordinals, fractional_numbers))
 
 
 def _extract_number_with_text_ru(tokens, short_scale=True,
@@ -280,7 +249,7 @@ def _extract_fraction_with_text_ru(tokens, short_scale, ordinals):
 
     """
     for c in _FRACTION_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
+        partitions = partition_tokens(tokens, c)
 
         if len(partitions) == 3:
             numbers1 = \
@@ -328,7 +297,7 @@ def _extract_decimal_with_text_ru(tokens, short_scale, ordinals):
 
     """
     for c in _DECIMAL_MARKER:
-        partitions = partition_list(tokens, lambda t: t.word == c)
+        partitions = partition_tokens(tokens, c)
 
         if len(partitions) == 3:
             numbers1 = \
@@ -630,6 +599,12 @@ def extract_number_ru(text, short_scale=True, ordinals=False):
                                         short_scale, ordinals).value
 
 
+# Russian inflection for time: минута, минуты, минут - safe to use минута as
+# pattern. For day: день, дня, дней - short pattern not applicable, list all
+_DURATION_EXTRACTOR_RU = DurationExtractor(
+    list(_TIME_UNITS_CONVERSION.items()), suffix="(?:а|ов|у|ут|уту)?")
+
+
 def extract_duration_ru(text):
     """
     Convert an english phrase into a number of seconds
@@ -659,35 +634,8 @@ def extract_duration_ru(text):
     if not text:
         return None
 
-    # Russian inflection for time: минута, минуты, минут - safe to use минута as pattern
-    # For day: день, дня, дней - short pattern not applicable, list all
-
-    time_units = {
-        'microseconds': 0,
-        'milliseconds': 0,
-        'seconds': 0,
-        'minutes': 0,
-        'hours': 0,
-        'days': 0,
-        'weeks': 0
-    }
-
-    pattern = r"(?P<value>\d+(?:\.?\d+)?)(?:\s+|\-){unit}(?:а|ов|у|ут|уту)?"
-    text = _convert_words_to_numbers_ru(text)
-
-    for (unit_ru, unit_en) in _TIME_UNITS_CONVERSION.items():
-        unit_pattern = pattern.format(unit=unit_ru)
-
-        def repl(match):
-            time_units[unit_en] += float(match.group(1))
-            return ''
-
-        text = re.sub(unit_pattern, repl, text)
-
-    text = text.strip()
-    duration = timedelta(**time_units) if any(time_units.values()) else None
-
-    return duration, text
+    return _DURATION_EXTRACTOR_RU.extract(
+        _convert_words_to_numbers_ru(text))
 
 
 def extract_datetime_ru(text, anchor_date=None, default_time=None):
@@ -1577,7 +1525,8 @@ def is_fractional_ru(input_str, short_scale=True):
     return False
 
 
-def extract_numbers_ru(text, short_scale=True, ordinals=False):
+def extract_numbers_ru(text, short_scale=True, ordinals=False,
+                       spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -1588,12 +1537,15 @@ def extract_numbers_ru(text, short_scale=True, ordinals=False):
             is now common in most English speaking countries.
             See https://en.wikipedia.org/wiki/Names_of_large_numbers
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
+        spans (bool): also return where each number is in text
     Returns:
-        list: list of extracted numbers as floats
+        list: list of extracted numbers as floats, or with spans, of
+            (float, start, end) tuples, where text[start:end] are the
+            words the number was read from
     """
-    results = _extract_numbers_with_text_ru(tokenize(text),
-                                            short_scale, ordinals)
-    return [float(result.value) for result in results]
+    return extract_number_values(
+        text, lambda tokens: _extract_numbers_with_text_ru(
+            tokens, short_scale, ordinals), spans)
 
 
 class RussianNormalizer(Normalizer):
@@ -1606,6 +1558,54 @@ def normalize_ru(text, remove_articles=True):
     return RussianNormalizer().normalize(text, remove_articles)
 
 
+def _month_inflections_ru():
+    """
+    Reverse index of the month suffix rule: "апреле", "апреля" -> "апрель"
+    """
+    entries = []
+    for name in _MONTHS_RU:
+        if name[-1] == "ь" and name[-2] in "лнр":
+            entries.append((name, [name[:-1] + "е", name[:-1] + "я"]))
+    return entries
+
+
+_INFLECTIONS_RU = compile_inflections(
+    {
+        # _extract_whole_number_with_text_ru
+        1: [
+            ("один", ["одна", "одним", "одно", "одной"]),
+            ("два", ["две"]),
+            ("пара", ["пару"]),
+        ],
+        # extract_datetime_ru
+        2: [
+            ("час", ["часа", "часам", "часами", "часов", "часу"]),
+            ("минута", ["минут", "минутам", "минутами", "минуту", "минуты"]),
+            ("секунда",
+             ["секунд", "секундам", "секундами", "секунду", "секунды"]),
+            ("день", ["дней", "дни"]),
+            ("неделя", ["неделе", "недели", "недель"]),
+            ("месяц", ["месяца", "месяцев"]),
+            ("год", ["года", "лет"]),
+            ("утром", _WORDS_MORNING_RU),
+            ("полдень", ["полудне", "полудня"]),
+            ("вечером", _WORDS_EVENING_RU),
+            ("ночь", _WORDS_NIGHT_RU),
+            ("выходные", ["викенд", "выходным", "выходных"]),
+            ("век", ["столетие", "столетий", "столетия"]),
+            # Week days
+            ("среда", ["среду", "среды"]),
+            ("пятница", ["пятницу", "пятницы"]),
+            ("суббота", ["субботу", "субботы"]),
+            # Months
+            ("март", ["марта", "марте"]),
+            ("май", ["мае", "мая"]),
+            ("август", ["августа", "августе"]),
+        ] + _month_inflections_ru(),
+    },
+    shared=[("тысяча", ["тысяч", "тысячи"])])
+
+
 def _text_ru_inflection_normalize(word, arg):
     """
     Russian Inflection normalizer.
@@ -1621,65 +1621,4 @@ def _text_ru_inflection_normalize(word, arg):
         word [Word]
 
     """
-    if word in ["тысяч", "тысячи"]:
-        return "тысяча"
-
-    if arg == 1:  # _extract_whole_number_with_text_ru
-        if word in ["одна", "одним", "одно", "одной"]:
-            return "один"
-        if word == "две":
-            return "два"
-        if word == "пару":
-            return "пара"
-
-    elif arg == 2:  # extract_datetime_ru
-        if word in ["часа", "часам", "часами", "часов", "часу"]:
-            return "час"
-        if word in ["минут", "минутам", "минутами", "минуту", "минуты"]:
-            return "минута"
-        if word in ["секунд", "секундам", "секундами", "секунду", "секунды"]:
-            return "секунда"
-        if word in ["дней", "дни"]:
-            return "день"
-        if word in ["неделе", "недели", "недель"]:
-            return "неделя"
-        if word in ["месяца", "месяцев"]:
-            return "месяц"
-        if word in ["года", "лет"]:
-            return "год"
-        if word in _WORDS_MORNING_RU:
-            return "утром"
-        if word in ["полудне", "полудня"]:
-            return "полдень"
-        if word in _WORDS_EVENING_RU:
-            return "вечером"
-        if word in _WORDS_NIGHT_RU:
-            return "ночь"
-        if word in ["викенд", "выходным", "выходных"]:
-            return "выходные"
-        if word in ["столетие", "столетий", "столетия"]:
-            return "век"
-
-        # Week days
-        if word in ["среду", "среды"]:
-            return "среда"
-        if word in ["пятницу", "пятницы"]:
-            return "пятница"
-        if word in ["субботу", "субботы"]:
-            return "суббота"
-
-        # Months
-        if word in ["марта", "марте"]:
-            return "март"
-        if word in ["мае", "мая"]:
-            return "май"
-        if word in ["августа", "августе"]:
-            return "август"
-
-        if word[-2:] in ["ле", "ля", "не", "ня", "ре", "ря"]:
-            tmp = word[:-1] + "ь"
-            for name in _MONTHS_RU:
-                if name == tmp:
-                    return name
-
-    return word
+    return _INFLECTIONS_RU.get((arg, word), word)
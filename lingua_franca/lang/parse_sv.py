@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+from collections import deque
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 
@@ -22,6 +23,41 @@ from .parse_common import (is_numeric, look_for_fractions, Normalizer,
                            tokenize, Token)
 
 
+# words setting the duration parser to collect numbers for a time "size"
+_DURATION_UNITS_SV = {}
+for _unit, _words in (
+        ('days', ('dygn', 'dag', 'dagar', 'dags')),
+        ('hours', ('timmar', 'timme', 'timma', 'timmes', 'timmas')),
+        ('minutes', ('minuter', 'minuters', 'minut', 'minuts')),
+        ('seconds', ('sekunder', 'sekunders', 'sekund', 'sekunds'))):
+    _DURATION_UNITS_SV.update(dict.fromkeys(_words, _unit))
+del _unit, _words
+_BINDING_WORDS_SV = ('och',)
+_HALF_HOUR_SV = ('halvtimme', 'halvtimma')
+
+
+def _word_to_number_sv(word):
+    """extract_number_sv() of a single word, from the lexicon where possible.
+
+    Args:
+        word (str): a token
+
+    Returns:
+        (int) or (float) or False: the value of the word, False if none
+    """
+    word = word.lower()
+    value = _NUMBER_WORDS_SV.get(word)
+    if value is not None:
+        return value
+    try:
+        return float(word) or False
+    except ValueError:
+        pass
+    if '/' in word:
+        return extract_number_sv(word)  # e.g. "3/4"
+    return False
+
+
 def _find_numbers_in_text(tokens):
     """Finds duration related numbers in texts and makes a list of mappings.
 
@@ -36,21 +72,21 @@ def _find_numbers_in_text(tokens):
         tokens: Tokens to parse
 
     Returns:
-        list of (number, token) tuples
+        deque of (number, token) tuples
     """
-    parts = []
+    parts = deque()
     for tok in tokens:
-        res = extract_number_sv(tok.word)
+        res = _word_to_number_sv(tok.word)
         if res:
-            parts.insert(0, (res, tok))
+            parts.appendleft((res, tok))
             # Special case for quarter of an hour
             if tok.word == 'kvart':
-                parts.insert(0, (None, Token('timmar', index=-1)))
-        elif tok.word in ['halvtimme', 'halvtimma']:
-            parts.insert(0, (30, tok))
-            parts.insert(0, (None, Token('minuter', index=-1)))
+                parts.appendleft((None, Token('timmar', index=-1)))
+        elif tok.word in _HALF_HOUR_SV:
+            parts.appendleft((30, tok))
+            parts.appendleft((None, Token('minuter', index=-1)))
         else:
-            parts.insert(0, (None, tok))
+            parts.appendleft((None, tok))
     return parts
 
 
@@ -64,21 +100,18 @@ def _combine_adjacent_numbers(number_map):
         (list): simplified number_map
     """
     simplified = []
-    skip = False
-    for i in range(len(number_map) - 1):
-        if skip:
-            skip = False
-            continue
-        if number_map[i][0] and number_map[i + 1][0]:
-            combined_number = number_map[i][0] * number_map[i + 1][0]
-            combined_tokens = (number_map[i][1], number_map[i + 1][1])
-            simplified.append((combined_number, combined_tokens))
-            skip = True
+    previous = None
+    for number, tok in number_map:
+        if previous is None:
+            previous = (number, tok)
+        elif previous[0] and number:
+            simplified.append((previous[0] * number, (previous[1], tok)))
+            previous = None
         else:
-            simplified.append((number_map[i][0], (number_map[i][1],)))
-
-    if not skip:
-        simplified.append((number_map[-1][0], (number_map[-1][1],)))
+            simplified.append((previous[0], (previous[1],)))
+            previous = (number, tok)
+    if previous is not None:
+        simplified.append((previous[0], (previous[1],)))
     return simplified
 
 
@@ -122,34 +155,22 @@ def extract_duration_sv(text):
         'seconds': 0
     }
 
-    # Parser state, mapping words that should set the parser to collect
-    # numbers to a specific time "size"
-    state_words = {
-        'days': ('dygn', 'dag', 'dagar', 'dags'),
-        'hours': ('timmar', 'timme', 'timma', 'timmes', 'timmas'),
-        'minutes': ('minuter', 'minuters', 'minut', 'minuts'),
-        'seconds': ('sekunder', 'sekunders', 'sekund', 'sekunds')
-    }
-    binding_words = ('och')
-
-    consumed = []
+    consumed = set()
     state = None
     valid = False
 
     for num, toks in simplified:
         if state and num:
             states[state] += num
-            consumed.extend(toks)
+            consumed.update(toks)
             valid = True  # If a state field got set this is valid duration
         elif num is None:
-            for s in state_words:
-                if toks[0].word in state_words[s]:
-                    state = s
-                    consumed.extend(toks)
-                    break
-            else:
-                if toks[0].word not in binding_words:
-                    state = None
+            unit = _DURATION_UNITS_SV.get(toks[0].word)
+            if unit:
+                state = unit
+                consumed.update(toks)
+            elif toks[0].word not in _BINDING_WORDS_SV:
+                state = None
 
     td = timedelta(**states)
     remainder = ' '.join([t.word for t in tokens if t not in consumed])
@@ -884,11 +905,8 @@ def is_fractional_sv(input_str, short_scale=True):
     if input_str.endswith('s', -1):
         input_str = input_str[:len(input_str) - 1]  # e.g. "halva"
 
-    aFrac = ["hel", "halv", "tredjedel", "fjärdedel", "femtedel", "sjättedel",
-             "sjundedel", "åttondel", "niondel", "tiondel", "elftedel",
-             "tolftedel"]
-    if input_str.lower() in aFrac:
-        return 1.0 / (aFrac.index(input_str) + 1)
+    if input_str.lower() in _FRACTIONS_SV:
+        return 1.0 / (_FRACTIONS_SV.index(input_str) + 1)
     if input_str == "kvart":
         return 1.0 / 4
     if input_str == "trekvart":
@@ -897,6 +915,36 @@ def is_fractional_sv(input_str, short_scale=True):
     return False
 
 
+_FRACTIONS_SV = ["hel", "halv", "tredjedel", "fjärdedel", "femtedel",
+                 "sjättedel", "sjundedel", "åttondel", "niondel", "tiondel",
+                 "elftedel", "tolftedel"]
+
+
+def _number_words_sv():
+    """The words extract_number_sv() reads a number from, except numerals.
+
+    Fractions take any of the endings is_fractional_sv() strips, in the
+    order it strips them.
+    """
+    words = ["första", "andra", "tredje", "fjärde", "femte", "sjätte",
+             "en", "ett", "två", "tre", "fyra", "fem", "sex", "sju", "åtta",
+             "nio", "tio"]
+    for base in _FRACTIONS_SV + ["kvart", "trekvart"]:
+        stems = [base]
+        for ending in ('s', 'a', 'ar', 'ars'):
+            stems += [stem + ending for stem in stems]
+        words += stems
+    lexicon = {}
+    for word in words:
+        value = extract_number_sv(word)
+        if value:
+            lexicon[word] = value
+    return lexicon
+
+
+_NUMBER_WORDS_SV = _number_words_sv()
+
+
 def normalize_sv(text, remove_articles=True):
     """ English string normalization """
 
@@ -14,25 +14,212 @@
 # limitations under the License.
 #
 
+from collections import Counter, OrderedDict, defaultdict
+from datetime import datetime
 from difflib import SequenceMatcher
+from functools import wraps
+from heapq import nlargest
+from inspect import signature
+from threading import Lock
 from warnings import warn
-from lingua_franca.time import now_local
+from zlib import crc32
+from lingua_franca import config
+from lingua_franca.time import now_local, to_local
 from lingua_franca.internal import populate_localized_function_dict, \
     get_active_langs, get_full_lang_code, get_primary_lang_code, \
-    get_default_lang, localized_function, _raise_unsupported_language
+    get_default_lang, localized_function, _raise_unsupported_language, \
+    FunctionNotLocalizedError
 
 _REGISTERED_FUNCTIONS = ("extract_numbers",
                          "extract_number",
                          "extract_duration",
                          "extract_datetime",
+                         "extract_datetimes",
                          "normalize",
                          "get_gender",
+                         "get_genders",
                          "is_fractional",
                          "is_ordinal")
 
 populate_localized_function_dict("parse", langs=get_active_langs())
 
 
+class _DatetimeCache:
+    """LRU cache of extract_datetime() results, rebased onto new anchors.
+
+    Entries are keyed by language, whitespace-normalized text, default_time
+    and the anchor truncated to the minute (the "bucket"). The first miss
+    only records the anchor and its result as 'pending'; the same text
+    asked again at another anchor in the bucket is parsed once more, and
+    comparing both results tells how the output depends on the anchor's
+    seconds and microseconds:
+
+        'absolute' -- it doesn't, the stored result is returned as is
+        'exact' -- it moves with the anchor, e.g. "in 5 minutes"
+        'second' -- it moves with the anchor truncated to the second
+
+    Results which fit none of these are marked 'uncached', and hits on
+    such entries simply call the parser again.
+
+    Enabled by `lingua_franca.config.cache_extract_datetime`, bounded by
+    `lingua_franca.config.extract_datetime_cache_size`.
+    """
+
+    def __init__(self):
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {"hits": self.hits,
+                    "misses": self.misses,
+                    "evictions": self.evictions,
+                    "size": len(self._entries),
+                    "maxsize": config.extract_datetime_cache_size,
+                    "hit_rate": self.hits / lookups if lookups else 0.0}
+
+    def _get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def _put(self, key, entry):
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(config.extract_datetime_cache_size,
+                                           0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    @staticmethod
+    def _classify(anchor, result, probe, probe_result):
+        if result is None or probe_result is None:
+            if result is None and probe_result is None:
+                return 'absolute', None, ''
+            return 'uncached', None, None
+        if result[1] != probe_result[1]:
+            return 'uncached', None, None
+        if result[0] == probe_result[0]:
+            return 'absolute', result[0], result[1]
+        offset = result[0] - anchor
+        if probe_result[0] - probe == offset:
+            return 'exact', offset, result[1]
+        offset = result[0] - anchor.replace(microsecond=0)
+        if probe_result[0] - probe.replace(microsecond=0) == offset:
+            return 'second', offset, result[1]
+        return 'uncached', None, None
+
+    @staticmethod
+    def _rebase(entry, anchor):
+        mode, value, remainder = entry
+        if mode == 'absolute':
+            return None if value is None else [value, remainder]
+        if mode == 'exact':
+            return [anchor + value, remainder]
+        return [anchor.replace(microsecond=0) + value, remainder]
+
+    def cached(self, func):
+        """Decorator for extract_datetime(); a no-op unless enabled."""
+        func_signature = signature(func)
+
+        @wraps(func)
+        def call_cached(*args, **kwargs):
+            if not config.cache_extract_datetime:
+                return func(*args, **kwargs)
+            bound = func_signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            text = bound.arguments["text"]
+            anchor = bound.arguments["anchorDate"]
+            lang = bound.arguments["lang"]
+            default_time = bound.arguments["default_time"]
+            if not isinstance(text, str) or \
+                    not (anchor is None or isinstance(anchor, datetime)):
+                return func(*args, **kwargs)
+            if anchor is None:
+                anchor = now_local()
+            elif anchor.tzinfo is None and config.inject_timezones:
+                anchor = to_local(anchor)
+
+            bucket = anchor.replace(second=0, microsecond=0)
+            # aware datetimes hash by instant, and tzinfo objects aren't
+            # always hashable, so key on wall time and the zone's repr
+            key = (lang or get_default_lang(), " ".join(text.split()),
+                   default_time, bucket.replace(tzinfo=None),
+                   repr(bucket.tzinfo))
+            entry = self._get(key)
+            if entry is None:
+                self._count(False)
+                result = func(text, anchor, lang=lang,
+                              default_time=default_time)
+                self._put(key, ('pending', anchor,
+                                None if result is None else list(result)))
+                return result
+            if entry[0] == 'pending':
+                _, seen, seen_result = entry
+                if seen == anchor:
+                    self._count(True)
+                    return None if seen_result is None else list(seen_result)
+                self._count(False)
+                result = func(text, anchor, lang=lang,
+                              default_time=default_time)
+                # a second anchor in the bucket tells how the result moves
+                # with it, unless both share their second
+                if seen.replace(microsecond=0) != \
+                        anchor.replace(microsecond=0):
+                    self._put(key, self._classify(anchor, result,
+                                                  seen, seen_result))
+                return result
+
+            self._count(True)
+            if entry[0] == 'uncached':
+                return func(text, anchor, lang=lang,
+                            default_time=default_time)
+            return self._rebase(entry, anchor)
+
+        return call_cached
+
+
+_datetime_cache = _DatetimeCache()
+
+
+def get_datetime_cache_stats():
+    """ Statistics for the opt-in extract_datetime() cache
+
+    The cache is enabled through
+    `lingua_franca.config.cache_extract_datetime`.
+
+    Returns:
+        dict: hits, misses, evictions, size, maxsize and hit_rate
+    """
+    return _datetime_cache.stats()
+
+
+def clear_datetime_cache():
+    """ Empty the extract_datetime() cache and reset its statistics """
+    _datetime_cache.clear()
+
+
 def fuzzy_match(x: str, against: str) -> float:
     """Perform a 'fuzzy' comparison between two strings.
 
@@ -49,12 +236,15 @@ def match_one(query, choices):
 
         Args:
             query (str): string to test
-            choices (list): list or dictionary of choices
+            choices (list): list or dictionary of choices, or a FuzzyIndex
+                            or VectorizedMatcher built from them
 
         Returns:
             tuple: (best match, score)
     """
-    if isinstance(choices, dict):
+    if isinstance(choices, (FuzzyIndex, VectorizedMatcher)):
+        return choices.match_one(query)
+    elif isinstance(choices, dict):
         _choices = list(choices.keys())
     elif isinstance(choices, list):
         _choices = choices
@@ -73,8 +263,283 @@ def match_one(query, choices):
         return best
 
 
+class FuzzyIndex:
+    """
+    Searchable index of choices for match_one() over large catalogs
+
+    match_one() computes fuzzy_match() against every choice. The index
+    keeps the character n-grams of each choice, and for a query only scores
+    the `candidates` choices sharing the most n-grams with it. Those are
+    then ranked by the exact fuzzy_match() score.
+
+    This is approximate: a choice with little n-gram overlap with the query
+    can be missed, though its fuzzy_match() score will then be low anyway.
+    Raise `candidates` to trade speed for recall.
+
+    Indexes can be pickled.
+
+    Args:
+        choices (list or dict): initial choices. When a dict is given, the
+            keys are matched and the values returned, like match_one()
+        ngram_size (int): length of the character n-grams
+        candidates (int): number of choices scored exactly per query
+    """
+    _PADDING = "\x00"
+
+    def __init__(self, choices=None, ngram_size=3, candidates=50):
+        self.ngram_size = ngram_size
+        self.candidates = candidates
+        self._keys = {}
+        self._values = {}
+        self._ids = {}
+        self._postings = defaultdict(set)
+        self._next_id = 0
+        if isinstance(choices, dict):
+            for key, value in choices.items():
+                self.add(key, value)
+        elif isinstance(choices, list):
+            for choice in choices:
+                if choice not in self._ids:
+                    self.add(choice)
+        elif choices is not None:
+            raise ValueError('a list or dict of choices must be provided')
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, choice):
+        return choice in self._ids
+
+    def _ngrams(self, text):
+        padding = self._PADDING * (self.ngram_size - 1)
+        text = padding + text + padding
+        return {text[i:i + self.ngram_size]
+                for i in range(len(text) - self.ngram_size + 1)}
+
+    def add(self, choice, value=None):
+        """ Add a choice, or replace the value of an existing one
+
+        Args:
+            choice (str): string to match against
+            value: returned instead of choice when it matches, default is
+                   the choice itself
+        """
+        value = choice if value is None else value
+        if choice in self._ids:
+            self._values[self._ids[choice]] = value
+            return
+        choice_id = self._next_id
+        self._next_id += 1
+        self._ids[choice] = choice_id
+        self._keys[choice_id] = choice
+        self._values[choice_id] = value
+        for ngram in self._ngrams(choice):
+            self._postings[ngram].add(choice_id)
+
+    def remove(self, choice):
+        """ Remove a choice from the index
+
+        Args:
+            choice (str): a choice previously added
+
+        Raises:
+            KeyError: if the choice isn't in the index
+        """
+        choice_id = self._ids.pop(choice)
+        del self._keys[choice_id]
+        del self._values[choice_id]
+        for ngram in self._ngrams(choice):
+            postings = self._postings[ngram]
+            postings.discard(choice_id)
+            if not postings:
+                del self._postings[ngram]
+
+    def _candidate_ids(self, query, k):
+        overlap = Counter()
+        for ngram in self._ngrams(query):
+            postings = self._postings.get(ngram)
+            if postings:
+                overlap.update(postings)
+        if len(overlap) < k:
+            # too few choices share anything with the query to fill the
+            # results, fall back to scoring everything
+            return list(self._keys)
+        # rank by Dice coefficient over n-grams, the n-gram analogue of the
+        # SequenceMatcher ratio, preferring earlier choices on ties
+        padding = 2 * (self.ngram_size - 1)
+        query_size = len(query) + padding
+        return nlargest(
+            max(self.candidates, k), overlap,
+            key=lambda choice_id: (
+                overlap[choice_id] /
+                (query_size + len(self._keys[choice_id]) + padding),
+                -choice_id))
+
+    def match_top_k(self, query, k=5):
+        """ Find the k best matches for a query
+
+        Args:
+            query (str): string to test
+            k (int): number of matches to return
+
+        Returns:
+            list: [(match, score)], best first
+        """
+        scored = ((fuzzy_match(query, self._keys[choice_id]), -choice_id)
+                  for choice_id in self._candidate_ids(query, k))
+        return [(self._values[-negative_id], score)
+                for score, negative_id in nlargest(k, scored)]
+
+    def match_one(self, query):
+        """ Find the best match for a query, like match_one()
+
+        Args:
+            query (str): string to test
+
+        Returns:
+            tuple: (best match, score)
+        """
+        if not self._keys:
+            raise ValueError('the index contains no choices')
+        return self.match_top_k(query, 1)[0]
+
+
+class VectorizedMatcher:
+    """
+    Approximate match_one() over very large choice sets, using NumPy
+
+    Each choice is encoded once as a vector of character bigram counts,
+    hashed into `dimensions` buckets and normalized. A query is then scored
+    against every choice with a single matrix-vector product, giving the
+    cosine similarity of their bigram profiles. This is not the
+    SequenceMatcher ratio of fuzzy_match(), but ranks choices similarly.
+
+    With `rescore` set, the best `rescore` choices by cosine similarity are
+    scored again with fuzzy_match(), and those exact scores are returned.
+
+    The matrix takes len(choices) * dimensions * 4 bytes. Requires numpy.
+
+    Args:
+        choices (list or dict): choices to match against. When a dict is
+            given, the keys are matched and the values returned
+        dimensions (int): number of hash buckets for bigrams
+        rescore (int): number of top choices to re-score with fuzzy_match(),
+            0 to return cosine similarities
+    """
+
+    def __init__(self, choices, dimensions=512, rescore=10):
+        # imported here, so that importing lingua_franca.parse stays cheap
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("VectorizedMatcher requires numpy. "
+                              "Install it with 'pip install numpy'")
+        if isinstance(choices, dict):
+            self._keys = list(choices.keys())
+            self._values = list(choices.values())
+        elif isinstance(choices, list):
+            self._keys = list(choices)
+            self._values = self._keys
+        else:
+            raise ValueError('a list or dict of choices must be provided')
+        self.dimensions = dimensions
+        self.rescore = rescore
+        self._columns = {}
+
+        rows = []
+        columns = []
+        for row, choice in enumerate(self._keys):
+            bigrams = self._bigram_columns(choice)
+            rows.extend([row] * len(bigrams))
+            columns.extend(bigrams)
+        self._matrix = numpy.zeros((len(self._keys), dimensions),
+                                   dtype=numpy.float32)
+        numpy.add.at(self._matrix, (numpy.array(rows, dtype=numpy.intp),
+                                    numpy.array(columns, dtype=numpy.intp)),
+                     1.0)
+        norms = numpy.linalg.norm(self._matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self._matrix /= norms
+
+    def __len__(self):
+        return len(self._keys)
+
+    def _bigram_columns(self, text):
+        text = " " + text + " "
+        columns = []
+        for i in range(len(text) - 1):
+            bigram = text[i:i + 2]
+            column = self._columns.get(bigram)
+            if column is None:
+                # crc32 rather than hash(), which is salted per process
+                column = crc32(bigram.encode("utf-8")) % self.dimensions
+                self._columns[bigram] = column
+            columns.append(column)
+        return columns
+
+    def scores(self, query):
+        """ Cosine similarity of the query to every choice
+
+        Args:
+            query (str): string to test
+
+        Returns:
+            numpy.ndarray: one score per choice, in choice order
+        """
+        import numpy
+        vector = numpy.zeros(self.dimensions, dtype=numpy.float32)
+        numpy.add.at(vector, self._bigram_columns(query), 1.0)
+        norm = numpy.linalg.norm(vector)
+        if norm:
+            vector /= norm
+        return self._matrix @ vector
+
+    @staticmethod
+    def _top(scores, k):
+        import numpy
+        if k < len(scores):
+            top = numpy.argpartition(-scores, k - 1)[:k]
+        else:
+            top = numpy.arange(len(scores))
+        # best first, earlier choices first on ties
+        return top[numpy.lexsort((top, -scores[top]))]
+
+    def match_top_k(self, query, k=5):
+        """ Find the k best matches for a query
+
+        Args:
+            query (str): string to test
+            k (int): number of matches to return
+
+        Returns:
+            list: [(match, score)], best first
+        """
+        scores = self.scores(query)
+        if not self.rescore:
+            return [(self._values[i], float(scores[i]))
+                    for i in self._top(scores, k)]
+        exact = [(fuzzy_match(query, self._keys[i]), -int(i))
+                 for i in self._top(scores, max(k, self.rescore))]
+        return [(self._values[-negative_i], score)
+                for score, negative_i in nlargest(k, exact)]
+
+    def match_one(self, query):
+        """ Find the best match for a query, like match_one()
+
+        Args:
+            query (str): string to test
+
+        Returns:
+            tuple: (best match, score)
+        """
+        if not self._keys:
+            raise ValueError('no choices to match against')
+        return self.match_top_k(query, 1)[0]
+
+
 @localized_function()
-def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
+def extract_numbers(text, short_scale=True, ordinals=False, lang='',
+                    spans=False):
     """
         Takes in a string and extracts a list of numbers.
 
@@ -87,8 +552,15 @@ def extract_numbers(text, short_scale=True, ordinals=False, lang=''):
         ordinals (bool): consider ordinal numbers, e.g. third=3 instead of 1/3
         lang (str, optional): an optional BCP-47 language code, if omitted
                               the default language will be used.
+        spans (bool): also return where each number was found in text.
+                      Only the languages which parse numbers word by word
+                      (cs, en, nl, pl, ru) support this; the others raise
+                      ValueError. extract_number(), extract_duration() and
+                      extract_datetime() do not return spans.
     Returns:
-        list: list of extracted numbers as floats, or empty list if none found
+        list: list of extracted numbers as floats, or empty list if none found.
+              With spans, a list of (float, start, end) tuples, where
+              text[start:end] are the words the number was read from.
     """
 
 
@@ -143,6 +615,7 @@ def extract_duration(text, lang=''):
     """
 
 
+@_datetime_cache.cached
 @localized_function()
 def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
@@ -175,6 +648,11 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
 
             Returns 'None' if no date or time related text is found.
 
+    Results can be cached by setting
+    `lingua_franca.config.cache_extract_datetime` to True. Cached results are
+    keyed on the text and the minute of the anchor, and are shifted onto the
+    exact anchor of each call. See `get_datetime_cache_stats()`.
+
     Examples:
 
         >>> extract_datetime(
@@ -197,6 +675,43 @@ def extract_datetime(text, anchorDate=None, lang='', default_time=None):
     """
 
 
+@localized_function()
+def extract_datetimes(text, anchorDate=None, lang='', default_time=None):
+    """
+    Finds every date and time expression in a text.
+
+    extract_datetime() returns a single datetime plus the text it didn't
+    consume, so finding every date in a document means calling it again and
+    again on the remainder, which no longer lines up with the original text.
+    This function scans the text once and reports each expression along with
+    its character offsets in the original string.
+
+    Args:
+        text (str): the text to be interpreted
+        anchorDate (:obj:`datetime`, optional): the date to be used for
+            relative dating (for example, what does "tomorrow" mean?).
+            Defaults to the current local date/time.
+        lang (str): the BCP-47 code for the language to use, None uses default
+        default_time (datetime.time): time to use if none was found in
+            an expression.
+
+    Returns:
+        [(:obj:`datetime`, int, int)]: one tuple per expression found, with
+            the extracted date and the start and end offsets of the
+            expression, so that text[start:end] is the expression itself.
+            An empty list if no dates are found.
+
+    Examples:
+
+        >>> extract_datetimes(
+        ... "lunch on monday at 1pm, dinner on friday",
+        ... datetime(2017, 6, 27, 13, 4)
+        ... )
+        [(datetime.datetime(2017, 7, 3, 13, 0), 6, 22),
+         (datetime.datetime(2017, 6, 30, 0, 0), 31, 40)]
+    """
+
+
 @localized_function()
 def normalize(text, lang='', remove_articles=True):
     """Prepare a string for parsing
@@ -235,6 +750,25 @@ def get_gender(word, context="", lang=''):
     """
 
 
+@localized_function(run_own_code_on=[FunctionNotLocalizedError])
+def get_genders(words, context="", lang=''):
+    """ Guess the gender of several words from the same context
+
+    Languages which resolve genders in batches split the context only
+    once; in the others, this is get_gender() for each word.
+
+    Args:
+        words (list(str)): The words to look up
+        context (str, optional): String containing the words, for context
+        lang (str, optional): an optional BCP-47 language code, if omitted
+                              the default language will be used.
+
+    Returns:
+        list(str): get_gender() of each word, in order
+    """
+    return [get_gender(word, context, lang=lang) for word in words]
+
+
 @localized_function()
 def is_fractional(input_str, short_scale=True, lang=''):
     """
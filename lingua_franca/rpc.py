@@ -0,0 +1,109 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+The parse and format functions served by lingua_franca.server and run by
+lingua_franca.batch, and how their arguments and results cross JSON
+"""
+from datetime import date, datetime, time, timedelta
+from inspect import signature
+
+from lingua_franca import format as lf_format, parse as lf_parse
+
+METHODS = {name: getattr(lf_parse, name) for name in (
+    "extract_number", "extract_numbers", "extract_duration",
+    "extract_datetime", "extract_datetimes", "normalize", "match_one")}
+METHODS.update({name: getattr(lf_format, name) for name in (
+    "nice_number", "nice_time", "nice_date", "nice_date_time", "nice_year",
+    "nice_duration", "nice_response", "pronounce_number")})
+
+try:
+    _parse_datetime = datetime.fromisoformat
+    _parse_time = time.fromisoformat
+except AttributeError:  # Python 3.6
+    from dateutil.parser import parse as _parse_datetime
+
+    def _parse_time(value):
+        return _parse_datetime(value).timetz()
+
+# parameters sent as ISO 8601 strings
+_DATETIME_PARAMS = ("dt", "now", "anchorDate")
+_TIME_PARAMS = ("default_time",)
+
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+SERVER_ERROR = -32000
+
+SIGNATURES = {name: signature(function)
+               for name, function in METHODS.items()}
+
+
+class RPCError(Exception):
+    def __init__(self, code, message, data=None):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+def to_json(value):
+    """ json.dumps() default: datetimes as ISO 8601, durations in seconds """
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    raise TypeError("{} is not JSON serializable".format(type(value)))
+
+
+def bind_params(method, params):
+    """
+    Bind the parameters of a call to one of the METHODS
+
+    Args:
+        method (str): the name of the function
+        params (list or dict): positional or named arguments, or None;
+                               datetimes and times as ISO 8601 strings
+
+    Returns:
+        inspect.BoundArguments: the arguments, with datetimes decoded
+
+    Raises:
+        RPCError: if the parameters don't fit the function
+    """
+    if params is None:
+        params = {}
+    try:
+        if isinstance(params, list):
+            bound = SIGNATURES[method].bind(*params)
+        elif isinstance(params, dict):
+            bound = SIGNATURES[method].bind(**params)
+        else:
+            raise RPCError(INVALID_REQUEST, "params must be an array or an "
+                                            "object")
+    except TypeError as e:
+        raise RPCError(INVALID_PARAMS, str(e))
+    try:
+        for name, value in bound.arguments.items():
+            if not isinstance(value, str):
+                continue
+            if name in _DATETIME_PARAMS:
+                bound.arguments[name] = _parse_datetime(value)
+            elif name in _TIME_PARAMS:
+                bound.arguments[name] = _parse_time(value)
+    except (ValueError, OverflowError) as e:
+        raise RPCError(INVALID_PARAMS, "{}: {}".format(name, e))
+    return bound
@@ -0,0 +1,338 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+"""
+JSON-RPC 2.0 server for the parse and format functions, over HTTP
+
+    python -m lingua_franca.server --langs en de --port 8765 --workers 4
+    python -m lingua_franca.server --langs en --unix /run/lingua_franca.sock
+
+    curl -d '{"jsonrpc": "2.0", "id": 1, "method": "extract_number",
+              "params": {"text": "twenty two", "lang": "en"}}' \\
+         http://127.0.0.1:8765/
+
+The languages are loaded and the caches warmed once, in the parent
+process, before it forks its workers; the workers share that memory and
+accept connections on the one listening socket. A JSON-RPC batch (an array
+of requests) is answered in a single response.
+
+Datetimes are exchanged as ISO 8601 strings and durations as seconds.
+"""
+import argparse
+import gc
+import json
+import os
+import signal
+import sys
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from socketserver import ThreadingMixIn, ThreadingUnixStreamServer
+
+import lingua_franca
+from lingua_franca.internal import FunctionNotLocalizedError, \
+    get_active_langs, _SUPPORTED_LANGUAGES
+from lingua_franca.rpc import METHODS, INVALID_PARAMS, INVALID_REQUEST, \
+    METHOD_NOT_FOUND, PARSE_ERROR, SERVER_ERROR, RPCError, bind_params, \
+    to_json
+
+
+def call(request):
+    """
+    Answer one JSON-RPC request
+
+    Args:
+        request (dict): a decoded JSON-RPC 2.0 request
+
+    Returns:
+        dict: the response, or None for a notification
+    """
+    request_id = None
+    try:
+        if not isinstance(request, dict):
+            raise RPCError(INVALID_REQUEST, "request must be an object")
+        request_id = request.get("id")
+        method = request.get("method")
+        if request.get("jsonrpc") != "2.0" or not isinstance(method, str):
+            raise RPCError(INVALID_REQUEST, "not a JSON-RPC 2.0 request")
+        if method not in METHODS:
+            raise RPCError(METHOD_NOT_FOUND,
+                           "no such method: {}".format(method))
+        bound = bind_params(method, request.get("params"))
+        try:
+            result = METHODS[method](*bound.args, **bound.kwargs)
+        except (FunctionNotLocalizedError, NotImplementedError,
+                ValueError, TypeError) as e:
+            raise RPCError(INVALID_PARAMS, str(e),
+                           {"type": type(e).__name__})
+        except Exception as e:
+            raise RPCError(SERVER_ERROR, str(e), {"type": type(e).__name__})
+    except RPCError as e:
+        error = {"code": e.code, "message": e.message}
+        if e.data is not None:
+            error["data"] = e.data
+        return {"jsonrpc": "2.0", "id": request_id, "error": error}
+    if "id" not in request:
+        return None
+    return {"jsonrpc": "2.0", "id": request_id, "result": result}
+
+
+def handle(body):
+    """
+    Answer a JSON-RPC request or batch
+
+    Args:
+        body (bytes): the encoded request
+
+    Returns:
+        bytes: the encoded response, or b'' if there is nothing to send back
+    """
+    try:
+        payload = json.loads(body)
+    except ValueError as e:
+        response = {"jsonrpc": "2.0", "id": None,
+                    "error": {"code": PARSE_ERROR, "message": str(e)}}
+    else:
+        if isinstance(payload, list):
+            if payload:
+                response = [r for r in map(call, payload) if r is not None]
+            else:
+                response = call(payload)
+        else:
+            response = call(payload)
+    if not response:
+        return b''
+    return json.dumps(response, default=to_json,
+                      ensure_ascii=False).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "lingua_franca"
+    # a keep-alive connection left idle gives its thread back
+    timeout = 60
+
+    def setup(self):
+        # headers and body go out in separate writes; with Nagle's algorithm
+        # on, the body then waits for the client's delayed ACK, ~40 ms
+        self.disable_nagle_algorithm = isinstance(self.client_address, tuple)
+        super().setup()
+
+    def _send(self, status, body, content_type="application/json"):
+        self.send_response(status)
+        if body:
+            self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = handle(self.rfile.read(length))
+        self._send(200 if body else 204, body)
+
+    def do_GET(self):
+        if self.path.rstrip("/") != "/health":
+            self._send(404, b'')
+            return
+        self._send(200, json.dumps({"pid": os.getpid(),
+                                    "langs": get_active_langs(),
+                                    "methods": sorted(METHODS)}).encode())
+
+    def address_string(self):
+        # Unix sockets have no peer address
+        return self.client_address[0] if self.client_address else "local"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class _HTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    verbose = False
+
+
+class _UnixHTTPServer(ThreadingUnixStreamServer):
+    daemon_threads = True
+    verbose = False
+
+    def server_bind(self):
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        super().server_bind()
+
+
+_WARM_UP = {
+    "extract_number": ("twenty two",),
+    "extract_numbers": ("one two three",),
+    "extract_duration": ("ten minutes",),
+    "extract_datetime": ("tomorrow at 5 pm",),
+    "normalize": ("this is a test",),
+    "pronounce_number": (1234.5,),
+    "nice_number": (5.5,),
+    "nice_time": (datetime(2017, 1, 31, 13, 22),),
+    "nice_date": (datetime(2017, 1, 31, 13, 22),),
+    "nice_duration": (5000,),
+}
+
+
+def warm_up(langs):
+    """
+    Load the languages, and run each function once in every language, so
+    the first request doesn't pay for lazy imports and cache builds
+
+    Args:
+        langs (list(str)): language codes, the first is the default
+    """
+    lingua_franca.load_languages(langs)
+    lingua_franca.set_default_lang(langs[0])
+    for lang in langs:
+        for name, args in _WARM_UP.items():
+            try:
+                METHODS[name](*args, lang=lang)
+            except (FunctionNotLocalizedError, NotImplementedError):
+                pass
+
+
+def make_server(host="127.0.0.1", port=8765, unix=None):
+    """
+    Bind the listening socket
+
+    Args:
+        host (str): address to listen on
+        port (int): TCP port, 0 picks a free one
+        unix (str): path of a Unix socket to listen on instead of TCP
+
+    Returns:
+        socketserver.BaseServer: the bound server
+    """
+    if unix:
+        return _UnixHTTPServer(unix, _Handler)
+    return _HTTPServer((host, port), _Handler)
+
+
+def _serve_worker(server):
+    signal.signal(signal.SIGTERM, lambda *_: os._exit(0))
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    # workers race to accept() the same connection; the losers must not
+    # block in it
+    server.socket.setblocking(False)
+    try:
+        server.serve_forever()
+    finally:
+        os._exit(0)
+
+
+def serve(server, workers=None):
+    """
+    Serve until interrupted, in `workers` forked processes
+
+    Workers which die are replaced. With workers=0, or where fork() is not
+    available, requests are served in this process.
+
+    Args:
+        server (socketserver.BaseServer): from make_server()
+        workers (int): number of processes, default os.cpu_count()
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers == 0 or not hasattr(os, "fork"):
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+        return
+
+    # keep everything loaded so far out of the collector's way, or its
+    # reference count updates copy the shared pages into every worker
+    # (Python 3.7 and later)
+    freeze = getattr(gc, "freeze", None)
+    if freeze is not None:
+        freeze()
+    children = set()
+
+    def spawn():
+        pid = os.fork()
+        if pid == 0:
+            _serve_worker(server)
+        children.add(pid)
+
+    def stop(*_):
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, stop)
+    try:
+        for _ in range(workers):
+            spawn()
+        while True:
+            pid, _ = os.wait()
+            if pid in children:
+                children.discard(pid)
+                spawn()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        for pid in children:
+            try:
+                os.waitpid(pid, 0)
+            except ChildProcessError:
+                pass
+        server.server_close()
+        if isinstance(server.server_address, str):
+            try:
+                os.unlink(server.server_address)
+            except FileNotFoundError:
+                pass
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m lingua_franca.server",
+        description=__doc__.strip().split("\n")[0])
+    parser.add_argument("--langs", nargs="+", default=["en"],
+                        choices=_SUPPORTED_LANGUAGES,
+                        help="languages to load, the first is the default")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", metavar="PATH",
+                        help="listen on a Unix socket instead of TCP")
+    parser.add_argument("--workers", type=int,
+                        help="worker processes (default: CPU count, "
+                             "0 serves in this process)")
+    parser.add_argument("--verbose", action="store_true",
+                        help="log every request")
+    args = parser.parse_args(argv)
+
+    warm_up(args.langs)
+    server = make_server(args.host, args.port, args.unix)
+    server.verbose = args.verbose
+    if isinstance(server.server_address, str):
+        address = server.server_address
+    else:
+        address = "http://{}:{}/".format(*server.server_address[:2])
+    print("lingua_franca serving {} on {}".format(" ".join(args.langs),
+                                                  address),
+          file=sys.stderr, flush=True)
+    serve(server, args.workers)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
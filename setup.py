@@ -34,6 +34,7 @@ setup(
     package_data={'': extra_files},
     include_package_data=True,
     install_requires=required('requirements.txt'),
+    extras_require={'numpy': ['numpy']},
     author='Mycroft AI',
     author_email='dev@mycroft.ai',
     description='Mycroft\'s multilingual text parsing and formatting library',
@@ -0,0 +1,163 @@
+import asyncio
+import unittest
+from datetime import datetime
+from functools import wraps
+
+from dateutil.tz import gettz, tzutc
+
+from lingua_franca import aio, load_languages, set_default_lang, \
+    unload_languages
+from lingua_franca.format import nice_number, nice_time
+from lingua_franca.parse import extract_datetime, extract_number
+from lingua_franca.time import default_timezone, set_default_tz
+
+
+def run_on_new_loop(test):
+    """ Run a coroutine test method to completion on an event loop of its
+        own, as IsolatedAsyncioTestCase (Python 3.8) would """
+    @wraps(test)
+    def run(self):
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(test(self))
+        finally:
+            loop.close()
+    return run
+
+
+def setUpModule():
+    load_languages(['en', 'de'])
+    set_default_lang('en')
+
+
+def tearDownModule():
+    unload_languages(['en', 'de'])
+
+
+class TestThreadExecutor(unittest.TestCase):
+    kind = "thread"
+
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = aio.Executor(cls.kind, max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def tearDown(self):
+        set_default_lang('en')
+
+    @run_on_new_loop
+    async def test_call(self):
+        self.assertEqual(
+            await self.executor.call("extract_number", "twenty two"), 22)
+        self.assertEqual(
+            await self.executor.call(extract_number, "zwei", lang="de"), 2)
+        self.assertEqual(await self.executor.call("nice_number", 5.5),
+                         nice_number(5.5))
+
+    @run_on_new_loop
+    async def test_unknown_function(self):
+        with self.assertRaises(ValueError):
+            await self.executor.call("no_such_function", "one")
+
+    @run_on_new_loop
+    async def test_lang_captured_at_call(self):
+        set_default_lang('de')
+        pending = self.executor.call("extract_number", "drei")
+        set_default_lang('en')
+        self.assertEqual(await pending, 3)
+
+    @run_on_new_loop
+    async def test_anchor_captured_at_call(self):
+        anchor = datetime(2017, 6, 27, 13, 4, tzinfo=default_timezone())
+        result = await self.executor.call("extract_datetime",
+                                          "tomorrow at 5pm",
+                                          anchorDate=anchor)
+        self.assertEqual(result, extract_datetime("tomorrow at 5pm",
+                                                  anchorDate=anchor))
+        result, _ = await self.executor.call("extract_datetime", "today")
+        self.assertEqual(result.tzinfo, default_timezone())
+
+    @run_on_new_loop
+    async def test_timezone(self):
+        previous = default_timezone()
+        set_default_tz(gettz("America/New_York"))
+        try:
+            naive = datetime(2017, 6, 27, 18, 30)
+            pending = self.executor.call("nice_time", naive,
+                                         use_24hour=True)
+            set_default_tz(tzutc())
+            self.assertEqual(await pending, "fourteen thirty")
+        finally:
+            set_default_tz(previous)
+
+    @run_on_new_loop
+    async def test_batch(self):
+        results = await self.executor.batch(
+            [("extract_number", ("seven",), {}),
+             ("nice_time", (datetime(2017, 1, 1, 13, 22, tzinfo=tzutc()),),
+              {"lang": "de"}),
+             ("pronounce_number", ("not a number",), {})],
+            return_exceptions=True)
+        self.assertEqual(results[0], 7)
+        self.assertEqual(results[1], nice_time(
+            datetime(2017, 1, 1, 13, 22, tzinfo=tzutc()), lang="de"))
+        self.assertIsInstance(results[2], Exception)
+        with self.assertRaises(Exception):
+            await self.executor.batch(
+                [("pronounce_number", ("not a number",), {})])
+
+    @run_on_new_loop
+    async def test_map(self):
+        texts = ["one", "two", "three hundred", "four and a half"] * 10
+        results = await self.executor.map("extract_number", texts,
+                                          chunk_size=3)
+        self.assertEqual(results, [extract_number(text) for text in texts])
+        self.assertEqual(await self.executor.map("extract_number", []), [])
+
+    @run_on_new_loop
+    async def test_gather(self):
+        texts = ["one", "two", "three", "four", "five"]
+        results = await asyncio.gather(
+            *[self.executor.call("extract_number", text) for text in texts])
+        self.assertEqual(results, [1, 2, 3, 4, 5])
+
+
+class TestProcessExecutor(TestThreadExecutor):
+    kind = "process"
+
+
+class TestModuleFunctions(unittest.TestCase):
+    def tearDown(self):
+        aio.get_executor().shutdown()
+        aio._executor = None
+
+    @run_on_new_loop
+    async def test_counterparts(self):
+        self.assertEqual(await aio.extract_number("twelve"), 12)
+        self.assertEqual(await aio.extract_number("zwölf", lang="de"), 12)
+        self.assertEqual(await aio.pronounce_number(12), "twelve")
+        self.assertEqual(await aio.map("pronounce_number", [1, 2]),
+                         ["one", "two"])
+        self.assertEqual(await aio.batch([("nice_number", (0.5,), {})]),
+                         [nice_number(0.5)])
+        self.assertIn("Awaitable", aio.extract_number.__doc__)
+
+    @run_on_new_loop
+    async def test_concurrency_limit(self):
+        executor = aio.configure(max_workers=4, max_concurrency=1)
+        self.assertIs(aio.get_executor(), executor)
+        results = await asyncio.gather(
+            *[aio.extract_number(text) for text in ("one", "two", "three")])
+        self.assertEqual(results, [1, 2, 3])
+        self.assertEqual(executor._semaphore()._value, 1)
+
+    def test_bad_kind(self):
+        with self.assertRaises(ValueError):
+            aio.Executor("fiber")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import os
+import tempfile
+import unittest
+from datetime import datetime
+
+from lingua_franca import get_active_langs, load_languages, \
+    set_default_lang, unload_languages
+from lingua_franca.batch import main, process, run_line
+from lingua_franca.parse import extract_datetime
+
+LINES = [
+    {"id": 1, "op": "extract_number", "text": "twenty two"},
+    {"id": 2, "op": "extract_number", "text": "zwei", "lang": "de"},
+    {"op": "extract_datetime", "text": "tomorrow at 5pm",
+     "anchor": "2017-06-27T13:04:00"},
+    {"op": "extract_duration", "text": "ten minutes"},
+    {"op": "pronounce_number", "number": 12},
+    {"op": "nice_time", "dt": "2017-01-31T13:22:00", "use_24hour": True},
+]
+
+
+def encode(records):
+    return [json.dumps(record) for record in records]
+
+
+class TestRunLine(unittest.TestCase):
+    def setUp(self):
+        load_languages(["en", "de"])
+        set_default_lang("en")
+
+    def tearDown(self):
+        unload_languages(list(get_active_langs()))
+
+    def test_results(self):
+        results = [run_line(line) for line in encode(LINES)]
+        anchor = datetime(2017, 6, 27, 13, 4)
+        date, remainder = extract_datetime("tomorrow at 5pm", anchor)
+        self.assertEqual(results[0], {"id": 1, "result": 22})
+        self.assertEqual(results[1], {"id": 2, "result": 2})
+        self.assertEqual(results[2]["result"], [date, remainder])
+        self.assertEqual(results[4], {"result": "twelve"})
+        self.assertEqual(results[5], {"result": "thirteen twenty two"})
+
+    def test_errors(self):
+        for line, error_type in (('{"op": "nope"}', "ValueError"),
+                                 ('[1]', "ValueError"),
+                                 ('{', "JSONDecodeError"),
+                                 ('{"op": "nice_time", "dt": "x"}',
+                                  "InvalidParams"),
+                                 ('{"op": "normalize", "txt": "x"}',
+                                  "InvalidParams")):
+            result = run_line(line)
+            self.assertEqual(result["type"], error_type, line)
+            self.assertIn("error", result)
+
+    def test_no_lang_parameter(self):
+        result = run_line(json.dumps({"id": 3, "op": "match_one",
+                                      "query": "frank",
+                                      "choices": ["frank", "bob"]}))
+        self.assertEqual(result, {"id": 3, "result": ("frank", 1.0)})
+
+    def test_loads_languages_seen(self):
+        unload_languages(list(get_active_langs()))
+        run_line(json.dumps({"op": "extract_number", "text": "tre",
+                             "lang": "it-it"}))
+        self.assertEqual(get_active_langs(), ["it"])
+        run_line(json.dumps({"op": "extract_number", "text": "un"}),
+                 default_lang="fr")
+        self.assertEqual(get_active_langs(), ["it", "fr"])
+
+
+class TestProcess(unittest.TestCase):
+    def tearDown(self):
+        unload_languages(list(get_active_langs()))
+
+    def test_ordered(self):
+        lines = encode({"id": i, "op": "extract_number", "text": str(i)}
+                       for i in range(200))
+        for workers in (0, 2):
+            outputs = [json.loads(line)
+                       for chunk, errors in process(iter(lines), workers,
+                                                    chunk_size=7)
+                       for line in chunk]
+            self.assertEqual(outputs, [{"id": i, "result": i}
+                                       for i in range(200)])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "in.jsonl")
+            sink = os.path.join(directory, "out.jsonl")
+            with open(source, "w") as f:
+                f.write("\n".join(encode(LINES) + ["", "{"]) + "\n")
+            self.assertEqual(main([source, "-o", sink, "--workers", "2",
+                                   "--chunk-size", "2", "--quiet"]), 0)
+            with open(sink) as f:
+                outputs = [json.loads(line) for line in f]
+        self.assertEqual(len(outputs), len(LINES) + 1)
+        self.assertEqual(outputs[1], {"id": 2, "result": 2})
+        self.assertEqual(outputs[3]["result"], [600.0, ""])
+        self.assertIn("error", outputs[-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#
+# Copyright 2017 Mycroft AI Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+import random
+import unittest
+
+from lingua_franca.bracket_expansion import Template, TemplateSet
+from lingua_franca.format import expand_options
+
+TEMPLATES = ["(what's|what is) the (weather|forecast) (today|tomorrow|)",
+             "Will it (rain|pour) (today|tomorrow|)?",
+             "(a|b (c|d)) (e|f) x (g|(h|i))",
+             "set (a|an|) (alarm|timer) (for|at) (  (seven|7)|eight) ",
+             "(hey|hi) (there|) (hey|hi)",
+             "(single) bracket",
+             "(|maybe) (|not)",
+             ""]
+
+
+class TestTemplate(unittest.TestCase):
+    def test_matches_expansions(self):
+        rng = random.Random(42)
+        for template in TEMPLATES:
+            compiled = Template(template)
+            expansions = set(expand_options(template))
+            words = sorted({word for expansion in expansions
+                            for word in expansion.split()}) + ["other"]
+            for expansion in expansions:
+                self.assertTrue(compiled.matches(expansion),
+                                (template, expansion))
+                self.assertTrue(compiled.matches("  " + expansion + " \t"))
+            for _ in range(500):
+                utterance = " ".join(rng.choice(words)
+                                     for _ in range(rng.randint(0, 6)))
+                self.assertEqual(compiled.matches(utterance),
+                                 utterance in expansions,
+                                 (template, utterance))
+
+    def test_match_spans(self):
+        template = Template("(what's|what is) the (weather|forecast) "
+                            "(today|tomorrow|)")
+        utterance = "hey what is the weather today please, what's the " \
+                    "forecast? what's the forecast"
+        self.assertEqual([utterance[start:end] for start, end
+                          in template.match_spans(utterance)],
+                         ["what is the weather today",
+                          "what's the forecast"])
+        self.assertEqual(template.match_spans("the weather"), [])
+        self.assertEqual(Template("(a|)").match_spans("b a b"), [(2, 3)])
+
+    def test_linear_time(self):
+        # (a|) (a|) ... x  backtracks exponentially as a regex
+        template = Template("(a|) " * 200 + "x")
+        automaton = template.automaton
+        steps = []
+        step = automaton.step
+        automaton.step = lambda states, word: \
+            steps.append(word) or step(states, word)
+        self.assertFalse(template.matches("a " * 200 + "y"))
+        self.assertTrue(template.matches("a " * 100 + "x"))
+        self.assertFalse(template.matches("a " * 201 + "x"))
+        self.assertTrue(template.matches("x"))
+        # one step per word, each computed at most once
+        self.assertLessEqual(len(steps), 201 + 101 + 202 + 1)
+        self.assertLessEqual(len(automaton._steps), len(steps))
+
+
+class TestTemplateSet(unittest.TestCase):
+    def test_matches(self):
+        templates = TemplateSet(TEMPLATES)
+        self.assertEqual(len(templates), len(TEMPLATES))
+        for template in TEMPLATES:
+            for expansion in expand_options(template):
+                expected = [compiled for compiled in templates.templates
+                            if compiled.matches(expansion)]
+                self.assertIn(template, [compiled.template
+                                         for compiled in expected])
+                self.assertEqual(templates.matches(expansion), expected)
+        self.assertEqual(templates.matches("nothing at all"), [])
+        added = templates.add("nothing at (all|)")
+        self.assertEqual(templates.matches("nothing at all"), [added])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,11 +14,15 @@
 # limitations under the License.
 #
 import json
+import re
+import os
 import unittest
 import datetime
 import ast
 import warnings
 import sys
+import tempfile
+from importlib import import_module
 from pathlib import Path
 
 # TODO either write a getter for lingua_franca.internal._SUPPORTED_LANGUAGES,
@@ -35,9 +39,83 @@ from lingua_franca.format import nice_duration
 from lingua_franca.format import pronounce_number
 from lingua_franca.format import date_time_format
 from lingua_franca.format import join_list
+from lingua_franca.format import expand_options, count_expansions
+from lingua_franca.format import _translate_word
+from lingua_franca.format import _nice_time_tables, clear_nice_time_tables
+from lingua_franca import config
 from lingua_franca.time import default_timezone
 
 
+def _legacy_nice_duration(duration, lang):
+    """ nice_duration(speech=True) as it was before DurationFormatter """
+    duration += 0.5
+    days = int(duration // 86400)
+    hours = int(duration // 3600 % 24)
+    minutes = int(duration // 60 % 60)
+    seconds = int(duration % 60)
+    out = ""
+    if days > 0:
+        out += pronounce_number(days, lang) + " "
+        if days == 1:
+            out += _translate_word("day", lang)
+        else:
+            out += _translate_word("days", lang)
+        out += " "
+    if hours > 0:
+        if out:
+            out += " "
+        out += pronounce_number(hours, lang) + " "
+        if hours == 1:
+            out += _translate_word("hour", lang)
+        else:
+            out += _translate_word("hours", lang)
+    if minutes > 0:
+        if out:
+            out += " "
+        out += pronounce_number(minutes, lang) + " "
+        if minutes == 1:
+            out += _translate_word("minute", lang)
+        else:
+            out += _translate_word("minutes", lang)
+    if seconds > 0:
+        if out:
+            out += " "
+        out += pronounce_number(seconds, lang) + " "
+        if seconds == 1:
+            out += _translate_word("second", lang)
+        else:
+            out += _translate_word("seconds", lang)
+    return out
+
+
+def _legacy_expand_options(parentheses_line):
+    """ expand_options() as it was before lazy expansion """
+    from lingua_franca.bracket_expansion import Options, Sentence, \
+        SentenceTreeParser, Word
+
+    def expand(fragment):
+        if isinstance(fragment, Word):
+            return [[fragment.tree()]]
+        if isinstance(fragment, Options):
+            options = []
+            for option in fragment.tree():
+                options.extend(expand(option))
+            return options
+        old_expanded = [[]]
+        for sub in fragment.tree():
+            sub_expanded = expand(sub)
+            new_expanded = []
+            while len(old_expanded) > 0:
+                sentence = old_expanded.pop()
+                for new in sub_expanded:
+                    new_expanded.append(sentence + new)
+            old_expanded = new_expanded
+        return old_expanded
+
+    tree = SentenceTreeParser(re.split(r'([(|)])', parentheses_line))._parse()
+    return [re.sub(r'\s+', ' ', ' '.join(i)).strip() for i in expand(tree)]
+
+
 def setUpModule():
     load_languages(get_supported_langs())
     # TODO spin English tests off into another file, like other languages, so we
@@ -389,6 +467,55 @@ class TestPronounceNumber(unittest.TestCase):
 #              use_ampm=False):
 
 
+class TestExpandOptions(unittest.TestCase):
+    TEMPLATES = ["Will it (rain|pour) (today|tomorrow|)?",
+                 "(a|b (c|d)) (e|f) x (g|(h|i))",
+                 "set (a|an|) (alarm|timer) (for|at) (  (seven|7)|eight) ",
+                 "(hey|hi) (there|) (hey|hi)",
+                 "no options here",
+                 "(single) bracket",
+                 ""]
+
+    def test_expand_options(self):
+        self.assertEqual(expand_options("Will it (rain|pour) (today|)?"),
+                         ["Will it pour ?", "Will it pour today ?",
+                          "Will it rain ?", "Will it rain today ?"])
+        self.assertEqual(expand_options("(single) bracket"),
+                         ["( single ) bracket"])
+
+    def test_matches_legacy(self):
+        for template in self.TEMPLATES:
+            self.assertEqual(expand_options(template),
+                             _legacy_expand_options(template))
+
+    def test_lazy(self):
+        for template in self.TEMPLATES:
+            expanded = expand_options(template, lazy=True)
+            self.assertFalse(isinstance(expanded, list))
+            self.assertEqual(list(expanded), expand_options(template))
+        # far too many to expand eagerly
+        huge = "(a|b|c|d|e|f|g|h|i|j) " * 12
+        self.assertEqual(next(iter(expand_options(huge, lazy=True))),
+                         " ".join(["j"] * 12))
+
+    def test_unique(self):
+        template = "(hey|hi) (there|) (hey|hi)"
+        expanded = expand_options(template)
+        unique = expand_options(template, unique=True)
+        self.assertEqual(unique, list(dict.fromkeys(expanded)))
+        self.assertEqual(list(expand_options(template, lazy=True,
+                                             unique=True)), unique)
+        self.assertEqual(expand_options("x (a|b|a)", unique=True),
+                         ["x a", "x b"])
+
+    def test_count_expansions(self):
+        for template in self.TEMPLATES:
+            self.assertEqual(count_expansions(template),
+                             len(expand_options(template)))
+        self.assertEqual(count_expansions("(a|b|c|d|e|f|g|h|i|j) " * 12),
+                         10 ** 12)
+
+
 class TestNiceDateFormat(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -625,6 +752,89 @@ class TestNiceDateFormat(unittest.TestCase):
                                        speech=False),
                          "5d 18:53:20")
 
+    def test_nice_duration_matches_legacy(self):
+        durations = list(range(0, 3700)) + \
+            list(range(3700, 400000, 997)) + [86399.6, 86400, 90061, 1e6]
+        for lang in get_supported_langs():
+            if lang.startswith(("pl", "ru")):
+                continue  # own nice_duration_<lang>, tested there
+            for duration in durations:
+                self.assertEqual(nice_duration(duration, lang=lang),
+                                 _legacy_nice_duration(duration, lang))
+
+    def test_nice_time_tables_match_live(self):
+        flag_sets = [{"speech": speech, "use_24hour": use_24hour,
+                      "use_ampm": use_ampm}
+                     for speech in (True, False)
+                     for use_24hour in (True, False)
+                     for use_ampm in (True, False)]
+        flag_sets.append({})
+        variants = {"ca": ["default", "traditional", "bell", "full_bell",
+                           "spanish"]}
+        for lang in get_supported_langs():
+            live_nice_time = getattr(import_module(
+                "lingua_franca.lang.format_" + lang), "nice_time_" + lang)
+            lang_flag_sets = flag_sets + \
+                [{"speech": speech, "variant": variant}
+                 for speech in (True, False)
+                 for variant in variants.get(lang, ())]
+            for flags in lang_flag_sets:
+                live = []
+                for minute in range(1440):
+                    dt = datetime.datetime(2017, 1, 31, minute // 60,
+                                           minute % 60, 17,
+                                           tzinfo=default_timezone())
+                    live.append(live_nice_time(dt, **flags))
+                config.cache_nice_time = True
+                try:
+                    tabulated = [nice_time(datetime.datetime(
+                        2021, 7, 4, minute // 60, minute % 60, 59,
+                        tzinfo=default_timezone()), lang=lang, **flags)
+                        for minute in range(1440)]
+                finally:
+                    config.cache_nice_time = False
+                self.assertEqual(tabulated, live, (lang, flags))
+        clear_nice_time_tables()
+
+    def test_nice_time_tables_persist(self):
+        dt = datetime.datetime(2017, 1, 31, 13, 22,
+                               tzinfo=default_timezone())
+        expected = nice_time(dt, lang="en-us", use_ampm=True)
+        with tempfile.TemporaryDirectory() as table_dir:
+            config.cache_nice_time = True
+            config.nice_time_table_dir = table_dir
+            try:
+                clear_nice_time_tables()
+                self.assertEqual(nice_time(dt, lang="en-us", use_ampm=True),
+                                 expected)
+                self.assertEqual(len(os.listdir(table_dir)), 1)
+
+                # a fresh process loads the table instead of building it
+                clear_nice_time_tables()
+                build = _nice_time_tables._build
+                _nice_time_tables._build = None
+                try:
+                    self.assertEqual(nice_time(dt, lang="en", use_ampm=True),
+                                     expected)
+                finally:
+                    _nice_time_tables._build = build
+
+                # stale tables are rebuilt
+                clear_nice_time_tables()
+                path = os.path.join(table_dir, os.listdir(table_dir)[0])
+                with open(path) as f:
+                    saved = json.load(f)
+                saved["source"] += 1
+                saved["table"] = ["stale"] * 1440
+                with open(path, "w") as f:
+                    json.dump(saved, f)
+                self.assertEqual(nice_time(dt, lang="en", use_ampm=True),
+                                 expected)
+            finally:
+                config.cache_nice_time = False
+                config.nice_time_table_dir = None
+                clear_nice_time_tables()
+
     def test_join(self):
         self.assertEqual(join_list(None, "and"), "")
         self.assertEqual(join_list([], "and"), "")
@@ -15,8 +15,66 @@
 # limitations under the License.
 #
 
+import random
+import struct
 import unittest
+
 from lingua_franca.lang.format_common import convert_to_mixed_fraction as cmf
+from lingua_franca.lang.format_common import ResponseSanitizer
+
+
+def _legacy_cmf(number, denominators=range(1, 21)):
+    """ convert_to_mixed_fraction() as it was before _FractionTable """
+    int_number = int(number)
+    if int_number == number:
+        return int_number, 0, 1  # whole number, no fraction
+
+    frac_number = abs(number - int_number)
+    if not denominators:
+        denominators = range(1, 21)
+
+    for denominator in denominators:
+        numerator = abs(frac_number) * denominator
+        if abs(numerator - round(numerator)) < 0.01:  # 0.01 accuracy
+            break
+    else:
+        return None
+
+    return int_number, int(round(numerator)), denominator
+
+
+def _step(number, ulps):
+    """ The float `ulps` steps above number, or below if negative """
+    # math.nextafter() only came with Python 3.9. Floats order the same as
+    # their bits read as sign and magnitude.
+    bits = struct.unpack('<q', struct.pack('<d', number))[0]
+    if bits < 0:
+        bits = -(bits & 0x7fffffffffffffff)
+    bits += ulps
+    if bits < 0:
+        bits = -bits | -0x8000000000000000
+    return struct.unpack('<d', struct.pack('<q', bits))[0]
+
+
+def _grid(denominators):
+    """ A dense grid of floats, plus every float next to a match boundary """
+    numbers = [i / 20011 for i in range(-20011, 3 * 20011)]
+    rng = random.Random(1234)
+    numbers += [rng.uniform(-100, 100) for _ in range(20000)]
+    for denominator in set(denominators):
+        for numerator in range(denominator + 1):
+            for bound in (numerator / denominator,
+                          (numerator - 0.01) / denominator,
+                          (numerator + 0.01) / denominator,
+                          numerator / denominator - 0.01 / denominator,
+                          numerator / denominator + 0.01 / denominator):
+                for whole in (0, 7, -3):
+                    number = whole + bound
+                    for ulps in range(1, 5):
+                        numbers += [_step(number, -ulps),
+                                    _step(number, ulps)]
+                    numbers.append(number)
+    return numbers
 
 
 class TestMixedFraction(unittest.TestCase):
@@ -26,3 +84,37 @@ class TestMixedFraction(unittest.TestCase):
         self.assertEqual(cmf(8.5), (8, 1, 2))
         self.assertEqual(cmf(8.587465135), None)
         self.assertEqual(cmf(8.587465135, range(1, 101)), (8, 47, 80))
+
+    def test_matches_legacy(self):
+        for denominators in (range(1, 21), None, [2, 4, 8, 16], [16, 8, 4, 2],
+                             (3, 7, 3, 100), range(1, 101, 7)):
+            for number in _grid(denominators or range(1, 21)):
+                self.assertEqual(cmf(number, denominators),
+                                 _legacy_cmf(number, denominators),
+                                 (number, denominators))
+        self.assertEqual(cmf(2.25, iter([3, 4])), (2, 1, 4))
+
+
+class _Sanitizer(ResponseSanitizer):
+    def ordinal(self, word, previous):
+        if not word.isdecimal():
+            return None
+        return "the " + word + "th" if previous == "on" else word + "th"
+
+
+class TestResponseSanitizer(unittest.TestCase):
+    def setUp(self):
+        self.sanitizer = _Sanitizer(["may", "june"], "to the power of")
+
+    def test_sanitize(self):
+        self.assertEqual(self.sanitizer.sanitize("on 3 May  2 ^ 10 ^"),
+                         "on the 3th May 2 to the power of 10 ^")
+        self.assertEqual(self.sanitizer.sanitize("4 june 5 june"),
+                         "4th june 5th june")
+        self.assertEqual(self.sanitizer.sanitize("^ 3 on 4 june"),
+                         "to the power of 3 on the 4th june")
+
+    def test_unchanged(self):
+        for text in ("", "  nothing  to  do ", "june 3", "3 ^ x", "3 May,"):
+            self.assertIs(self.sanitizer.sanitize(text), text)
+
@@ -23,6 +23,8 @@ from lingua_franca.format import nice_number, nice_time, nice_response, \
 # from lingua_franca.format import pronounce_number
 # # from mycroft_parsers.lang.format_da import nice_response
 from lingua_franca.lang.format_da import pronounce_ordinal_da  # internal to da
+from lingua_franca.lang.common_data_da import _MONTHS_DA
+from lingua_franca.lang.format_da import nice_response_da
 from lingua_franca.time import default_timezone
 
 
@@ -80,6 +82,18 @@ NUMBERS_FIXTURE_da = {
 #        self.assertEqual(nice_response("10 ^ 2"), "ti to")
 
 
+class TestNiceResponseDa(unittest.TestCase):
+    def test_dates_and_powers(self):
+        self.assertEqual(nice_response_da("mødet er den 3. januar"),
+                         "mødet er den tredien januar")
+        self.assertEqual(nice_response_da("2 ^ 3 og 10 ^ 2"),
+                         "2 opløftet i 3 og 10 opløftet i 2")
+        self.assertEqual(nice_response_da("31. mai 2 ^ 3"),
+                         "enogtredivefter mai 2 opløftet i 3")
+        self.assertEqual(nice_response_da("ingen datoer her"),
+                         "ingen datoer her")
+
+
 class TestNiceNumberFormat(unittest.TestCase):
     def test_convert_float_to_nice_number(self):
         for number, number_str in NUMBERS_FIXTURE_da.items():
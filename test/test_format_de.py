@@ -23,6 +23,7 @@ from lingua_franca.format import nice_time
 from lingua_franca.format import pronounce_number
 from lingua_franca.lang.format_de import nice_response_de
 from lingua_franca.lang.format_de import pronounce_ordinal_de
+from lingua_franca.lang.common_data_de import _MONTHS_DE
 from lingua_franca.format import join_list
 from lingua_franca.time import default_timezone
 
@@ -80,6 +81,18 @@ class TestNiceResponse(unittest.TestCase):
         self.assertEqual(nice_response_de("10 ^ 2"),
                          "10 hoch 2")
 
+    def test_dates_and_powers(self):
+        self.assertEqual(nice_response_de("der Termin ist am 3. januar und "
+                                          "am 24. Dezember"),
+                         "der Termin ist am dritten januar und am "
+                         "vierundzwanzigsten Dezember")
+        self.assertEqual(nice_response_de("vom 1. mai bis 31. mai"),
+                         "vom ersten mai bis einunddreißigster mai")
+        self.assertEqual(nice_response_de("31. mai 2 ^ 3"),
+                         "einunddreißigster mai 2 hoch 3")
+        self.assertEqual(nice_response_de("keine Daten hier"),
+                         "keine Daten hier")
+
 
 class TestNiceNumberFormat(unittest.TestCase):
     def setUp(self):
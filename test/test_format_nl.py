@@ -22,6 +22,8 @@ from lingua_franca.format import nice_time
 from lingua_franca.format import pronounce_number
 from lingua_franca.lang.format_nl import nice_response_nl
 from lingua_franca.lang.format_nl import pronounce_ordinal_nl
+from lingua_franca.lang.common_data_nl import _MONTHS_NL
+from lingua_franca.lang.format_nl import pronounce_number_nl
 from lingua_franca.time import default_timezone
 
 
@@ -78,6 +80,18 @@ class TestNiceResponse(unittest.TestCase):
         self.assertEqual(nice_response_nl("10 ^ 2"),
                          "10 tot de macht 2")
 
+    def test_dates_and_powers(self):
+        self.assertEqual(nice_response_nl("de afspraak is op 3 januari en "
+                                          "op 24 December"),
+                         "de afspraak is op drie januari en op "
+                         "vierentwintig December")
+        self.assertEqual(nice_response_nl("van 1 mei tot 31 mei"),
+                         "van één mei tot éénendertig mei")
+        self.assertEqual(nice_response_nl("31 mei 2 ^ 3"),
+                         "éénendertig mei 2 tot de macht 3")
+        self.assertEqual(nice_response_nl("geen  datums hier"),
+                         "geen  datums hier")
+
 
 class TestNiceNumberFormat(unittest.TestCase):
     def test_convert_float_to_nice_number(self):
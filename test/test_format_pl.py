@@ -24,7 +24,63 @@ from lingua_franca.format import nice_time
 from lingua_franca.format import nice_duration
 from lingua_franca.format import pronounce_number
 from lingua_franca.time import default_timezone
-
+from lingua_franca.lang.format_pl import pronounce_number_pl, \
+    get_pronounce_number_for_duration
+
+
+
+def _legacy_nice_duration_pl(duration):
+    """ nice_duration_pl() as it was before DurationFormatter """
+    days = int(duration // 86400)
+    hours = int(duration // 3600 % 24)
+    minutes = int(duration // 60 % 60)
+    seconds = int(duration % 60)
+
+    out = ''
+    sec_main, sec_div = divmod(seconds, 10)
+    min_main, min_div = divmod(minutes, 10)
+    hour_main, hour_div = divmod(hours, 10)
+
+    if days > 0:
+        out += pronounce_number_pl(days) + " "
+        if days == 1:
+            out += 'dzień'
+        else:
+            out += 'dni'
+    if hours > 0:
+        if out:
+            out += " "
+        out += get_pronounce_number_for_duration(hours) + " "
+        if hours == 1:
+            out += 'godzina'
+        elif hour_main == 1 or hour_div > 4:
+            out += 'godzin'
+        else:
+            out += 'godziny'
+    if minutes > 0:
+        if out:
+            out += " "
+        out += get_pronounce_number_for_duration(minutes) + " "
+        if minutes == 1:
+            out += 'minuta'
+        elif min_main == 1 or min_div > 4:
+            out += 'minut'
+        else:
+            out += 'minuty'
+    if seconds > 0:
+        if out:
+            out += " "
+        out += get_pronounce_number_for_duration(seconds) + " "
+        if sec_div == 0:
+            out += 'sekund'
+        elif seconds == 1:
+            out += 'sekunda'
+        elif sec_main == 1 or sec_div > 4:
+            out += 'sekund'
+        else:
+            out += 'sekundy'
+
+    return out
 
 
 def setUpModule():
@@ -344,6 +400,13 @@ class TestNiceDateFormat(unittest.TestCase):
                                        speech=False),
                          "5d 18:53:20")
 
+    def test_nice_duration_matches_legacy(self):
+        durations = list(range(0, 3700)) + \
+            list(range(3700, 400000, 997)) + [86400, 90061, 1e6]
+        for duration in durations:
+            self.assertEqual(nice_duration(duration),
+                             _legacy_nice_duration_pl(duration))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -19,6 +19,8 @@ import datetime
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.format import nice_number, nice_time, pronounce_number
 from lingua_franca.lang.format_sv import pronounce_ordinal_sv
+from lingua_franca.lang.common_data_sv import _MONTHS_SV
+from lingua_franca.lang.format_sv import nice_response_sv
 from lingua_franca.time import default_timezone
 
 
@@ -76,6 +78,20 @@ NUMBERS_FIXTURE_sv = {
 #        self.assertEqual(nice_response_sv("10 ^ 2"), "ti to")
 
 
+class TestNiceResponseSv(unittest.TestCase):
+    def test_dates_and_powers(self):
+        self.assertEqual(nice_response_sv("mötet är den 3. januari och den "
+                                          "24. December"),
+                         "mötet är den tredjen januari och den tjugofjärden "
+                         "December")
+        self.assertEqual(nice_response_sv("från 1. maj till 31. maj"),
+                         "från förstan maj till trettioförstan maj")
+        self.assertEqual(nice_response_sv("31. maj 2 ^ 3"),
+                         "trettioförstar maj 2 upphöjt till 3")
+        self.assertEqual(nice_response_sv("2 ^ 3 och 10 ^ 2"),
+                         "2 upphöjt till 3 och 10 upphöjt till 2")
+
+
 class TestNiceNumberFormat(unittest.TestCase):
     def test_convert_float_to_nice_number(self):
         for number, number_str in NUMBERS_FIXTURE_sv.items():
@@ -6,6 +6,7 @@ import lingua_franca
 import lingua_franca.parse
 import lingua_franca.format
 
+from lingua_franca import config
 from lingua_franca.internal import localized_function, _SUPPORTED_LANGUAGES
 
 
@@ -200,6 +201,63 @@ class TestLocalizerEdgeCases(unittest.TestCase):
         unload_all_languages()
 
 
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        lingua_franca.load_languages(['en', 'pl'])
+        lingua_franca.reset_stats()
+
+    def tearDown(self):
+        config.instrument_functions = False
+        config.instrumentation_hook = None
+        lingua_franca.reset_stats()
+        unload_all_languages()
+
+    def test_disabled_by_default(self):
+        lingua_franca.parse.extract_number("five")
+        self.assertEqual(lingua_franca.stats(), {})
+
+    def test_stats(self):
+        config.instrument_functions = True
+        for _ in range(3):
+            lingua_franca.parse.extract_number("five", lang="en-us")
+        lingua_franca.format.nice_duration(61, lang="pl")
+        with self.assertRaises(
+                lingua_franca.internal.FunctionNotLocalizedError):
+            lingua_franca.parse.is_ordinal("twelve")
+
+        stats = lingua_franca.stats()
+        extract = stats[("parse", "extract_number", "en")]
+        self.assertEqual(extract["calls"], 3)
+        self.assertEqual(extract["errors"], 0)
+        self.assertLessEqual(extract["p50"], extract["p99"])
+        self.assertLessEqual(extract["p99"], extract["max"])
+        self.assertAlmostEqual(extract["mean"] * 3, extract["total"])
+        self.assertEqual(stats[("format", "nice_duration", "pl")]["calls"], 1)
+        self.assertEqual(stats[("parse", "is_ordinal", "en")]["errors"], 1)
+
+        lingua_franca.reset_stats()
+        self.assertEqual(lingua_franca.stats(), {})
+
+    def test_hook(self):
+        calls = []
+        config.instrument_functions = True
+        config.instrumentation_hook = \
+            lambda *args: calls.append((args[:3], args[4]))
+        lingua_franca.parse.extract_number("five")
+        with self.assertRaises(
+                lingua_franca.internal.FunctionNotLocalizedError):
+            lingua_franca.parse.is_ordinal("twelve")
+        self.assertEqual(calls[0], (("parse", "extract_number", "en"), None))
+        self.assertIsInstance(calls[1][1],
+                              lingua_franca.internal.FunctionNotLocalizedError)
+
+        def broken_hook(*args):
+            raise RuntimeError
+        config.instrumentation_hook = broken_hook
+        with self.assertWarns(UserWarning):
+            self.assertEqual(lingua_franca.parse.extract_number("five"), 5)
+
+
 class TestGetter(unittest.TestCase):
     def test_primary_lang_code(self):
         unload_all_languages()
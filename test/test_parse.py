@@ -13,20 +13,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 #
+import pickle
 import unittest
 from datetime import datetime, timedelta
 from dateutil import tz
 
 from lingua_franca import load_language, unload_language, set_default_lang
+from lingua_franca import config
 from lingua_franca.internal import FunctionNotLocalizedError
 from lingua_franca.time import default_timezone
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, extract_datetimes
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number, extract_numbers
-from lingua_franca.parse import fuzzy_match
+from lingua_franca.parse import fuzzy_match, FuzzyIndex, VectorizedMatcher
 from lingua_franca.parse import get_gender
 from lingua_franca.parse import match_one
 from lingua_franca.parse import normalize
+from lingua_franca.parse import get_datetime_cache_stats, \
+    clear_datetime_cache, _DatetimeCache
+from lingua_franca.lang.parse_en import extract_duration_en, \
+    _convert_words_to_numbers_en, _extract_numbers_with_text_en
+from lingua_franca.lang.parse_common import tokenize
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 def setUpModule():
@@ -61,6 +73,95 @@ class TestFuzzyMatch(unittest.TestCase):
         self.assertEqual(match_one('enry', choices)[0], 4)
 
 
+class TestFuzzyIndex(unittest.TestCase):
+    def test_match_one(self):
+        choices = ['frank', 'kate', 'harry', 'henry']
+        index = FuzzyIndex(choices)
+        for query in ['frank', 'fran', 'enry', 'katt', 'xyz']:
+            self.assertEqual(index.match_one(query),
+                             match_one(query, choices))
+            self.assertEqual(match_one(query, index),
+                             match_one(query, choices))
+        choices = {'frank': 1, 'kate': 2, 'harry': 3, 'henry': 4}
+        index = FuzzyIndex(choices)
+        self.assertEqual(index.match_one('frank')[0], 1)
+        self.assertEqual(index.match_one('enry')[0], 4)
+
+    def test_match_top_k(self):
+        index = FuzzyIndex(['frank', 'kate', 'harry', 'henry'])
+        matches = index.match_top_k('henri', 3)
+        self.assertEqual([m[0] for m in matches], ['henry', 'harry', 'kate'])
+        self.assertEqual(matches[0][1], fuzzy_match('henri', 'henry'))
+        self.assertEqual(len(index.match_top_k('henri', 10)), 4)
+
+    def test_add_remove(self):
+        index = FuzzyIndex(['frank', 'kate'])
+        index.add('henry')
+        self.assertEqual(index.match_one('enry')[0], 'henry')
+        index.remove('henry')
+        self.assertNotIn('henry', index)
+        self.assertEqual(len(index), 2)
+        self.assertNotEqual(index.match_one('enry')[0], 'henry')
+        self.assertRaises(KeyError, index.remove, 'henry')
+        index.add('kate', 2)
+        self.assertEqual(index.match_one('kate'), (2, 1.0))
+        index.remove('frank')
+        index.remove('kate')
+        self.assertRaises(ValueError, index.match_one, 'kate')
+
+    def test_pickle(self):
+        index = FuzzyIndex({'frank': 1, 'kate': 2, 'harry': 3, 'henry': 4})
+        restored = pickle.loads(pickle.dumps(index))
+        self.assertEqual(restored.match_one('enry'), (4, 0.8888888888888888))
+        restored.add('henrietta', 5)
+        self.assertEqual(restored.match_one('henrieta')[0], 5)
+
+    def test_large_catalog(self):
+        choices = ["skill number {}".format(i) for i in range(2000)]
+        choices.append("weather forecast")
+        index = FuzzyIndex(choices, candidates=20)
+        for query in ["weather forcast", "skill number 1234",
+                      "skil numbr 77"]:
+            self.assertEqual(index.match_one(query),
+                             match_one(query, choices))
+
+
+@unittest.skipUnless(numpy, "numpy is not installed")
+class TestVectorizedMatcher(unittest.TestCase):
+    def test_match_one(self):
+        choices = ['frank', 'kate', 'harry', 'henry']
+        matcher = VectorizedMatcher(choices)
+        for query in ['frank', 'fran', 'enry', 'katt']:
+            self.assertEqual(matcher.match_one(query),
+                             match_one(query, choices))
+            self.assertEqual(match_one(query, matcher),
+                             match_one(query, choices))
+        matcher = VectorizedMatcher({'frank': 1, 'kate': 2, 'harry': 3,
+                                     'henry': 4})
+        self.assertEqual(matcher.match_one('enry')[0], 4)
+
+    def test_cosine_scores(self):
+        matcher = VectorizedMatcher(['frank', 'kate', 'harry', 'henry'],
+                                    rescore=0)
+        self.assertAlmostEqual(matcher.match_one('frank')[1], 1.0, places=5)
+        self.assertEqual(matcher.match_one('fran')[0], 'frank')
+        scores = matcher.scores('henry')
+        self.assertEqual(len(scores), 4)
+        self.assertEqual(int(scores.argmax()), 3)
+
+    def test_match_top_k(self):
+        matcher = VectorizedMatcher(['frank', 'kate', 'harry', 'henry'])
+        self.assertEqual([m[0] for m in matcher.match_top_k('henri', 3)],
+                         ['henry', 'harry', 'kate'])
+        self.assertEqual(len(matcher.match_top_k('henri', 10)), 4)
+
+    def test_pickle(self):
+        matcher = VectorizedMatcher(['frank', 'kate', 'harry', 'henry'])
+        restored = pickle.loads(pickle.dumps(matcher))
+        self.assertEqual(restored.match_one('enry'),
+                         matcher.match_one('enry'))
+
+
 class TestNormalize(unittest.TestCase):
     def test_articles(self):
         self.assertEqual(normalize("this is a test", remove_articles=True),
@@ -936,6 +1037,17 @@ class TestNormalize(unittest.TestCase):
                                          " half test"),
                          [7.0, 8.0, 9.5])
 
+    def test_multiple_numbers_spans(self):
+        text = "this is a  one twenty one test, 3 times 50%"
+        numbers = extract_numbers(text, spans=True)
+        self.assertEqual([value for value, _, _ in numbers],
+                         extract_numbers(text))
+        self.assertEqual([text[start:end] for _, start, end in numbers],
+                         ["one", "twenty one", "3", "50"])
+        text = "a seven eight nine and a half test"
+        self.assertEqual(extract_numbers(text, spans=True),
+                         [(7.0, 2, 7), (8.0, 8, 13), (9.5, 14, 29)])
+
     def test_contractions(self):
         self.assertEqual(normalize("ain't"), "is not")
         self.assertEqual(normalize("aren't"), "are not")
@@ -1094,6 +1206,195 @@ class TestNormalize(unittest.TestCase):
         self.assertRaises((AttributeError, FunctionNotLocalizedError),
                           get_gender, "person", None)
 
+    def test_convert_words_to_numbers(self):
+        self.assertEqual(
+            _convert_words_to_numbers_en("i have twenty three apples"),
+            "i have 23 apples")
+        self.assertEqual(_convert_words_to_numbers_en("two point five please"),
+                         "2.5 please")
+        self.assertEqual(
+            _convert_words_to_numbers_en("the third of five", ordinals=True),
+            "the 3 of 5")
+
+    def test_extract_numbers_with_text(self):
+        def numbers(text, ordinals=False):
+            return [(n.value, n.text) for n in _extract_numbers_with_text_en(
+                tokenize(text), ordinals=ordinals)]
+
+        self.assertEqual(numbers("i have twenty three apples"),
+                         [(23, "twenty three")])
+        self.assertEqual(numbers("the third of five", ordinals=True),
+                         [(3, "third"), (5, "five")])
+
+
+class TestExtractDatetimes(unittest.TestCase):
+    def setUp(self):
+        self.anchor = datetime(2017, 6, 27, 13, 4,
+                               tzinfo=default_timezone())
+
+    def spans(self, text):
+        return [(dt.strftime("%Y-%m-%d %H:%M:%S"), text[start:end])
+                for dt, start, end in extract_datetimes(text, self.anchor)]
+
+    def test_extract_datetimes(self):
+        self.assertEqual(self.spans("lunch on monday at 1pm, dinner on "
+                                    "friday"),
+                         [("2017-07-03 13:00:00", "on monday at 1pm"),
+                          ("2017-06-30 00:00:00", "on friday")])
+        self.assertEqual(self.spans("Remind me to call mom in 3 weeks. Also "
+                                    "on the 5th of july at 7pm and next "
+                                    "tuesday!"),
+                         [("2017-07-18 00:00:00", "in 3 weeks"),
+                          ("2017-07-05 19:00:00",
+                           "on the 5th of july at 7pm"),
+                          ("2017-07-04 00:00:00", "next tuesday")])
+        self.assertEqual(self.spans("it starts in 2 hours and 30 minutes "
+                                    "or tomorrow morning"),
+                         [("2017-06-27 15:34:00", "in 2 hours and 30 minutes"),
+                          ("2017-06-28 08:00:00", "tomorrow morning")])
+        self.assertEqual(self.spans("we met on June 5, 2017 at noon"),
+                         [("2017-06-05 12:00:00", "on June 5, 2017 at noon")])
+
+    def test_split_before_numbers(self):
+        self.assertEqual(self.spans("the meeting is on march 5th, 2018 and "
+                                    "on the 7th of april"),
+                         [("2018-03-05 00:00:00", "on march 5th, 2018"),
+                          ("2018-04-07 00:00:00", "on the 7th of april")])
+
+    def test_ranges(self):
+        self.assertEqual(self.spans("from monday to friday"),
+                         [("2017-07-03 00:00:00", "from monday"),
+                          ("2017-06-30 00:00:00", "friday")])
+
+    def test_offsets(self):
+        text = "lunch on monday at 1pm, dinner on friday"
+        self.assertEqual([span[1:] for span in
+                          extract_datetimes(text, self.anchor)],
+                         [(6, 22), (31, 40)])
+
+    def test_bare_month(self):
+        # extract_datetime_en() raises on a month without a day
+        text = "we met on monday and will meet again in june, see you"
+        self.assertEqual(self.spans(text),
+                         [("2017-07-03 00:00:00", "on monday")])
+
+    def test_no_datetimes(self):
+        self.assertEqual(extract_datetimes("", self.anchor), [])
+        self.assertEqual(extract_datetimes("may I have 3 dogs", self.anchor),
+                         [])
+        self.assertEqual(extract_datetimes("wait a second", self.anchor), [])
+        self.assertEqual(extract_datetimes("The second one is fine.",
+                                           self.anchor), [])
+
+    def test_matches_extract_datetime(self):
+        for text in ["what is the weather like the day after tomorrow",
+                     "set an alarm for tonight 9:30",
+                     "remind me to call mom next tuesday"]:
+            expected = extract_datetime(text, self.anchor)
+            found = extract_datetimes(text, self.anchor)
+            self.assertEqual(len(found), 1)
+            self.assertEqual(found[0][0], expected[0])
+
+
+class TestExtractDatetimeCache(unittest.TestCase):
+    def setUp(self):
+        clear_datetime_cache()
+        self.old_size = config.extract_datetime_cache_size
+        config.cache_extract_datetime = True
+
+    def tearDown(self):
+        config.cache_extract_datetime = False
+        config.extract_datetime_cache_size = self.old_size
+        clear_datetime_cache()
+
+    def uncached(self, text, anchor):
+        config.cache_extract_datetime = False
+        try:
+            return extract_datetime(text, anchor)
+        finally:
+            config.cache_extract_datetime = True
+
+    def test_matches_uncached(self):
+        phrases = ["tomorrow at 7am", "in 5 minutes", "in 30 seconds",
+                   "next monday", "what time is it now", "at 10:15",
+                   "set an alarm", "remind me  in 2 hours"]
+        anchors = [datetime(2020, 3, 4, 10, 15, 0),
+                   datetime(2020, 3, 4, 10, 15, 12, 345),
+                   datetime(2020, 3, 4, 10, 15, 59, 999999),
+                   datetime(2020, 3, 4, 10, 16, 1)]
+        for text in phrases:
+            for anchor in anchors:
+                self.assertEqual(extract_datetime(text, anchor),
+                                 self.uncached(text, anchor))
+
+    def test_rebases_hits(self):
+        anchor = datetime(2020, 3, 4, 10, 15, 5, tzinfo=default_timezone())
+        self.assertEqual(extract_datetime("in 5 minutes", anchor)[0],
+                         anchor + timedelta(minutes=5))
+        anchor = anchor.replace(second=40)
+        self.assertEqual(extract_datetime("in 5 minutes", anchor)[0],
+                         anchor + timedelta(minutes=5))
+        self.assertEqual(extract_datetime(" in 5  minutes ", anchor)[0],
+                         anchor + timedelta(minutes=5))
+        anchor = anchor.replace(second=20)
+        self.assertEqual(extract_datetime("in 5 minutes", anchor)[0],
+                         anchor + timedelta(minutes=5))
+        stats = get_datetime_cache_stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 2)
+        self.assertAlmostEqual(stats["hit_rate"], 1 / 2)
+
+    def test_parses_once_per_call(self):
+        calls = []
+        cached = _DatetimeCache().cached(
+            lambda text, anchorDate=None, lang='', default_time=None:
+            calls.append(anchorDate) or [anchorDate, ''])
+        anchor = datetime(2020, 3, 4, 10, 15, 5, tzinfo=default_timezone())
+        for second in (5, 5, 40, 20, 50):
+            cached("now", anchor.replace(second=second))
+        self.assertEqual([when.second for when in calls], [5, 40])
+
+    def test_lru_eviction(self):
+        config.extract_datetime_cache_size = 2
+        anchor = datetime(2020, 3, 4, 10, 15)
+        extract_datetime("today", anchor)
+        extract_datetime("tomorrow", anchor)
+        extract_datetime("today", anchor)
+        extract_datetime("next week", anchor)
+        stats = get_datetime_cache_stats()
+        self.assertEqual(stats["size"], 2)
+        self.assertEqual(stats["evictions"], 1)
+        extract_datetime("today", anchor)
+        self.assertEqual(get_datetime_cache_stats()["hits"], 2)
+        extract_datetime("tomorrow", anchor)
+        self.assertEqual(get_datetime_cache_stats()["misses"], 4)
+
+    def test_disabled_by_default(self):
+        config.cache_extract_datetime = False
+        extract_datetime("tomorrow", datetime(2020, 3, 4, 10, 15))
+        self.assertEqual(get_datetime_cache_stats()["size"], 0)
+
+
+class TestDurationExtractorEn(unittest.TestCase):
+    def test_extract_duration(self):
+        self.assertEqual(
+            extract_duration_en("set a timer for 1 hour and 30 minutes"),
+            (timedelta(hours=1, minutes=30), "set a timer for  and"))
+        self.assertEqual(extract_duration_en("twenty two days, 1.5 hours"),
+                         (timedelta(days=22, hours=1.5), ","))
+        self.assertEqual(extract_duration_en("10-second countdown"),
+                         (timedelta(seconds=10), "countdown"))
+        self.assertEqual(extract_duration_en("7 minutes 3 minutes"),
+                         (timedelta(minutes=10), ""))
+        self.assertEqual(extract_duration_en("second-hand days"),
+                         (None, "second-hand days"))
+        self.assertIsNone(extract_duration_en(""))
+
+    def test_number_left_by_another_duration(self):
+        # "5" only meets "seconds" once "2 minutes" is removed
+        self.assertEqual(extract_duration_en("5 2 minutes seconds"),
+                         (timedelta(minutes=2), "5  seconds"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,6 +21,9 @@ from lingua_franca.parse import get_gender
 from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_number
 from lingua_franca.parse import normalize
+from lingua_franca.lang.common_data_ca import _FEMALE_DETERMINANTS_CA, \
+    _FEMALE_ENDINGS_CA, _MALE_DETERMINANTS_CA, _MALE_ENDINGS_CA, _GENDERS_CA
+from lingua_franca.lang.parse_ca import get_gender_ca, get_genders_ca
 from lingua_franca.time import default_timezone
 
 
@@ -320,5 +323,22 @@ class TestExtractGender(unittest.TestCase):
                                     lang="ca"), "m")
 
 
+class TestGenderResolverCa(unittest.TestCase):
+    def test_get_gender(self):
+        self.assertEqual(get_gender_ca("vaques"), "f")
+        self.assertEqual(get_gender_ca("pell"), "f")
+        self.assertIsNone(get_gender_ca("noies"))
+        # decided by the determinant in front
+        self.assertEqual(get_gender_ca("cavall", "el cavall"), "m")
+        self.assertEqual(get_gender_ca("estat", "Aquest estat"), "m")
+        self.assertEqual(get_gender_ca("homes", "les homes"), "f")
+        self.assertIsNone(get_gender_ca(""))
+
+    def test_get_genders(self):
+        sentence = "el gat i la vaca de les dones"
+        self.assertEqual(get_genders_ca(sentence.split(), sentence),
+                         [None, "m", None, "f", "f", None, None, "f"])
+
+
 if __name__ == "__main__":
     unittest.main()
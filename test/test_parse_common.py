@@ -13,9 +13,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import random
+import re
 import unittest
+from datetime import timedelta
+from importlib import import_module
 
-from lingua_franca.lang.parse_common import tokenize, Token
+from lingua_franca.lang.common_data_de import _DE_NUMBERS
+from lingua_franca.lang.format_de import pronounce_number_de
+from lingua_franca.lang.parse_common import tokenize, Token, Normalizer, \
+    CompoundNumeralParser, DurationExtractor, GenderResolver, \
+    ReplaceableNumber, TokenStream, extract_numbers_with_text, \
+    convert_words_to_numbers, extract_number_values, iter_tokens
 
 
 class TestParseCommon(unittest.TestCase):
@@ -33,3 +42,236 @@ class TestParseCommon(unittest.TestCase):
 
         self.assertEqual(tokenize('hashtag #1world'),
                          [Token('hashtag', 0), Token('#1world', 1)])
+
+
+def _legacy_tokenize(utterance):
+    # Normalizer.tokenize, before it read the utterance with one regex
+    utterance = re.sub(r"([0-9]+)([\%])", r"\1 \2", utterance)
+    utterance = re.sub(r"(\#)([0-9]+\b)", r"\1 \2", utterance)
+    return utterance.split()
+
+
+class TestIterTokens(unittest.TestCase):
+    def test_offsets(self):
+        text = " 15% of #1\tand #12a "
+        self.assertEqual(list(iter_tokens(text)),
+                         [("15", 0, 1, 3), ("%", 1, 3, 4), ("of", 2, 5, 7),
+                          ("#", 3, 8, 9), ("1", 4, 9, 10), ("and", 5, 11, 14),
+                          ("#12a", 6, 15, 19)])
+
+    def test_matches_legacy(self):
+        rng = random.Random(0)
+        characters = "ab12#%% \t\n_é٣.-"
+        for _ in range(20000):
+            text = "".join(rng.choice(characters)
+                           for _ in range(rng.randint(0, 16)))
+            self.assertEqual(Normalizer.tokenize(text),
+                             _legacy_tokenize(text), repr(text))
+            for word, _, start, end in iter_tokens(text):
+                self.assertEqual(text[start:end], word)
+
+
+class TestTokenStream(unittest.TestCase):
+    def test_offsets(self):
+        text = "I am  #1, at 15%"
+        stream = TokenStream(text)
+        self.assertEqual(stream.words, Normalizer.tokenize(text))
+        self.assertEqual(stream.tokens(), tokenize(text))
+        self.assertEqual(len(stream), 7)
+        for word, start, end in zip(stream.words, stream.starts,
+                                    stream.ends):
+            self.assertEqual(text[start:end], word)
+
+    def test_span(self):
+        stream = TokenStream("buy  twenty two apples")
+        span = stream.span(1, 2)
+        self.assertEqual(span.words, ["twenty", "two"])
+        self.assertEqual((span.start, span.end), (5, 15))
+        self.assertEqual(span.text, "twenty two")
+        self.assertEqual(len(span), 2)
+        self.assertEqual(stream.span(3).text, "apples")
+
+
+class TestNumberExtraction(unittest.TestCase):
+    NUMBERS = {"one": 1, "two": 2, "three": 3}
+
+    def extract_number(self, tokens):
+        # the first run of number words, as the per language parsers find
+        found = []
+        for token in tokens:
+            if token.word in self.NUMBERS:
+                found.append(token)
+            elif found:
+                break
+        value = sum(self.NUMBERS[t.word] for t in found) if found else None
+        return ReplaceableNumber(value, found)
+
+    def test_replaceable_number(self):
+        number = ReplaceableNumber(3, [Token("one", 4), Token("two", 5)])
+        self.assertEqual((number.start_index, number.end_index), (4, 5))
+        self.assertEqual(number.text, "one two")
+        self.assertFalse(ReplaceableNumber(None, []))
+        with self.assertRaises(Exception):
+            number.value = 4
+        with self.assertRaises(Exception):
+            number.other = 4
+
+    def test_extract_numbers_with_text(self):
+        tokens = tokenize("one two and three or two")
+        numbers = extract_numbers_with_text(tokens, self.extract_number)
+        self.assertEqual([(n.value, n.start_index, n.end_index)
+                          for n in numbers],
+                         [(3, 0, 1), (3, 3, 3), (2, 5, 5)])
+        # the tokens passed in are left as they were
+        self.assertEqual(tokens, tokenize("one two and three or two"))
+
+    def test_extract_number_values(self):
+        def extract_numbers(tokens):
+            return extract_numbers_with_text(tokens, self.extract_number)
+
+        text = "one two  and three"
+        self.assertEqual(extract_number_values(text, extract_numbers),
+                         [3.0, 3.0])
+        self.assertEqual(extract_number_values(text, extract_numbers,
+                                               spans=True),
+                         [(3.0, 0, 7), (3.0, 13, 18)])
+
+    def test_convert_words_to_numbers(self):
+        def extract_numbers(tokens):
+            return extract_numbers_with_text(tokens, self.extract_number)
+
+        self.assertEqual(convert_words_to_numbers("one two and three",
+                                                  extract_numbers),
+                         "3 and 3")
+        self.assertEqual(convert_words_to_numbers("no numbers",
+                                                  extract_numbers),
+                         "no numbers")
+
+    def test_languages(self):
+        # every language masking its numbers with the shared loop
+        for lang, text, expected in (("cs", "jeden a dva", "1 a 2"),
+                                     ("en", "one and two", "1 and 2"),
+                                     ("nl", "een en twee", "1 en 2"),
+                                     ("pl", "jeden i dwa", "1 i 2"),
+                                     ("ru", "один и два", "1 и 2")):
+            with self.subTest(lang=lang):
+                parser = import_module("lingua_franca.lang.parse_" + lang)
+                numbers = getattr(parser, "_extract_numbers_with_text_" +
+                                  lang)(tokenize(text))
+                self.assertEqual([(n.value, n.start_index, n.end_index)
+                                  for n in numbers], [(1, 0, 0), (2, 2, 2)])
+                self.assertEqual(getattr(
+                    parser, "_convert_words_to_numbers_" + lang)(text),
+                    expected)
+
+
+class TestCompoundNumeralParser(unittest.TestCase):
+    def setUp(self):
+        multipliers = {'hundert': 100, 'tausend': 1000, 'million': 1000000}
+        self.parser = CompoundNumeralParser(
+            {word: value for word, value in _DE_NUMBERS.items()
+             if word not in multipliers},
+            multipliers, fillers=['und'])
+
+    def test_segment(self):
+        self.assertEqual([morpheme for morpheme, _, _ in
+                          self.parser.segment('dreihundertelf')],
+                         ['dreihundert', 'elf'])
+        self.assertEqual(self.parser.segment('einundzwanzigtausend'),
+                         [('einundzwanzig', 21, False),
+                          ('tausend', 1000, True)])
+        self.assertIsNone(self.parser.segment('zwanzigste'))
+        self.assertIsNone(self.parser.segment(''))
+
+    def test_backtracking(self):
+        parser = CompoundNumeralParser({'ab': 1, 'a': 2, 'bc': 3}, {})
+        # the longest match at the start leaves "c", which doesn't split
+        self.assertEqual(parser.value('abc'), 5)
+        self.assertEqual(parser.value('ab'), 1)
+        self.assertEqual(parser.value('abcab'), 6)
+        self.assertIsNone(parser.value('abcb'))
+
+    def test_value(self):
+        self.assertEqual(self.parser.value('zweihunderttausenddrei'),
+                         200003)
+        self.assertEqual(self.parser.value('tausend'), 1000)
+        self.assertEqual(self.parser.value('hunderttausend'), 100000)
+        self.assertEqual(self.parser.value('dreimillionzweihunderttausend'),
+                         3200000)
+        self.assertIsNone(self.parser.value('und'))
+        self.assertIsNone(self.parser.value('hallo'))
+
+    def test_round_trip_de(self):
+        for number in range(0, 1000000, 13):
+            word = pronounce_number_de(number)
+            self.assertEqual(self.parser.value(word), number, word)
+
+
+class TestDurationExtractor(unittest.TestCase):
+    def setUp(self):
+        self.extractor = DurationExtractor(
+            [('hour', 'hours'), ('min', 'minutes'), ('minute', 'minutes'),
+             ('s', 'seconds')], suffix="s?")
+
+    def test_extract(self):
+        self.assertEqual(self.extractor.extract("in 2 hours and 1.5 min"),
+                         (timedelta(hours=2, seconds=90), "in  and"))
+        self.assertEqual(self.extractor.extract("3-hours 2 hours"),
+                         (timedelta(hours=5), ""))
+        self.assertEqual(self.extractor.extract("10 s, 10 seconds"),
+                         (timedelta(seconds=20), ", econds"))
+
+    def test_first_form_wins(self):
+        # "min" is listed before "minute", as when each form was substituted
+        # in turn
+        self.assertEqual(self.extractor.extract("5 minutes"),
+                         (timedelta(minutes=5), "utes"))
+
+    def test_nothing_found(self):
+        self.assertEqual(self.extractor.extract("  no time "),
+                         (None, "no time"))
+        self.assertEqual(self.extractor.extract("0 hours"), (None, ""))
+
+
+class TestGenderResolver(unittest.TestCase):
+    def setUp(self):
+        self.resolver = GenderResolver(
+            [("f", ["a", "at"]), ("m", ["o", "sat"])], {"home": "m"},
+            {"la": "f", "el": "m"}, lowercase=True, cache_size=4)
+
+    def test_endings(self):
+        self.assertEqual(self.resolver.get_gender("vaca"), "f")
+        self.assertEqual(self.resolver.get_gender("Gato"), "m")
+        # the earlier group wins over a longer ending
+        self.assertEqual(self.resolver.get_gender("casat"), "f")
+        self.assertIsNone(self.resolver.get_gender("pont"))
+        self.assertIsNone(self.resolver.get_gender(""))
+
+    def test_genders(self):
+        self.assertEqual(self.resolver.get_gender("home"), "m")
+        self.assertEqual(self.resolver.get_gender("homes"), "m")
+
+    def test_context(self):
+        self.assertEqual(self.resolver.get_gender("pont", "el pont"), "m")
+        # the first occurrence after a determinant decides
+        self.assertEqual(self.resolver.get_gender("vaca", "una vaca La VACA"),
+                         "f")
+        self.assertEqual(self.resolver.get_gender("vaca", "el vaca la vaca"),
+                         "m")
+        self.assertEqual(self.resolver.get_gender("pont", "pont el"), None)
+
+    def test_previous_word_gender(self):
+        resolver = GenderResolver([("f", ["a"]), ("m", ["o"])],
+                                  singular=True, unknown=False)
+        self.assertEqual(resolver.get_gender("pont", "una pont"), "f")
+        self.assertEqual(resolver.get_gender("pont", "x pont"), False)
+        self.assertEqual(resolver.get_gender("casas"), "f")
+
+    def test_get_genders(self):
+        context = "el pont i la vaca"
+        words = ["pont", "vaca", "gato", "i", "riu"]
+        self.assertEqual(self.resolver.get_genders(words, context),
+                         [self.resolver.get_gender(word, context)
+                          for word in words])
+        self.assertEqual(self.resolver.get_genders([]), [])
+
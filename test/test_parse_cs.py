@@ -26,6 +26,11 @@ from lingua_franca.parse import get_gender
 from lingua_franca.parse import match_one
 from lingua_franca.parse import normalize
 from lingua_franca.time import default_timezone
+from lingua_franca.lang import common_data_cs
+from lingua_franca.lang.parse_cs import _text_cs_inflection_normalize, \
+    extract_duration_cs, _convert_words_to_numbers_cs, \
+    _extract_numbers_with_text_cs
+from lingua_franca.lang.parse_common import tokenize
 
 
 def setUpModule():
@@ -740,6 +745,137 @@ class TestNormalize(unittest.TestCase):
                                          " půl test"),
                          [7.0, 8.0, 9.5])
 
+    def test_convert_words_to_numbers(self):
+        self.assertEqual(
+            _convert_words_to_numbers_cs("mám dvacet tři jablek"),
+            "mám 23 jablek")
+        self.assertEqual(_convert_words_to_numbers_cs("dva celá pět"), "2.5")
+        self.assertEqual(
+            _convert_words_to_numbers_cs("první a třetí", ordinals=True),
+            "1 a 3")
+
+    def test_extract_numbers_with_text(self):
+        def numbers(text, ordinals=False):
+            return [(n.value, n.text) for n in _extract_numbers_with_text_cs(
+                tokenize(text), ordinals=ordinals)]
+
+        self.assertEqual(numbers("mám dvacet tři jablek"),
+                         [(23, "dvacet tři")])
+        self.assertEqual(numbers("první a třetí", ordinals=True),
+                         [(1, "první"), (3, "třetí")])
+
+
+def _common_data_words(module):
+    """ Every word in a common_data module's tables """
+    words = set()
+
+    def collect(value):
+        if isinstance(value, str):
+            words.add(value)
+            words.update(value.split())
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                collect(key)
+                collect(item)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            for item in value:
+                collect(item)
+
+    for name, value in vars(module).items():
+        if not name.startswith("__"):
+            collect(value)
+    return words
+
+
+# the forms each word is normalized from, for each argument; every
+# other word is returned as is
+_INFLECTED_FORMS_CS = {
+    1: {
+        "jedna": ("jeden", "jedno", "jedny"),
+        "dva": ("dvě",),
+    },
+    2: {
+        "hodin": ("hodina", "hodiny", "hodinu"),
+        "minut": ("minuta", "minuty", "minutu"),
+        "sekund": ("sekunda", "sekundy", "sekundu"),
+        "den": ("dní", "dnů", "dny"),
+        "týden": ("týdny", "týdnů"),
+        "měsíc": ("měsíců", "měsíce", "měsíci"),
+        "rok": ("roky", "roků", "let"),
+        "včera": ("včerejšku",),
+        "zítra": ("zítřku", "zítřejší"),
+        "ráno": ("ranní",),
+        "dopoledne": ("dopolední",),
+        "poledne": ("polední",),
+        "odpoledne": ("odpolední",),
+        "večer": ("večerní",),
+        "noc": ("noční",),
+        "víkend": ("víkendech", "víkendu"),
+        "všední": ("všedních", "všedním"),
+        "únor": ("únoru",),
+        "červenec": ("červenci", "července"),
+        "listopad": ("listopadu",),
+        "prosinec": ("prosinci",),
+        "leden": ("lednu", "ledna"),
+        "březen": ("březnu", "března"),
+        "duben": ("dubnu", "dubna"),
+        "květen": ("květnu", "května"),
+        "červen": ("červnu", "června"),
+        "srpen": ("srpnu", "srpna"),
+        "říjen": ("říjnu", "října"),
+    },
+}
+
+
+class TestInflectionNormalize(unittest.TestCase):
+    def test_numbers(self):
+        for word, expected in (("jeden", "jedna"), ("jedno", "jedna"),
+                               ("jedni", "jedni"), ("dvě", "dva"),
+                               ("hodinu", "hodinu")):
+            self.assertEqual(_text_cs_inflection_normalize(word, 1),
+                             expected, word)
+
+    def test_datetime_words(self):
+        for word, expected in (("hodinu", "hodin"), ("let", "rok"),
+                               ("zítřku", "zítra"), ("červenci", "červenec"),
+                               ("dubnu", "duben"), ("dubna", "duben"),
+                               ("květnu", "květen"), ("jeden", "jeden"),
+                               ("dvě", "dvě")):
+            self.assertEqual(_text_cs_inflection_normalize(word, 2),
+                             expected, word)
+
+    def test_every_table_word(self):
+        words = _common_data_words(common_data_cs)
+        for lemmas in _INFLECTED_FORMS_CS.values():
+            for lemma, forms in lemmas.items():
+                words.add(lemma)
+                words.update(forms)
+        for arg, lemmas in _INFLECTED_FORMS_CS.items():
+            expected = {form: lemma for lemma, forms in lemmas.items()
+                        for form in forms}
+            for word in words:
+                self.assertEqual(_text_cs_inflection_normalize(word, arg),
+                                 expected.get(word, word), (word, arg))
+
+
+class TestDurationExtractorCs(unittest.TestCase):
+    def test_extract_duration(self):
+        self.assertEqual(
+            extract_duration_cs("nastav časovač na 30 minut a 10 sekund"),
+            (timedelta(minutes=30, seconds=10), "nastav časovač na  a"))
+        self.assertEqual(extract_duration_cs("dvacet dva dní, 1.5 hodin"),
+                         (timedelta(days=22, hours=1.5), ","))
+        self.assertEqual(extract_duration_cs("2 týdny a 3 dny"),
+                         (timedelta(days=17), "a"))
+        self.assertEqual(extract_duration_cs("sto sekund"),
+                         (timedelta(seconds=100), ""))
+        self.assertEqual(extract_duration_cs("hodinky"),
+                         (None, "hodinky"))
+
+    def test_number_left_by_another_duration(self):
+        self.assertEqual(extract_duration_cs("5 2 minuty sekund"),
+                         (timedelta(minutes=2), "5  sekund"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -17,10 +17,11 @@ import unittest
 from datetime import datetime, time, timedelta
 
 from lingua_franca import load_language, unload_language, set_default_lang
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, extract_datetimes
 from lingua_franca.parse import extract_duration
-from lingua_franca.parse import extract_number
+from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import normalize
+from lingua_franca.lang.parse_de import extract_duration_de
 
 
 def setUpModule():
@@ -44,6 +45,10 @@ class TestNormalize(unittest.TestCase):
                                    remove_articles=False),
                          "dies ist der Extra-Test")
 
+    def test_extract_numbers_spans(self):
+        with self.assertRaises(ValueError):
+            extract_numbers("zwei und 3", lang="de-de", spans=True)
+
     def test_extract_number(self):
         self.assertEqual(extract_number("dies ist der 1. Test",
                                         lang="de-de"), 1)
@@ -181,6 +186,18 @@ class TestNormalize(unittest.TestCase):
                                anchor, lang='de-de', default_time=default)
         self.assertEqual(default, res[0].time())
 
+    def test_extractdatetimes_de(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        text = "Treffen am Montag um 15 Uhr und Essen morgen Abend. " \
+               "In 3 Tagen ist es vorbei"
+        self.assertEqual(
+            [(dt.strftime("%Y-%m-%d %H:%M:%S"), text[start:end]) for
+             dt, start, end in extract_datetimes(text, anchor, lang='de-de')],
+            [("2017-07-03 15:00:00", "am Montag um 15 Uhr"),
+             ("2017-06-28 19:00:00", "morgen Abend"),
+             ("2017-06-30 00:00:00", "In 3 Tagen")])
+        self.assertEqual(extract_datetimes('kein zeit', lang='de-de'), [])
+
     def test_extract_duration_de(self):
         self.assertEqual(extract_duration("10 sekunden", lang="de-de"),
                          (timedelta(seconds=10.0), ""))
@@ -254,5 +271,23 @@ class TestNormalize(unittest.TestCase):
             "dies ist 18 19 20")
 
 
+class TestDurationExtractorDe(unittest.TestCase):
+    def test_extract_duration(self):
+        self.assertEqual(
+            extract_duration_de("starte einen timer für 1 stunde und 30 "
+                                "minuten"),
+            (timedelta(hours=1, minutes=30), "starte einen timer für  und"))
+        self.assertEqual(extract_duration_de("2 Tage 1.5 Stunden"),
+                         (timedelta(days=2, hours=1.5), ""))
+        self.assertEqual(extract_duration_de("10-sekunden countdown"),
+                         (timedelta(seconds=10), "countdown"))
+        self.assertEqual(extract_duration_de("sekundenlang tagen"),
+                         (None, "sekundenlang tagen"))
+
+    def test_number_left_by_another_duration(self):
+        self.assertEqual(extract_duration_de("5 2 Minuten Sekunden"),
+                         (timedelta(minutes=2), "5  sekunden"))
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -18,8 +18,9 @@ import unittest
 
 from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.parse import (normalize, extract_numbers, extract_number,
-                                 extract_datetime)
-from lingua_franca.lang.parse_es import extract_datetime_es, is_fractional_es
+                                 extract_datetime, extract_datetimes)
+from lingua_franca.lang.parse_es import extract_datetime_es, \
+    is_fractional_es, get_gender_es, get_genders_es
 from lingua_franca.time import default_timezone
 
 
@@ -225,6 +226,17 @@ class TestDatetime_es(unittest.TestCase):
         """Check that None is returned if no time is found in sentence."""
         self.assertEqual(extract_datetime('no hay tiempo', lang='es-es'), None)
 
+    def test_extractdatetimes_es(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        text = "la reunión es el lunes a las 5 de la tarde y la cena es " \
+               "en 3 días"
+        self.assertEqual(
+            [(dt.strftime("%Y-%m-%d %H:%M:%S"), text[start:end]) for
+             dt, start, end in extract_datetimes(text, anchor, lang='es')],
+            [("2017-07-03 17:00:00", "el lunes a las 5 de la tarde"),
+             ("2017-06-30 00:00:00", "en 3 días")])
+        self.assertEqual(extract_datetimes('no hay tiempo', lang='es'), [])
+
     @unittest.skip("These phrases are not parsing correctly.")
     def test_extract_datetime_relative_failing(self):
         # parses as "morning" and returns 8:00 on anchorDate
@@ -244,5 +256,24 @@ class TestDatetime_es(unittest.TestCase):
             lang='es')[0], datetime(1997, 12, 29, 21))
 
 
+class TestGenderResolverEs(unittest.TestCase):
+    def test_get_gender(self):
+        self.assertEqual(get_gender_es("casas"), "f")
+        self.assertEqual(get_gender_es("puente"), "m")
+        self.assertFalse(get_gender_es("luz"))
+        # the word in front passes on its own gender
+        self.assertEqual(get_gender_es("ciudad", "una ciudad"), "f")
+        self.assertEqual(get_gender_es("perros", "unos perros"), "m")
+        self.assertEqual(get_gender_es("Casa", "la Casa"), "f")
+        # an empty word or the one before the noun is unknown
+        self.assertFalse(get_gender_es(""))
+        self.assertEqual(get_gender_es("casa", "x  casa"), "f")
+
+    def test_get_genders(self):
+        sentence = "el perro y la casa de unos gatos"
+        self.assertEqual(get_genders_es(sentence.split(), sentence),
+                         [False, "m", "m", "f", "f", "f", "m", "m"])
+
+
 if __name__ == "__main__":
     unittest.main()
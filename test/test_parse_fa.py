@@ -25,6 +25,7 @@ from lingua_franca.parse import fuzzy_match
 from lingua_franca.parse import get_gender
 from lingua_franca.parse import match_one
 from lingua_franca.parse import normalize
+from lingua_franca.lang.parse_fa import _parse_sentence
 
 
 def setUpModule():
@@ -162,8 +163,33 @@ class TestNormalize(unittest.TestCase):
                          [1.0, 2.0, 3.0])
         self.assertEqual(extract_numbers("ده بیست سه پونزده هزار و شصت و شونزده"),
                          [10, 20, 3, 15060, 16])
-        
-        
+        with self.assertRaises(ValueError):
+            extract_numbers("یک دو سه", spans=True)
+
+
+class TestParseSentence(unittest.TestCase):
+    def test_numbers(self):
+        self.assertEqual(_parse_sentence("بیست و پنج"),
+                         [(25, ["بیست", "و", "پنج"])])
+        self.assertEqual(_parse_sentence("دوازده هزار و پانصد"),
+                         [(12500, ["دوازده", "هزار", "و", "پانصد"])])
+        self.assertEqual(_parse_sentence("صد و بیست و سه دقیقه بعد"),
+                         [(123, ["صد", "و", "بیست", "و", "سه"]), "دقیقه",
+                          "بعد"])
+        self.assertEqual(_parse_sentence("سه ساعت و نیم"),
+                         [(3, ["سه"]), "ساعت", "و", (0.5, ["نیم"])])
+        self.assertEqual(_parse_sentence("2.5 ساعت"),
+                         [(2.5, ["2.5"]), "ساعت"])
+
+    def test_formal_variants(self):
+        self.assertEqual(_parse_sentence("هفده"), [(17, ["هیفده"])])
+        self.assertEqual(_parse_sentence("فردا پانزدهم"),
+                         ["فردا", "پونزدهم"])
+
+    def test_no_numbers(self):
+        self.assertEqual(_parse_sentence("یادم بنداز که به مادرم زنگ بزنم"),
+                         ["یادم", "بنداز", "که", "به", "مادرم", "زنگ",
+                          "بزنم"])
 
 
 if __name__ == "__main__":
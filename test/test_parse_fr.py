@@ -20,7 +20,7 @@ from lingua_franca import load_language, unload_language, set_default_lang
 from lingua_franca.internal import FunctionNotLocalizedError
 from lingua_franca.time import default_timezone
 from lingua_franca.parse import get_gender
-from lingua_franca.parse import extract_datetime
+from lingua_franca.parse import extract_datetime, extract_datetimes
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number
 from lingua_franca.parse import normalize
@@ -331,6 +331,18 @@ class TestNormalize_fr(unittest.TestCase):
                                anchor, lang='fr-fr', default_time=default)
         self.assertEqual(default, res[0].time())
 
+    def test_extractdatetimes_fr(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        text = "réunion lundi à 15h, départ dans 3 jours"
+        self.assertEqual(
+            [(dt.strftime("%Y-%m-%d %H:%M:%S"), text[start:end]) for
+             dt, start, end in extract_datetimes(text, anchor,
+                                                 lang='fr-fr')],
+            [("2017-07-03 15:00:00", "lundi à 15h"),
+             ("2017-06-30 00:00:00", "dans 3 jours")])
+        self.assertEqual(extract_datetimes("phrase inutile", lang="fr-fr"),
+                         [])
+
     def test_extract_duration_fr(self):
         self.assertEqual(extract_duration("10 secondes", lang="fr-fr"),
                          (timedelta(seconds=10.0), ""))
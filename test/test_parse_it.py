@@ -21,6 +21,9 @@ from lingua_franca.parse import get_gender
 from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import normalize
+from lingua_franca.lang.format_it import pronounce_number_it
+from lingua_franca.lang.parse_it import _extract_number_long_it, \
+    get_gender_it, get_genders_it
 from lingua_franca.time import default_timezone
 
 
@@ -821,5 +824,87 @@ class TestNormalize(unittest.TestCase):
                                     lang='it'), 'f')
 
 
+class TestCompoundNumerals(unittest.TestCase):
+    @staticmethod
+    def _words():
+        """ pronounce_number_it() of 0 to 999,999, written as one word """
+        below_thousand = [pronounce_number_it(n) for n in range(1000)]
+        for number in range(1000000):
+            thousands, rest = divmod(number, 1000)
+            if not thousands:
+                spoken = below_thousand[rest]
+            else:
+                spoken = "mille" if thousands == 1 else \
+                    below_thousand[thousands] + "mila"
+                if rest:
+                    spoken += ", " + below_thousand[rest]
+            yield number, spoken
+
+    def test_words(self):
+        # the shortcut _words() takes is how pronounce_number_it() works
+        for number, spoken in self._words():
+            if number % 101 == 0:
+                self.assertEqual(spoken, pronounce_number_it(number))
+
+    def test_round_trip(self):
+        wrong = [(word, number) for word, number in
+                 (("".join(spoken.replace(",", "").split()), number)
+                  for number, spoken in self._words())
+                 if _extract_number_long_it(word) != number]
+        self.assertEqual(wrong[:10], [])
+
+    def test_elisions(self):
+        self.assertEqual(_extract_number_long_it('centottanta'), 180)
+        self.assertEqual(_extract_number_long_it('ventotto'), 28)
+        self.assertEqual(
+            _extract_number_long_it('centottomiladuecentotredici'), 108213)
+        self.assertEqual(_extract_number_long_it('milleventisette'), 1027)
+        self.assertEqual(_extract_number_long_it('diecimilaquarantuno'),
+                         10041)
+
+    def test_large(self):
+        self.assertEqual(_extract_number_long_it('unmilione'), 1000000)
+        self.assertEqual(_extract_number_long_it('duemilionitremila'),
+                         2003000)
+        self.assertEqual(_extract_number_long_it('centomilamiliardi'),
+                         100000 * 10 ** 9)
+        self.assertEqual(_extract_number_long_it('unmiliardo'), 10 ** 9)
+        self.assertEqual(_extract_number_long_it('ventitriliardi'),
+                         20 * 10 ** 21)
+
+    def test_known_words(self):
+        for word, value in (('zero', 0), ('uno', 1), ('ventitre', 23),
+                            ('cento', 100), ('mille', 1000),
+                            ('duemila', 2000), ('tremila', 3000),
+                            ('dodicimila', 12000), ('trentesimo', 30),
+                            ('ventesimi', 20), ('quattrocentesimo', 400),
+                            ('novecentonovantanovemilanovecentonovantanove',
+                             999999), ('42', 42), ('unmilione', 1000000),
+                            ('milioni', 1000000),
+                            ('trecentomilioniduecento', 300000200)):
+            self.assertEqual(_extract_number_long_it(word), value, word)
+
+    def test_not_numbers(self):
+        for word in ('ciao', 'treno', 'uomo', 'e', ''):
+            self.assertIs(_extract_number_long_it(word), False, word)
+
+
+class TestGenderResolverIt(unittest.TestCase):
+    def test_get_gender(self):
+        self.assertEqual(get_gender_it("mucche"), "f")
+        self.assertEqual(get_gender_it("scultrice"), "f")
+        self.assertIsNone(get_gender_it("città"))
+        # the word in front passes on its own gender
+        self.assertEqual(get_gender_it("città", "la città"), "f")
+        self.assertEqual(get_gender_it("uomini", "gli uomini"), "m")
+        self.assertEqual(get_gender_it("Mucca", "questo Mucca"), "m")
+        self.assertIsNone(get_gender_it(""))
+
+    def test_get_genders(self):
+        sentence = "il cavallo e la mucca della città"
+        self.assertEqual(get_genders_it(sentence.split(), sentence),
+                         ["m", "m", "m", "f", "f", "f", "f"])
+
+
 if __name__ == '__main__':
     unittest.main()
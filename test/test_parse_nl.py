@@ -20,6 +20,9 @@ from datetime import datetime, time, timedelta
 from lingua_franca import load_language, set_default_lang, unload_language
 from lingua_franca.parse import extract_datetime, extract_number, normalize, extract_duration
 from lingua_franca.time import default_timezone
+from lingua_franca.lang.parse_common import tokenize
+from lingua_franca.lang.parse_nl import _convert_words_to_numbers_nl, \
+    _extract_numbers_with_text_nl
 
 
 LANG = "nl-nl"
@@ -214,6 +217,26 @@ class TestParsing(unittest.TestCase):
         self.assertEqual(extract_duration("een uurtje", LANG),
                          (timedelta(seconds=3600), ""))
 
+    def test_convert_words_to_numbers(self):
+        self.assertEqual(
+            _convert_words_to_numbers_nl("ik heb drie appels"),
+            "ik heb 3 appels")
+        self.assertEqual(_convert_words_to_numbers_nl("twee komma vijf"),
+                         "2.5")
+        self.assertEqual(
+            _convert_words_to_numbers_nl("de derde van twintig",
+                                         ordinals=True),
+            "de 3 van 20")
+
+    def test_extract_numbers_with_text(self):
+        def numbers(text, ordinals=False):
+            return [(n.value, n.text) for n in _extract_numbers_with_text_nl(
+                tokenize(text), ordinals=ordinals)]
+
+        self.assertEqual(numbers("ik heb drie appels"), [(3, "drie")])
+        self.assertEqual(numbers("de derde van twintig", ordinals=True),
+                         [(3, "derde"), (20, "twintig")])
+
 
 if __name__ == "__main__":
     unittest.main()
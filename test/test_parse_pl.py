@@ -23,6 +23,9 @@ from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import extract_number, extract_numbers
 from lingua_franca.parse import normalize
+from lingua_franca.lang.parse_common import tokenize
+from lingua_franca.lang.parse_pl import _convert_words_to_numbers_pl, \
+    _extract_numbers_with_text_pl
 
 
 def setUpModule():
@@ -533,6 +536,26 @@ class TestNormalize(unittest.TestCase):
                                          " pół test"),
                          [7.0, 8.0, 9.5])
 
+    def test_convert_words_to_numbers(self):
+        self.assertEqual(
+            _convert_words_to_numbers_pl("mam dwadzieścia trzy jabłek"),
+            "mam 23 jabłek")
+        self.assertEqual(_convert_words_to_numbers_pl("dwa przecinek pięć"),
+                         "2.5")
+        self.assertEqual(
+            _convert_words_to_numbers_pl("pierwszy i trzeci", ordinals=True),
+            "1 i 3")
+
+    def test_extract_numbers_with_text(self):
+        def numbers(text, ordinals=False):
+            return [(n.value, n.text) for n in _extract_numbers_with_text_pl(
+                tokenize(text), ordinals=ordinals)]
+
+        self.assertEqual(numbers("mam dwadzieścia trzy jabłek"),
+                         [(23, "dwadzieścia trzy")])
+        self.assertEqual(numbers("pierwszy i trzeci", ordinals=True),
+                         [(1, "pierwszy"), (3, "trzeci")])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,6 +21,9 @@ from lingua_franca.parse import get_gender
 from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_number
 from lingua_franca.parse import normalize
+from lingua_franca.lang.common_data_pt import _FEMALE_DETERMINANTS_PT, \
+    _FEMALE_ENDINGS_PT, _MALE_DETERMINANTS_PT, _MALE_ENDINGS_PT, _GENDERS_PT
+from lingua_franca.lang.parse_pt import get_gender_pt, get_genders_pt
 from lingua_franca.time import default_timezone
 
 
@@ -281,5 +284,22 @@ class TestExtractGender(unittest.TestCase):
                                     lang="pt"), "f")
 
 
+class TestGenderResolverPt(unittest.TestCase):
+    def test_get_gender(self):
+        self.assertEqual(get_gender_pt("vacas"), "f")
+        self.assertEqual(get_gender_pt("mulheres"), "f")
+        self.assertIsNone(get_gender_pt("mãe"))
+        # decided by the determinant in front
+        self.assertEqual(get_gender_pt("boi", "o boi"), "m")
+        self.assertEqual(get_gender_pt("ponte", "essa ponte"), "f")
+        self.assertEqual(get_gender_pt("homem", "Essa homem"), "f")
+        self.assertIsNone(get_gender_pt(""))
+
+    def test_get_genders(self):
+        sentence = "o boi e a vaca da mulher"
+        self.assertEqual(get_genders_pt(sentence.split(), sentence),
+                         ["m", "m", None, "f", "f", "f", "f"])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -25,6 +25,11 @@ from lingua_franca.parse import fuzzy_match
 from lingua_franca.parse import match_one
 from lingua_franca.parse import normalize
 from lingua_franca.time import default_timezone
+from lingua_franca.lang import common_data_ru
+from lingua_franca.lang.parse_ru import _text_ru_inflection_normalize, \
+    extract_duration_ru, _convert_words_to_numbers_ru, \
+    _extract_numbers_with_text_ru
+from lingua_franca.lang.parse_common import tokenize
 
 
 def setUpModule():
@@ -746,6 +751,139 @@ class TestNormalize(unittest.TestCase):
                                          " половина тест"),
                          [7.0, 8.0, 9.5])
 
+    def test_convert_words_to_numbers(self):
+        self.assertEqual(
+            _convert_words_to_numbers_ru("у меня двадцать три яблок"),
+            "у меня 23 яблок")
+        self.assertEqual(_convert_words_to_numbers_ru("два точка пять"), "2.5")
+        self.assertEqual(
+            _convert_words_to_numbers_ru("первый и третий", ordinals=True),
+            "1 и 3")
+
+    def test_extract_numbers_with_text(self):
+        def numbers(text, ordinals=False):
+            return [(n.value, n.text) for n in _extract_numbers_with_text_ru(
+                tokenize(text), ordinals=ordinals)]
+
+        self.assertEqual(numbers("у меня двадцать три яблок"),
+                         [(23, "двадцать три")])
+        self.assertEqual(numbers("первый и третий", ordinals=True),
+                         [(1, "первый"), (3, "третий")])
+
+
+def _common_data_words(module):
+    """ Every word in a common_data module's tables """
+    words = set()
+
+    def collect(value):
+        if isinstance(value, str):
+            words.add(value)
+            words.update(value.split())
+        elif isinstance(value, dict):
+            for key, item in value.items():
+                collect(key)
+                collect(item)
+        elif isinstance(value, (list, tuple, set, frozenset)):
+            for item in value:
+                collect(item)
+
+    for name, value in vars(module).items():
+        if not name.startswith("__"):
+            collect(value)
+    return words
+
+
+# the forms each word is normalized from, for each argument; every
+# other word is returned as is
+_INFLECTED_FORMS_RU = {
+    1: {
+        "тысяча": ("тысяч", "тысячи"),
+        "один": ("одна", "одним", "одно", "одной"),
+        "два": ("две",),
+        "пара": ("пару",),
+    },
+    2: {
+        "тысяча": ("тысяч", "тысячи"),
+        "час": ("часа", "часам", "часами", "часов", "часу"),
+        "минута": ("минут", "минутам", "минутами", "минуту", "минуты"),
+        "секунда": ("секунд", "секундам", "секундами", "секунду", "секунды"),
+        "день": ("дней", "дни"),
+        "неделя": ("неделе", "недели", "недель"),
+        "месяц": ("месяца", "месяцев"),
+        "год": ("года", "лет"),
+        "утром": ("утро", "утром"),
+        "полдень": ("полудне", "полудня"),
+        "вечером": ("вечер", "вечером"),
+        "ночь": ("ночь", "ночью"),
+        "выходные": ("викенд", "выходным", "выходных"),
+        "век": ("столетие", "столетий", "столетия"),
+        "среда": ("среду", "среды"),
+        "пятница": ("пятницу", "пятницы"),
+        "суббота": ("субботу", "субботы"),
+        "март": ("марта", "марте"),
+        "май": ("мае", "мая"),
+        "август": ("августа", "августе"),
+        "январь": ("январе", "января"),
+        "февраль": ("феврале", "февраля"),
+        "апрель": ("апреле", "апреля"),
+        "июнь": ("июне", "июня"),
+        "июль": ("июле", "июля"),
+        "сентябрь": ("сентябре", "сентября"),
+        "октябрь": ("октябре", "октября"),
+        "ноябрь": ("ноябре", "ноября"),
+        "декабрь": ("декабре", "декабря"),
+    },
+}
+
+
+class TestInflectionNormalize(unittest.TestCase):
+    def test_numbers(self):
+        for word, expected in (("тысячи", "тысяча"), ("одной", "один"),
+                               ("две", "два"), ("пару", "пара"),
+                               ("часов", "часов")):
+            self.assertEqual(_text_ru_inflection_normalize(word, 1),
+                             expected, word)
+
+    def test_datetime_words(self):
+        for word, expected in (("тысячи", "тысяча"), ("часов", "час"),
+                               ("среду", "среда"), ("мая", "май"),
+                               ("июле", "июль"), ("октябре", "октябрь"),
+                               ("одной", "одной")):
+            self.assertEqual(_text_ru_inflection_normalize(word, 2),
+                             expected, word)
+
+    def test_every_table_word(self):
+        words = _common_data_words(common_data_ru)
+        for lemmas in _INFLECTED_FORMS_RU.values():
+            for lemma, forms in lemmas.items():
+                words.add(lemma)
+                words.update(forms)
+        for arg, lemmas in _INFLECTED_FORMS_RU.items():
+            expected = {form: lemma for lemma, forms in lemmas.items()
+                        for form in forms}
+            for word in words:
+                self.assertEqual(_text_ru_inflection_normalize(word, arg),
+                                 expected.get(word, word), (word, arg))
+
+
+class TestDurationExtractorRu(unittest.TestCase):
+    def test_extract_duration(self):
+        self.assertEqual(
+            extract_duration_ru("установи таймер на 1 час и 30 минут"),
+            (timedelta(hours=1, minutes=30), "установи таймер на  и"))
+        self.assertEqual(extract_duration_ru("двадцать два дня, 1.5 часа"),
+                         (timedelta(days=22, hours=1.5), ","))
+        self.assertEqual(extract_duration_ru("2 недели и 3 дня"),
+                         (timedelta(days=17), "и"))
+        self.assertEqual(extract_duration_ru("сто секунд"),
+                         (timedelta(seconds=100), ""))
+        self.assertEqual(extract_duration_ru("часовой пояс"),
+                         (None, "часовой пояс"))
+
+    def test_number_left_by_another_duration(self):
+        self.assertEqual(extract_duration_ru("5 2 минуты секунд"),
+                         (timedelta(minutes=2), "5  секунд"))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,6 +21,8 @@ from lingua_franca.parse import extract_datetime
 from lingua_franca.parse import extract_number
 from lingua_franca.parse import extract_duration
 from lingua_franca.parse import normalize
+from lingua_franca.lang.parse_sv import extract_duration_sv, \
+    extract_number_sv, _word_to_number_sv
 
 
 def setUpModule():
@@ -167,5 +169,46 @@ class TestExtractDuration(unittest.TestCase):
         self.assertEqual(res, None)
 
 
+class TestDurationLexicon(unittest.TestCase):
+    WORDS = ['starta', 'en', 'timer', 'på', 'om', 'och', 'i', 'mig',
+             'hämta', 'kvart', 'halvtimme', 'halvtimma', 'Kvart', 'andra',
+             'dagar', 'timmes', 'minut', 'sekunder', 'dygn', 'myrslok']
+    NUMBERS = ['en', 'ett', 'två', 'tre', 'fyra', 'fem', 'sex', 'sju',
+               'åtta', 'nio', 'tio', 'första', 'femte', 'halv', 'halva',
+               'halvs', 'tredjedelar', 'fjärdedelars', 'trekvart', 'kvart',
+               'Tre', '0', '3/4', '1/2', '2.5', '10', '42']
+    UNITS = ['dygn', 'dag', 'dagar', 'dags', 'timmar', 'timme', 'timma',
+             'timmes', 'timmas', 'minuter', 'minuters', 'minut', 'minuts',
+             'sekunder', 'sekunders', 'sekund', 'sekunds', 'halvtimme']
+
+    def test_number_words(self):
+        for word in self.NUMBERS + self.WORDS + self.UNITS:
+            self.assertEqual(_word_to_number_sv(word),
+                             extract_number_sv(word), word)
+
+    def test_extract_duration(self):
+        self.assertEqual(
+            extract_duration_sv("starta en timer på tre timmar och tio "
+                                "minuter"),
+            (timedelta(hours=3, minutes=10), "starta en timer på och"))
+        self.assertEqual(extract_duration_sv("en och en halv timme"),
+                         (timedelta(hours=1, minutes=30), "och"))
+        self.assertEqual(extract_duration_sv("2.5 dagar"),
+                         (timedelta(days=2.5), ""))
+        self.assertEqual(extract_duration_sv("tio sekunder hämta mig om en "
+                                             "kvart"),
+                         (timedelta(minutes=15, seconds=10), "hämta mig om"))
+
+    def test_och_binds_as_a_word(self):
+        self.assertEqual(extract_duration_sv("tio och fem timmar"),
+                         (timedelta(hours=15), "och"))
+        # not "o", which used to bind as a letter of "och"
+        self.assertEqual(extract_duration_sv("tio o fem timmar"),
+                         (timedelta(hours=5), "tio o"))
+
+    def test_empty(self):
+        self.assertIsNone(extract_duration_sv(""))
+
+
 if __name__ == "__main__":
     unittest.main()
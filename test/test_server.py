@@ -0,0 +1,176 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from datetime import datetime
+from http.client import HTTPConnection
+
+from lingua_franca import load_languages, set_default_lang, \
+    unload_languages
+from lingua_franca.parse import extract_datetime
+from lingua_franca.server import handle, make_server, serve, \
+    INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND, PARSE_ERROR
+
+
+def setUpModule():
+    load_languages(['en', 'de'])
+    set_default_lang('en')
+
+
+def tearDownModule():
+    unload_languages(['en', 'de'])
+
+
+def rpc(method, params=None, request_id=1):
+    request = {"jsonrpc": "2.0", "method": method, "params": params}
+    if request_id is not None:
+        request["id"] = request_id
+    return request
+
+
+def answer(payload):
+    body = handle(json.dumps(payload).encode())
+    return json.loads(body) if body else None
+
+
+class TestHandle(unittest.TestCase):
+    def test_result(self):
+        self.assertEqual(answer(rpc("extract_number", ["twenty two"])),
+                         {"jsonrpc": "2.0", "id": 1, "result": 22})
+        self.assertEqual(
+            answer(rpc("extract_number", {"text": "zwei", "lang": "de"})),
+            {"jsonrpc": "2.0", "id": 1, "result": 2})
+        self.assertEqual(answer(rpc("pronounce_number", [12]))["result"],
+                         "twelve")
+
+    def test_datetimes(self):
+        anchor = datetime(2017, 6, 27, 13, 4)
+        expected, remainder = extract_datetime("tomorrow at 5pm", anchor)
+        self.assertEqual(
+            answer(rpc("extract_datetime",
+                       {"text": "tomorrow at 5pm",
+                        "anchorDate": anchor.isoformat()}))["result"],
+            [expected.isoformat(), remainder])
+        self.assertEqual(
+            answer(rpc("nice_time", {"dt": "2017-01-31T13:22:00",
+                                     "use_24hour": True}))["result"],
+            "thirteen twenty two")
+
+    def test_duration(self):
+        self.assertEqual(
+            answer(rpc("extract_duration", ["ten minutes"]))["result"],
+            [600.0, ""])
+
+    def test_errors(self):
+        self.assertEqual(answer(rpc("nope"))["error"]["code"],
+                         METHOD_NOT_FOUND)
+        self.assertEqual(answer(rpc("pronounce_number",
+                                    {"numbr": 1}))["error"]["code"],
+                         INVALID_PARAMS)
+        self.assertEqual(answer(rpc("nice_time",
+                                    {"dt": "yesterday"}))["error"]["code"],
+                         INVALID_PARAMS)
+        self.assertEqual(answer({"id": 1, "method": "normalize"})
+                         ["error"]["code"], INVALID_REQUEST)
+        self.assertEqual(answer([])["error"]["code"], INVALID_REQUEST)
+        self.assertEqual(json.loads(handle(b"{"))["error"]["code"],
+                         PARSE_ERROR)
+
+    def test_batch(self):
+        response = answer([rpc("extract_number", ["one"], 1),
+                           rpc("normalize", ["a test"], None),
+                           rpc("nope", None, 2),
+                           rpc("extract_number", ["drei", False, False,
+                                                  "de"], 3)])
+        self.assertEqual([r["id"] for r in response], [1, 2, 3])
+        self.assertEqual(response[0]["result"], 1)
+        self.assertIn("error", response[1])
+        self.assertEqual(response[2]["result"], 3)
+
+    def test_notification(self):
+        self.assertIsNone(answer(rpc("normalize", ["a test"], None)))
+        self.assertIsNone(answer([rpc("normalize", ["a test"], None)]))
+
+
+class TestServer(unittest.TestCase):
+    def test_in_process(self):
+        server = make_server(port=0)
+        thread = threading.Thread(target=serve, args=(server, 0))
+        thread.start()
+        try:
+            connection = HTTPConnection(*server.server_address[:2])
+            for text, expected in (("one", 1), ("two", 2)):
+                connection.request("POST", "/", json.dumps(
+                    rpc("extract_number", [text])))
+                response = connection.getresponse()
+                self.assertEqual(response.status, 200)
+                self.assertEqual(json.loads(response.read())["result"],
+                                 expected)
+            connection.request("POST", "/", json.dumps(
+                rpc("normalize", ["x"], None)))
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, 204)
+            connection.request("GET", "/health")
+            health = json.loads(connection.getresponse().read())
+            self.assertEqual(health["pid"], os.getpid())
+            connection.close()
+        finally:
+            server.shutdown()
+            thread.join()
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs fork()")
+    def test_workers(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "lf.sock")
+            process = subprocess.Popen(
+                [sys.executable, "-m", "lingua_franca.server",
+                 "--langs", "en", "de", "--unix", path, "--workers", "2"],
+                stderr=subprocess.DEVNULL,
+                cwd=os.path.dirname(os.path.dirname(__file__)))
+            try:
+                client = UnixHTTPConnection(path)
+                pids = set()
+                deadline = time.monotonic() + 30
+                while len(pids) < 2 and time.monotonic() < deadline:
+                    try:
+                        client.request("GET", "/health")
+                        health = json.loads(client.getresponse().read())
+                    except OSError:
+                        time.sleep(0.1)
+                        continue
+                    finally:
+                        client.close()
+                    self.assertEqual(health["langs"], ["en", "de"])
+                    pids.add(health["pid"])
+                self.assertEqual(len(pids), 2)
+                self.assertNotIn(process.pid, pids)
+
+                client.request("POST", "/", json.dumps(
+                    rpc("extract_number", {"text": "vier", "lang": "de"})))
+                self.assertEqual(json.loads(
+                    client.getresponse().read())["result"], 4)
+                client.close()
+            finally:
+                process.terminate()
+                process.wait(10)
+            self.assertFalse(os.path.exists(path))
+
+
+class UnixHTTPConnection(HTTPConnection):
+    def __init__(self, path):
+        super().__init__("localhost")
+        self.path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(self.path)
+
+
+if __name__ == "__main__":
+    unittest.main()